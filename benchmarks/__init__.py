@@ -0,0 +1,6 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# Benchmarks in the format of airspeed velocity (asv)
+#
+# License: BSD 3 clause
@@ -0,0 +1,85 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# Runs the benchmarks without asv: python -m benchmarks [pattern]
+#
+# License: BSD 3 clause
+
+import argparse
+import importlib
+import inspect
+import itertools
+import pkgutil
+import re
+import time
+import tracemalloc
+
+import benchmarks
+
+
+def iter_benchmarks(pattern):
+    """Yields (name, class, method name, params) of all benchmarks"""
+    for module in pkgutil.iter_modules(benchmarks.__path__):
+        if not module.name.startswith("bench_"):
+            continue
+        module = importlib.import_module("benchmarks." + module.name)
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            params = getattr(cls, "params", ())
+            if params and not isinstance(params[0], list):
+                params = (params,)
+            for method in sorted(vars(cls)):
+                if not method.startswith(("time_", "peakmem_")):
+                    continue
+                for values in itertools.product(*params):
+                    name = "%s.%s.%s(%s)" % (
+                        module.__name__.split(".")[-1],
+                        cls_name,
+                        method,
+                        ", ".join(map(str, values)),
+                    )
+                    if re.search(pattern, name):
+                        yield name, cls, method, values
+
+
+def run(cls, method, values, repeat):
+    """Returns the best time in seconds, or the peak traced memory in bytes"""
+    bench = cls()
+    if hasattr(bench, "setup"):
+        bench.setup(*values)
+    func = getattr(bench, method)
+    if method.startswith("peakmem_"):
+        tracemalloc.start()
+        func(*values)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*values)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs the mlxtend benchmarks")
+    parser.add_argument(
+        "pattern", nargs="?", default="", help="regular expression to select benchmarks"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    selected = list(iter_benchmarks(args.pattern))
+    width = max([len(name) for name, _, _, _ in selected], default=0)
+    for name, cls, method, values in selected:
+        result = run(cls, method, values, args.repeat)
+        if method.startswith("peakmem_"):
+            print("%-*s %10.1f MB" % (width, name, result / 2.0**20))
+        else:
+            print("%-*s %10.4f s" % (width, name, result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# Benchmarks of the feature selectors
+#
+# License: BSD 3 clause
+
+from sklearn.datasets import make_regression
+from sklearn.linear_model import LinearRegression
+
+from mlxtend.feature_selection import ExhaustiveFeatureSelector
+
+
+class ExhaustiveFeatureSelection:
+    # 2 ** 13 - 1 = 8191 subsets, so that a per-chunk cost that grows with
+    # the number of evaluated subsets dominates the run time
+    params = [1, 2]
+    param_names = ["n_jobs"]
+    timeout = 600
+
+    def setup(self, n_jobs):
+        self.X, self.y = make_regression(
+            n_samples=200, n_features=13, noise=1.0, random_state=0
+        )
+
+    def time_fit(self, n_jobs):
+        ExhaustiveFeatureSelector(
+            LinearRegression(),
+            min_features=1,
+            max_features=13,
+            scoring="r2",
+            cv=0,
+            n_jobs=n_jobs,
+            print_progress=False,
+        ).fit(self.X, self.y)
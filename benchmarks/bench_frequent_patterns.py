@@ -0,0 +1,84 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# Benchmarks of the frequent pattern miners and association rules
+#
+# License: BSD 3 clause
+
+from mlxtend.frequent_patterns import (
+    apriori,
+    association_rules,
+    eclat,
+    fpclose,
+    fpgrowth,
+    fpmax,
+)
+
+from .quest import make_transactions, to_frame
+
+# shapes of the synthetic datasets, see `make_transactions`
+DATASETS = {
+    "short": dict(
+        n_transactions=10000, avg_transaction_len=5, avg_pattern_len=2, n_items=200
+    ),
+    "long": dict(
+        n_transactions=5000, avg_transaction_len=20, avg_pattern_len=6, n_items=500
+    ),
+}
+
+ALGORITHMS = {
+    "apriori": lambda df, min_support: apriori(df, min_support),
+    "apriori_low_memory": lambda df, min_support: apriori(
+        df, min_support, low_memory=True
+    ),
+    "apriori_bitset": lambda df, min_support: apriori(df, min_support, engine="bitset"),
+    "eclat": lambda df, min_support: eclat(df, min_support),
+    "fpgrowth": lambda df, min_support: fpgrowth(df, min_support),
+    "fpmax": lambda df, min_support: fpmax(df, min_support),
+    "fpclose": lambda df, min_support: fpclose(df, min_support),
+}
+
+_cache = {}
+
+
+def load(dataset, storage):
+    """Returns the one-hot DataFrame of a dataset, generating it once"""
+    if dataset not in _cache:
+        _cache[dataset] = make_transactions(**DATASETS[dataset])
+    return to_frame(_cache[dataset], sparse=storage == "sparse")
+
+
+class FrequentItemsets:
+    params = (
+        list(ALGORITHMS),
+        list(DATASETS),
+        ["dense", "sparse"],
+        [0.05, 0.02, 0.01],
+    )
+    param_names = ["algorithm", "dataset", "storage", "min_support"]
+    timeout = 300
+
+    def setup(self, algorithm, dataset, storage, min_support):
+        self.df = load(dataset, storage)
+
+    def time_mining(self, algorithm, dataset, storage, min_support):
+        ALGORITHMS[algorithm](self.df, min_support)
+
+    def peakmem_mining(self, algorithm, dataset, storage, min_support):
+        ALGORITHMS[algorithm](self.df, min_support)
+
+
+class AssociationRules:
+    params = (list(DATASETS), [0.02, 0.01], ["confidence", "lift"])
+    param_names = ["dataset", "min_support", "metric"]
+    timeout = 300
+
+    def setup(self, dataset, min_support, metric):
+        self.itemsets = fpgrowth(load(dataset, "dense"), min_support)
+        self.min_threshold = 0.5 if metric == "confidence" else 1.0
+
+    def time_rules(self, dataset, min_support, metric):
+        association_rules(self.itemsets, metric, self.min_threshold)
+
+    def peakmem_rules(self, dataset, min_support, metric):
+        association_rules(self.itemsets, metric, self.min_threshold)
@@ -0,0 +1,121 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# Synthetic market basket data in the style of the IBM Quest generator
+#
+# License: BSD 3 clause
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+
+def make_transactions(
+    n_transactions=10000,
+    avg_transaction_len=10,
+    avg_pattern_len=4,
+    n_patterns=200,
+    n_items=500,
+    correlation=0.5,
+    random_seed=0,
+):
+    """Generates transactions following Agrawal & Srikant (1994).
+
+    Transactions are built from a pool of "potentially frequent"
+    patterns. Consecutive patterns share a fraction of their items, the
+    patterns are picked with exponentially distributed weights, and
+    every item of a picked pattern is dropped with a pattern-specific
+    corruption probability, so that the data contains frequent itemsets
+    of various lengths as in real basket data.
+
+    Parameters
+    -----------
+    n_transactions : int (default: 10000)
+      Number of transactions (|D|).
+
+    avg_transaction_len : float (default: 10)
+      Mean of the Poisson distributed transaction lengths (|T|).
+
+    avg_pattern_len : float (default: 4)
+      Mean of the Poisson distributed pattern lengths (|I|).
+
+    n_patterns : int (default: 200)
+      Number of patterns (|L|).
+
+    n_items : int (default: 500)
+      Number of items (N).
+
+    correlation : float (default: 0.5)
+      Mean fraction of the items of a pattern that are
+      taken from the previous pattern.
+
+    random_seed : int (default: 0)
+
+    Returns
+    -----------
+    csr_matrix of bools, shape = (n_transactions, n_items)
+      Row `i` holds the items of transaction `i`.
+    """
+    rng = np.random.RandomState(random_seed)
+
+    patterns = []
+    previous = np.zeros(0, dtype=int)
+    for _ in range(n_patterns):
+        size = min(max(rng.poisson(avg_pattern_len), 1), n_items)
+        n_shared = min(int(round(size * rng.exponential(correlation))), size)
+        n_shared = min(n_shared, len(previous))
+        shared = rng.choice(previous, n_shared, replace=False)
+        others = np.setdiff1d(np.arange(n_items), shared)
+        fresh = rng.choice(others, size - n_shared, replace=False)
+        previous = np.concatenate([shared, fresh])
+        patterns.append(previous)
+    weights = np.cumsum(rng.exponential(1.0, n_patterns))
+    weights /= weights[-1]
+    corruption = np.clip(rng.normal(0.5, 0.1, n_patterns), 0.0, 1.0)
+
+    rows, cols = [], []
+    deferred = None
+    for i in range(n_transactions):
+        size = max(rng.poisson(avg_transaction_len), 1)
+        transaction = set()
+        while len(transaction) < size:
+            if deferred is not None:
+                p, deferred = deferred, None
+            else:
+                p = min(np.searchsorted(weights, rng.rand()), n_patterns - 1)
+            keep = rng.rand(len(patterns[p])) >= corruption[p]
+            items = patterns[p][keep]
+            if transaction and len(transaction) + len(items) > size:
+                # the pattern does not fit: add it anyway in half of the
+                # cases, and move it to the next transaction otherwise
+                if rng.rand() < 0.5:
+                    transaction.update(items.tolist())
+                else:
+                    deferred = p
+                break
+            transaction.update(items.tolist())
+        rows.extend([i] * len(transaction))
+        cols.extend(sorted(transaction))
+
+    data = np.ones(len(rows), dtype=bool)
+    return csr_matrix((data, (rows, cols)), shape=(n_transactions, n_items))
+
+
+def to_frame(X, sparse=False):
+    """Converts the transactions into a one-hot DataFrame.
+
+    Parameters
+    -----------
+    X : csr_matrix, shape = (n_transactions, n_items)
+
+    sparse : bool (default: False)
+      If `True`, returns a DataFrame with sparse columns.
+
+    Returns
+    -----------
+    pandas DataFrame of bools with one column per item
+    """
+    columns = ["item_%d" % i for i in range(X.shape[1])]
+    if sparse:
+        return pd.DataFrame.sparse.from_spmatrix(X.astype(bool), columns=columns)
+    return pd.DataFrame(X.toarray(), columns=columns)
@@ -0,0 +1,160 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# Checkpoints of the search state of the feature selectors
+#
+# License: BSD 3 clause
+
+import os
+import pickle
+import types
+
+import joblib
+from sklearn.base import clone
+
+# parameters that do not change the evaluated subsets or their scores
+_IGNORED_PARAMS = (
+    "cache_size",
+    "checkpoint_path",
+    "chunksize",
+    "memory",
+    "n_jobs",
+    "pre_dispatch",
+    "print_progress",
+    "resume",
+    "verbose",
+)
+
+
+def checkpoint_key(selector, X, y, groups=None, fit_params=None):
+    """
+    Hashes the data and the parameters of a feature selector.
+
+    Parameters
+    ----------
+    selector : SequentialFeatureSelector or ExhaustiveFeatureSelector
+    X : array-like or sparse matrix
+    y : array-like
+    groups : array-like or None
+    fit_params : dict or None
+
+    Returns
+    -------
+    str
+        Hash that only changes if the subsets evaluated by `fit` or
+        their scores may change.
+    """
+    params = {
+        name: value
+        for name, value in selector.get_params(deep=False).items()
+        if name not in _IGNORED_PARAMS
+    }
+    # the estimator may be fit in place if it is not cloned
+    estimator = params["estimator"]
+    if selector.clone_estimator:
+        params["estimator"] = clone(estimator)
+    else:
+        params["estimator"] = type(estimator)
+    # local functions and lambdas cannot be pickled for hashing
+    if isinstance(params.get("scoring"), types.FunctionType):
+        scoring = params["scoring"]
+        params["scoring"] = (scoring.__module__, scoring.__qualname__)
+    return joblib.hash([type(selector), params, X, y, groups, fit_params])
+
+
+def save_checkpoint(path, key, state):
+    """
+    Writes the search state to `path`.
+
+    The state is first written to a temporary file that then replaces
+    `path`, so that an interrupted write does not corrupt the checkpoint.
+
+    Parameters
+    ----------
+    path : str
+    key : str
+        Hash of the data and parameters, see `checkpoint_key`.
+    state : dict
+    """
+    tmp_path = "%s.tmp" % path
+    joblib.dump({"key": key, "state": state}, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path, key):
+    """
+    Reads the search state from `path`.
+
+    Parameters
+    ----------
+    path : str
+    key : str
+        Hash of the data and parameters, see `checkpoint_key`.
+
+    Returns
+    -------
+    dict or None
+        The state, or `None` if `path` does not exist.
+    """
+    if not os.path.exists(path):
+        return None
+    checkpoint = joblib.load(path)
+    if checkpoint["key"] != key:
+        raise ValueError(
+            "The checkpoint %s was written for different data or "
+            "parameters. Remove it, or set `resume=False` to overwrite it." % path
+        )
+    return checkpoint["state"]
+
+
+def append_subsets(path, subsets, offset):
+    """
+    Appends a dict of evaluated feature subsets to the file `path`.
+
+    Unlike rewriting all subsets with `save_checkpoint`, the cost of a
+    checkpoint then does not grow with the number of evaluated subsets.
+
+    Parameters
+    ----------
+    path : str
+    subsets : dict
+    offset : int
+        Size of the file after the last checkpoint. Anything after it,
+        e.g., a chunk whose checkpoint was not completed, is discarded.
+
+    Returns
+    -------
+    int
+        Size of the file after appending `subsets`.
+    """
+    mode = "r+b" if offset > 0 and os.path.exists(path) else "wb"
+    with open(path, mode) as f:
+        f.seek(offset)
+        f.truncate()
+        pickle.dump(subsets, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+        return f.tell()
+
+
+def load_subsets(path, offset):
+    """
+    Reads the feature subsets appended to `path` via `append_subsets`.
+
+    Parameters
+    ----------
+    path : str
+    offset : int
+        Size of the file after the last checkpoint.
+
+    Returns
+    -------
+    dict
+    """
+    subsets = {}
+    if offset == 0:
+        return subsets
+    with open(path, "rb") as f:
+        while f.tell() < offset:
+            subsets.update(pickle.load(f))
+    return subsets
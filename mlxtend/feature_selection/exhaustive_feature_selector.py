@@ -7,11 +7,14 @@
 # License: BSD 3 clause
 
 
+import datetime
+import heapq
 import operator as op
 import sys
+import time
 from copy import deepcopy
 from functools import reduce
-from itertools import chain, combinations
+from itertools import chain, combinations, islice
 
 import numpy as np
 import scipy as sp
@@ -22,24 +25,36 @@ from sklearn.metrics import get_scorer
 from sklearn.model_selection import cross_val_score
 
 from ..externals.name_estimators import _name_estimators
-
-
-def _calc_score(selector, X, y, indices, groups=None, **fit_params):
-    if selector.cv:
+from .checkpoint import (
+    append_subsets,
+    checkpoint_key,
+    load_checkpoint,
+    load_subsets,
+    save_checkpoint,
+)
+
+
+def _calc_score(
+    estimator, X, y, indices, cv, scorer, pre_dispatch, groups=None, fit_params=None
+):
+    # only the arguments needed for scoring are sent to the workers, not
+    # the selector, whose `subsets_` grows with every evaluated chunk
+    fit_params = fit_params or {}
+    if cv:
         scores = cross_val_score(
-            selector.est_,
+            estimator,
             X[:, indices],
             y,
             groups=groups,
-            cv=selector.cv,
-            scoring=selector.scorer,
+            cv=cv,
+            scoring=scorer,
             n_jobs=1,
-            pre_dispatch=selector.pre_dispatch,
+            pre_dispatch=pre_dispatch,
             fit_params=fit_params,
         )
     else:
-        selector.est_.fit(X[:, indices], y, **fit_params)
-        scores = np.array([selector.scorer(selector.est_, X[:, indices], y)])
+        estimator.fit(X[:, indices], y, **fit_params)
+        scores = np.array([scorer(estimator, X[:, indices], y)])
     return indices, scores
 
 
@@ -68,8 +83,24 @@ def _get_featurenames(subsets_dict, feature_idx, custom_feature_names, X):
     return subsets_dict_, feature_names
 
 
-class ExhaustiveFeatureSelector(BaseEstimator, MetaEstimatorMixin):
+def _update_summary(summary, k, score):
+    # running count, mean, sum of squared deviations (Welford), min and
+    # max of the average scores of the subsets with k features
+    if np.isnan(score):
+        return
+    n, mean, m2, min_score, max_score = summary.get(k, (0, 0.0, 0.0, score, score))
+    n += 1
+    delta = score - mean
+    mean += delta / n
+    m2 += delta * (score - mean)
+    summary[k] = (n, mean, m2, min(min_score, score), max(max_score, score))
+
+
+def _format_seconds(seconds):
+    return str(datetime.timedelta(seconds=int(round(seconds))))
+
 
+class ExhaustiveFeatureSelector(BaseEstimator, MetaEstimatorMixin):
     """Exhaustive Feature Selection for Classification and Regression.
        (new in v0.4.3)
 
@@ -82,7 +113,8 @@ class ExhaustiveFeatureSelector(BaseEstimator, MetaEstimatorMixin):
         Maximum number of features to select
     print_progress : bool (default: True)
         Prints progress as the number of epochs
-        to stderr.
+        to stderr, together with the elapsed time and
+        the estimated remaining time.
     scoring : str, (default='accuracy')
         Scoring metric in {accuracy, f1, precision, recall, roc_auc}
         for classifiers,
@@ -116,6 +148,35 @@ class ExhaustiveFeatureSelector(BaseEstimator, MetaEstimatorMixin):
         if False. Set to False if the estimator doesn't
         implement scikit-learn's set_params and get_params methods.
         In addition, it is required to set cv=0, and n_jobs=1.
+    chunksize : int (default: 1000)
+        Number of feature subsets that are dispatched to the `n_jobs`
+        processes at once. The results of a chunk are stored (and
+        checkpointed) after all of its subsets have been evaluated.
+        New in v 0.20.0.
+    checkpoint_path : str or None (default: None)
+        If not `None`, the number of evaluated feature subsets is written
+        to this file (via `joblib`) after every chunk and if `fit` is
+        interrupted, so that the search can be continued with
+        `resume=True` after a crash or interruption. If `top_k` is `None`,
+        the subsets of each chunk are appended to the file
+        `checkpoint_path + '.subsets'`, otherwise the `top_k` best
+        subsets are written to `checkpoint_path`. Since resuming reads
+        all appended subsets into memory, combine `checkpoint_path` with
+        `top_k` for searches over millions of subsets.
+        New in v 0.20.0.
+    resume : bool (default: False)
+        If True and the file `checkpoint_path` exists, `fit` continues
+        the search from this checkpoint and skips the feature subsets
+        that were already evaluated. A ValueError is raised if the
+        checkpoint was written for other data or parameters (except for
+        `n_jobs`, `pre_dispatch`, `print_progress` and `chunksize`).
+        New in v 0.20.0.
+    top_k : int or None (default: None)
+        If not `None`, only the `top_k` feature subsets with the highest
+        average scores are kept in `subsets_` (in a min-heap that is
+        updated after every evaluated subset), so that the memory does
+        not grow with the number of evaluated subsets. The best subset
+        is the same as for `top_k=None`. New in v 0.20.0.
 
     Attributes
     ----------
@@ -143,6 +204,15 @@ class ExhaustiveFeatureSelector(BaseEstimator, MetaEstimatorMixin):
         correspond to the column names. Otherwise, the
         feature names are string representation of the feature
         array indices. The 'feature_names' is new in v 0.13.0.
+        If `top_k` is not `None`, only the `top_k` best subsets
+        are included.
+    score_summary_ : dict
+        A dictionary of summary statistics of the average scores of all
+        evaluated feature subsets, where the dictionary keys are the
+        lengths k of the feature subsets. The dictionary values are
+        dictionaries with the keys 'n_subsets' (number of subsets with a
+        non-NaN average score), 'mean', 'std', 'min' and 'max'.
+        New in v 0.20.0.
 
     Examples
     -----------
@@ -162,6 +232,10 @@ class ExhaustiveFeatureSelector(BaseEstimator, MetaEstimatorMixin):
         n_jobs=1,
         pre_dispatch="2*n_jobs",
         clone_estimator=True,
+        chunksize=1000,
+        checkpoint_path=None,
+        resume=False,
+        top_k=None,
     ):
         self.estimator = estimator
         self.min_features = min_features
@@ -180,6 +254,10 @@ class ExhaustiveFeatureSelector(BaseEstimator, MetaEstimatorMixin):
             self.est_ = clone(self.estimator)
         else:
             self.est_ = self.estimator
+        self.chunksize = chunksize
+        self.checkpoint_path = checkpoint_path
+        self.resume = resume
+        self.top_k = top_k
         self.fitted = False
         self.interrupted_ = False
 
@@ -221,6 +299,7 @@ class ExhaustiveFeatureSelector(BaseEstimator, MetaEstimatorMixin):
         self.best_idx_ = None
         self.best_feature_names_ = None
         self.best_score_ = None
+        self.score_summary_ = {}
 
         if hasattr(X, "loc"):
             X_ = X.values
@@ -253,6 +332,19 @@ class ExhaustiveFeatureSelector(BaseEstimator, MetaEstimatorMixin):
         if self.max_features < self.min_features:
             raise AttributeError("min_features must be <= max_features")
 
+        if not isinstance(self.chunksize, int) or self.chunksize < 1:
+            raise ValueError(
+                "`chunksize` must be a positive integer. Got %s." % (self.chunksize,)
+            )
+        if self.resume and self.checkpoint_path is None:
+            raise ValueError("`resume=True` requires a `checkpoint_path`.")
+        if self.top_k is not None and (
+            not isinstance(self.top_k, int) or self.top_k < 1
+        ):
+            raise ValueError(
+                "`top_k` must be a positive integer or None. Got %s." % (self.top_k,)
+            )
+
         candidates = chain.from_iterable(
             combinations(range(X_.shape[1]), r=i)
             for i in range(self.min_features, self.max_features + 1)
@@ -288,37 +380,153 @@ class ExhaustiveFeatureSelector(BaseEstimator, MetaEstimatorMixin):
             ]
         )
 
-        n_jobs = min(self.n_jobs, all_comb)
-        parallel = Parallel(n_jobs=n_jobs, pre_dispatch=self.pre_dispatch)
-        work = enumerate(
-            parallel(
-                delayed(_calc_score)(self, X_, y, c, groups=groups, **fit_params)
-                for c in candidates
-            )
-        )
+        # the candidates are generated in a fixed order, so that the
+        # state of the search is the number of evaluated candidates
+        iteration = 0
+        summary = {}
+        if self.checkpoint_path is not None:
+            key = checkpoint_key(self, X_, y, groups, fit_params)
+            subsets_path = "%s.subsets" % self.checkpoint_path
+            # size of `subsets_path` and number of evaluated subsets
+            # at the last checkpoint
+            saved = {"offset": 0, "n_evaluated": 0}
+            state = None
+            if self.resume:
+                state = load_checkpoint(self.checkpoint_path, key)
+            if state is not None:
+                if self.top_k is None:
+                    self.subsets_ = load_subsets(subsets_path, state["offset"])
+                else:
+                    self.subsets_ = state["subsets_"]
+                iteration = state["n_evaluated"]
+                summary = state["summary"]
+                saved = {"offset": state["offset"], "n_evaluated": iteration}
+                candidates = islice(candidates, iteration, None)
+
+            def checkpoint():
+                top_subsets = self.subsets_
+                if self.top_k is None:
+                    # only append the subsets of the last chunk
+                    new_subsets = {
+                        i: self.subsets_[i]
+                        for i in range(saved["n_evaluated"], iteration)
+                    }
+                    saved["offset"] = append_subsets(
+                        subsets_path, new_subsets, saved["offset"]
+                    )
+                    top_subsets = None
+                saved["n_evaluated"] = iteration
+                save_checkpoint(
+                    self.checkpoint_path,
+                    key,
+                    {
+                        "subsets_": top_subsets,
+                        "offset": saved["offset"],
+                        "n_evaluated": iteration,
+                        "summary": summary,
+                    },
+                )
+
+        # min-heap of the kept subsets, ordered by score and, for equal
+        # scores, in reverse order of evaluation as the first best is kept
+        def rank(score):
+            return -np.inf if np.isnan(score) else score
+
+        heap = []
+        if self.top_k is not None:
+            heap = [(rank(v["avg_score"]), -i, i) for i, v in self.subsets_.items()]
+            heapq.heapify(heap)
+
+        start_time = time.time()
+        start_iteration = iteration
 
+        n_jobs = min(self.n_jobs, all_comb)
         try:
-            for iteration, (c, cv_scores) in work:
-
-                self.subsets_[iteration] = {
-                    "feature_idx": c,
-                    "cv_scores": cv_scores,
-                    "avg_score": np.mean(cv_scores),
-                }
-
-                if self.print_progress:
-                    sys.stderr.write("\rFeatures: %d/%d" % (iteration + 1, all_comb))
-                    sys.stderr.flush()
-
-                if self._TESTING_INTERRUPT_MODE:
-                    self.subsets_, self.best_feature_names_ = _get_featurenames(
-                        self.subsets_, self.best_idx_, custom_feature_names, X
+            with Parallel(n_jobs=n_jobs, pre_dispatch=self.pre_dispatch) as parallel:
+                while True:
+                    chunk = list(islice(candidates, self.chunksize))
+                    if not chunk:
+                        break
+                    work = parallel(
+                        delayed(_calc_score)(
+                            self.est_,
+                            X_,
+                            y,
+                            c,
+                            self.cv,
+                            self.scorer,
+                            self.pre_dispatch,
+                            groups=groups,
+                            fit_params=fit_params,
+                        )
+                        for c in chunk
                     )
-                    raise KeyboardInterrupt
+
+                    for c, cv_scores in work:
+
+                        avg_score = np.mean(cv_scores)
+                        _update_summary(summary, len(c), avg_score)
+                        item = (rank(avg_score), -iteration, iteration)
+                        keep = True
+                        if self.top_k is not None:
+                            if len(heap) < self.top_k:
+                                heapq.heappush(heap, item)
+                            elif item > heap[0]:
+                                worst = heapq.heapreplace(heap, item)[2]
+                                del self.subsets_[worst]
+                            else:
+                                keep = False
+                        if keep:
+                            self.subsets_[iteration] = {
+                                "feature_idx": c,
+                                "cv_scores": cv_scores,
+                                "avg_score": avg_score,
+                            }
+                        iteration += 1
+
+                        if self.print_progress:
+                            elapsed = time.time() - start_time
+                            remaining = (
+                                elapsed
+                                / (iteration - start_iteration)
+                                * (all_comb - iteration)
+                            )
+                            sys.stderr.write(
+                                "\rFeatures: %d/%d -- elapsed: %s -- ETA: %s"
+                                % (
+                                    iteration,
+                                    all_comb,
+                                    _format_seconds(elapsed),
+                                    _format_seconds(remaining),
+                                )
+                            )
+                            sys.stderr.flush()
+
+                        if self._TESTING_INTERRUPT_MODE:
+                            self.subsets_, self.best_feature_names_ = _get_featurenames(
+                                self.subsets_, self.best_idx_, custom_feature_names, X
+                            )
+                            raise KeyboardInterrupt
+
+                    if self.checkpoint_path is not None:
+                        checkpoint()
 
         except KeyboardInterrupt:
             self.interrupted_ = True
             sys.stderr.write("\nSTOPPING EARLY DUE TO KEYBOARD INTERRUPT...")
+            if self.checkpoint_path is not None:
+                checkpoint()
+
+        self.score_summary_ = {
+            k: {
+                "n_subsets": n,
+                "mean": mean,
+                "std": np.sqrt(m2 / n),
+                "min": min_score,
+                "max": max_score,
+            }
+            for k, (n, mean, m2, min_score, max_score) in sorted(summary.items())
+        }
 
         max_score = float("-inf")
         for c in self.subsets_:
@@ -9,9 +9,11 @@
 import datetime
 import sys
 import types
+from collections import OrderedDict
 from copy import deepcopy
 from itertools import combinations
 
+import joblib
 import numpy as np
 import scipy as sp
 import scipy.stats
@@ -19,28 +21,35 @@ from joblib import Parallel, delayed
 from sklearn.base import MetaEstimatorMixin, clone
 from sklearn.metrics import get_scorer
 from sklearn.model_selection import cross_val_score
+from sklearn.utils.validation import check_memory
 
 from ..externals.name_estimators import _name_estimators
 from ..utils.base_compostion import _BaseXComposition
+from .checkpoint import checkpoint_key, load_checkpoint, save_checkpoint
 
 
-def _calc_score(selector, X, y, indices, groups=None, **fit_params):
-    if selector.cv:
+def _calc_score(
+    estimator, X, y, cv, scorer, pre_dispatch, groups=None, fit_params=None, key=None
+):
+    # `key` identifies `estimator` for joblib.Memory, which does not hash
+    # the estimator itself since it is refit in place if cv is falsy
+    fit_params = fit_params or {}
+    if cv:
         scores = cross_val_score(
-            selector.est_,
+            estimator,
             X,
             y,
             groups=groups,
-            cv=selector.cv,
-            scoring=selector.scorer,
+            cv=cv,
+            scoring=scorer,
             n_jobs=1,
-            pre_dispatch=selector.pre_dispatch,
+            pre_dispatch=pre_dispatch,
             fit_params=fit_params,
         )
     else:
-        selector.est_.fit(X, y, **fit_params)
-        scores = np.array([selector.scorer(selector.est_, X, y)])
-    return indices, scores
+        estimator.fit(X, y, **fit_params)
+        scores = np.array([scorer(estimator, X, y)])
+    return scores
 
 
 def _get_featurenames(subsets_dict, feature_idx, custom_feature_names, X):
@@ -69,7 +78,6 @@ def _get_featurenames(subsets_dict, feature_idx, custom_feature_names, X):
 
 
 class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
-
     """Sequential Feature Selection for Classification and Regression.
 
     Parameters
@@ -143,6 +151,31 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
         features to be selected is greater than `len(fixed_features)`.
         In other words, ensure that `k_features > len(fixed_features)`.
         New in mlxtend v. 0.18.0.
+    cache_size : int or None (default: None)
+        Maximum number of feature subsets whose cross-validation scores
+        are kept in memory during `fit`, so that subsets that are
+        evaluated again (as happens frequently if `floating=True`) are
+        not refit. The least recently used subsets are evicted first.
+        If `None`, the scores of all subsets are kept, if 0, no scores
+        are kept. New in v 0.20.0.
+    memory : None, str or joblib.Memory (default: None)
+        If not `None`, the cross-validation scores are also cached on
+        disk via `joblib.Memory` (a str is used as the cache directory),
+        keyed by the estimator, the data, the cv splits and the scorer,
+        so that they are reused across `fit` calls and processes.
+        New in v 0.20.0.
+    checkpoint_path : str or None (default: None)
+        If not `None`, `subsets_`, the current feature subset and the
+        in-memory score cache are written to this file (via `joblib`)
+        after every step of the search, so that the search can be
+        continued with `resume=True` after a crash or interruption.
+        New in v 0.20.0.
+    resume : bool (default: False)
+        If True and the file `checkpoint_path` exists, `fit` continues
+        the search from this checkpoint instead of starting over. A
+        ValueError is raised if the checkpoint was written for other
+        data or parameters (except for `n_jobs`, `pre_dispatch`,
+        `verbose`, `cache_size` and `memory`). New in v 0.20.0.
 
     Attributes
     ----------
@@ -170,6 +203,13 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
         correspond to the column names. Otherwise, the
         feature names are string representation of the feature
         array indices. The 'feature_names' is new in v 0.13.0.
+    cache_hits_ : int
+        Number of feature subsets whose scores were taken from the
+        in-memory cache during `fit`. New in v 0.20.0.
+    cache_misses_ : int
+        Number of feature subsets that were not in the in-memory cache
+        and hence were scored (or loaded from `memory`) during `fit`.
+        New in v 0.20.0.
 
     Examples
     -----------
@@ -191,6 +231,10 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
         pre_dispatch="2*n_jobs",
         clone_estimator=True,
         fixed_features=None,
+        cache_size=None,
+        memory=None,
+        checkpoint_path=None,
+        resume=False,
     ):
 
         self.estimator = estimator
@@ -239,6 +283,10 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
                 )
 
         self.fixed_features = fixed_features
+        self.cache_size = cache_size
+        self.memory = memory
+        self.checkpoint_path = checkpoint_path
+        self.resume = resume
 
         if self.clone_estimator:
             self.est_ = clone(self.estimator)
@@ -329,6 +377,30 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
         self.k_feature_idx_ = None
         self.k_feature_names_ = None
         self.k_score_ = None
+        self.cache_hits_ = 0
+        self.cache_misses_ = 0
+
+        if self.cache_size is not None and (
+            not isinstance(self.cache_size, int) or self.cache_size < 0
+        ):
+            raise ValueError(
+                "`cache_size` must be a non-negative integer or None. "
+                "Got %s." % (self.cache_size,)
+            )
+        if self.resume and self.checkpoint_path is None:
+            raise ValueError("`resume=True` requires a `checkpoint_path`.")
+        self._score_cache = OrderedDict()
+        memory = check_memory(self.memory)
+        if memory.location is None:
+            self._score_func = _calc_score
+            self._estimator_key = None
+        else:
+            self._score_func = memory.cache(
+                _calc_score, ignore=["estimator", "pre_dispatch"]
+            )
+            self._estimator_key = joblib.hash(
+                clone(self.estimator) if self.clone_estimator else self.estimator
+            )
 
         self.fixed_features_ = self.fixed_features
         self.fixed_features_set_ = set()
@@ -424,29 +496,24 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
         if self.forward:
             if select_in_range:
                 k_to_select = max_k
-
+            k_idx = ()
             if self.fixed_features is not None:
                 k_idx = self.fixed_features_
-                k = len(k_idx)
-                k_idx, k_score = _calc_score(
-                    self, X_[:, k_idx], y, k_idx, groups=groups, **fit_params
-                )
-                self.subsets_[k] = {
-                    "feature_idx": k_idx,
-                    "cv_scores": k_score,
-                    "avg_score": np.nanmean(k_score),
-                }
-
-            else:
-                k_idx = ()
-                k = 0
         else:
             if select_in_range:
                 k_to_select = min_k
             k_idx = tuple(orig_set)
-            k = len(k_idx)
-            k_idx, k_score = _calc_score(
-                self, X_[:, k_idx], y, k_idx, groups=groups, **fit_params
+        k = len(k_idx)
+
+        state = None
+        if self.checkpoint_path is not None:
+            key = checkpoint_key(self, X_, y, groups, fit_params)
+            if self.resume:
+                state = load_checkpoint(self.checkpoint_path, key)
+
+        if state is None and k > 0:
+            (k_score,) = self._score_subsets(
+                X_, y, [k_idx], groups=groups, **fit_params
             )
             self.subsets_[k] = {
                 "feature_idx": k_idx,
@@ -456,6 +523,14 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
         best_subset = None
         k_score = 0
 
+        if state is not None:
+            self.subsets_ = state["subsets_"]
+            k_idx, k_score = state["k_idx"], state["k_score"]
+            k = len(k_idx)
+            self._score_cache = state["score_cache"]
+            self.cache_hits_ = state["cache_hits_"]
+            self.cache_misses_ = state["cache_misses_"]
+
         try:
             while k != k_to_select:
                 prev_subset = set(k_idx)
@@ -574,6 +649,20 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
                         )
                     )
 
+                if self.checkpoint_path is not None:
+                    save_checkpoint(
+                        self.checkpoint_path,
+                        key,
+                        {
+                            "subsets_": self.subsets_,
+                            "k_idx": k_idx,
+                            "k_score": k_score,
+                            "score_cache": self._score_cache,
+                            "cache_hits_": self.cache_hits_,
+                            "cache_misses_": self.cache_misses_,
+                        },
+                    )
+
                 if self._TESTING_INTERRUPT_MODE:
                     self.subsets_, self.k_feature_names_ = _get_featurenames(
                         self.subsets_, self.k_feature_idx_, custom_feature_names, X
@@ -617,6 +706,9 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
         self.subsets_, self.k_feature_names_ = _get_featurenames(
             self.subsets_, self.k_feature_idx_, custom_feature_names, X
         )
+        # the scores are only needed while fitting, and are
+        # kept in the checkpoint if `checkpoint_path` is set
+        del self._score_cache, self._score_func, self._estimator_key
         return self
 
     def _inclusion(
@@ -628,25 +720,14 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
         res = (None, None, None)
         remaining = orig_set - subset
         if remaining:
-            features = len(remaining)
-            n_jobs = min(self.n_jobs, features)
-            parallel = Parallel(
-                n_jobs=n_jobs, verbose=self.verbose, pre_dispatch=self.pre_dispatch
-            )
-            work = parallel(
-                delayed(_calc_score)(
-                    self,
-                    X[:, tuple(subset | {feature})],
-                    y,
-                    tuple(subset | {feature}),
-                    groups=groups,
-                    **fit_params
-                )
+            new_subsets = [
+                tuple(subset | {feature})
                 for feature in remaining
                 if feature != ignore_feature
-            )
+            ]
+            work = self._score_subsets(X, y, new_subsets, groups=groups, **fit_params)
 
-            for new_subset, cv_scores in work:
+            for new_subset, cv_scores in zip(new_subsets, work):
                 all_avg_scores.append(np.nanmean(cv_scores))
                 all_cv_scores.append(cv_scores)
                 all_subsets.append(new_subset)
@@ -664,18 +745,14 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
             all_avg_scores = []
             all_cv_scores = []
             all_subsets = []
-            features = n
-            n_jobs = min(self.n_jobs, features)
-            parallel = Parallel(
-                n_jobs=n_jobs, verbose=self.verbose, pre_dispatch=self.pre_dispatch
-            )
-            work = parallel(
-                delayed(_calc_score)(self, X[:, p], y, p, groups=groups, **fit_params)
+            new_subsets = [
+                p
                 for p in combinations(feature_set, r=n - 1)
                 if not fixed_feature or fixed_feature.issubset(set(p))
-            )
+            ]
+            work = self._score_subsets(X, y, new_subsets, groups=groups, **fit_params)
 
-            for p, cv_scores in work:
+            for p, cv_scores in zip(new_subsets, work):
 
                 all_avg_scores.append(np.nanmean(cv_scores))
                 all_cv_scores.append(cv_scores)
@@ -685,6 +762,53 @@ class SequentialFeatureSelector(_BaseXComposition, MetaEstimatorMixin):
             res = (all_subsets[best], all_avg_scores[best], all_cv_scores[best])
         return res
 
+    def _score_subsets(self, X, y, subsets, groups=None, **fit_params):
+        # Returns the cv scores of the feature subsets in the order of
+        # `subsets`. Only the subsets that are not in the LRU cache,
+        # keyed by their sorted feature indices, are scored (in parallel)
+        scores = [None] * len(subsets)
+        missing = []
+        for i, subset in enumerate(subsets):
+            key = tuple(sorted(subset))
+            if key in self._score_cache:
+                self._score_cache.move_to_end(key)
+                scores[i] = self._score_cache[key]
+                self.cache_hits_ += 1
+            else:
+                missing.append(i)
+        if not missing:
+            return scores
+
+        n_jobs = min(self.n_jobs, len(missing))
+        parallel = Parallel(
+            n_jobs=n_jobs, verbose=self.verbose, pre_dispatch=self.pre_dispatch
+        )
+        work = parallel(
+            delayed(self._score_func)(
+                self.est_,
+                X[:, subsets[i]],
+                y,
+                self.cv,
+                self.scorer,
+                self.pre_dispatch,
+                groups=groups,
+                fit_params=fit_params,
+                key=self._estimator_key,
+            )
+            for i in missing
+        )
+        for i, cv_scores in zip(missing, work):
+            scores[i] = cv_scores
+            self.cache_misses_ += 1
+            if self.cache_size != 0:
+                self._score_cache[tuple(sorted(subsets[i]))] = cv_scores
+                if (
+                    self.cache_size is not None
+                    and len(self._score_cache) > self.cache_size
+                ):
+                    self._score_cache.popitem(last=False)
+        return scores
+
     def transform(self, X):
         """Reduce X to its most important features.
 
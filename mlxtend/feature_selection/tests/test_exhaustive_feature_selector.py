@@ -4,6 +4,7 @@
 #
 # License: BSD 3 clause
 
+import joblib
 import numpy as np
 import pandas as pd
 from numpy.testing import assert_almost_equal
@@ -17,6 +18,7 @@ from sklearn.neighbors import KNeighborsClassifier
 
 from mlxtend.classifier import SoftmaxRegression
 from mlxtend.feature_selection import ExhaustiveFeatureSelector as EFS
+from mlxtend.feature_selection.checkpoint import load_subsets
 from mlxtend.utils import assert_raises
 
 
@@ -583,3 +585,181 @@ def test_check_pandas_dataframe_transform():
     efs1 = efs1.fit(df, y)
     assert efs1.best_idx_ == (2, 3)
     assert (150, 2) == efs1.transform(df).shape
+
+
+def test_checkpoint_resume(tmpdir):
+    iris = load_iris()
+    X = iris.data
+    y = iris.target
+    knn = KNeighborsClassifier(n_neighbors=4)
+    path = str(tmpdir.join("efs.pkl"))
+
+    def counting_scorer(est, X, y):
+        n_scored.append(1)
+        return est.score(X, y)
+
+    n_scored = []
+    efs1 = EFS(knn, min_features=1, max_features=3, scoring=counting_scorer, cv=0)
+    efs1 = efs1.fit(X, y)
+    assert len(n_scored) == 14
+
+    n_scored = []
+    efs2 = EFS(
+        knn,
+        min_features=1,
+        max_features=3,
+        scoring=counting_scorer,
+        cv=0,
+        chunksize=3,
+        checkpoint_path=path,
+    )
+    efs2._TESTING_INTERRUPT_MODE = True
+    efs2 = efs2.fit(X, y)
+    assert efs2.interrupted_ is True
+    assert len(n_scored) == 3
+
+    n_scored = []
+    efs3 = EFS(
+        knn,
+        min_features=1,
+        max_features=3,
+        scoring=counting_scorer,
+        cv=0,
+        chunksize=3,
+        checkpoint_path=path,
+        resume=True,
+    )
+    efs3 = efs3.fit(X, y)
+    assert efs3.interrupted_ is False
+    assert len(n_scored) == 13
+    assert efs3.best_idx_ == efs1.best_idx_
+    dict_compare_utility(d1=efs3.subsets_, d2=efs1.subsets_)
+
+
+def test_checkpoint_errors(tmpdir):
+    iris = load_iris()
+    X = iris.data
+    y = iris.target
+    knn = KNeighborsClassifier(n_neighbors=4)
+    path = str(tmpdir.join("efs.pkl"))
+
+    efs = EFS(knn, max_features=2, resume=True)
+    expect = "`resume=True` requires a `checkpoint_path`."
+    assert_raises(ValueError, expect, efs.fit, X, y)
+
+    efs = EFS(knn, max_features=2, chunksize=0)
+    expect = "`chunksize` must be a positive integer. Got 0."
+    assert_raises(ValueError, expect, efs.fit, X, y)
+
+    EFS(knn, max_features=2, checkpoint_path=path).fit(X, y)
+    efs = EFS(knn, max_features=3, checkpoint_path=path, resume=True)
+    expect = (
+        "The checkpoint %s was written for different data or parameters. "
+        "Remove it, or set `resume=False` to overwrite it." % path
+    )
+    assert_raises(ValueError, expect, efs.fit, X, y)
+    efs = EFS(knn, max_features=3, checkpoint_path=path).fit(X, y)
+    assert len(efs.subsets_) == 14
+
+
+def test_top_k():
+    iris = load_iris()
+    X = iris.data
+    y = iris.target
+    knn = KNeighborsClassifier(n_neighbors=4)
+    efs1 = EFS(knn, min_features=1, max_features=4, cv=3, print_progress=False)
+    efs1 = efs1.fit(X, y)
+    efs2 = EFS(
+        knn,
+        min_features=1,
+        max_features=4,
+        cv=3,
+        print_progress=False,
+        top_k=4,
+        chunksize=5,
+    )
+    efs2 = efs2.fit(X, y)
+    assert efs2.best_idx_ == efs1.best_idx_
+    assert efs2.best_score_ == efs1.best_score_
+
+    # ties are broken in favor of the first evaluated subsets
+    expect = sorted(efs1.subsets_, key=lambda i: (-efs1.subsets_[i]["avg_score"], i))[
+        :4
+    ]
+    assert sorted(efs2.subsets_) == sorted(expect)
+
+    for k in range(1, 5):
+        scores = [
+            v["avg_score"] for v in efs1.subsets_.values() if len(v["feature_idx"]) == k
+        ]
+        summary = efs2.score_summary_[k]
+        assert summary["n_subsets"] == len(scores)
+        assert_almost_equal(summary["mean"], np.mean(scores))
+        assert_almost_equal(summary["std"], np.std(scores))
+        assert summary["min"] == min(scores)
+        assert summary["max"] == max(scores)
+
+    efs = EFS(knn, max_features=2, top_k=0)
+    expect = "`top_k` must be a positive integer or None. Got 0."
+    assert_raises(ValueError, expect, efs.fit, X, y)
+
+
+def test_top_k_resume(tmpdir):
+    iris = load_iris()
+    X = iris.data
+    y = iris.target
+    knn = KNeighborsClassifier(n_neighbors=4)
+    path = str(tmpdir.join("efs.pkl"))
+    params = dict(min_features=1, max_features=4, cv=3, top_k=3, chunksize=2)
+    efs1 = EFS(knn, **params).fit(X, y)
+
+    efs2 = EFS(knn, checkpoint_path=path, **params)
+    efs2._TESTING_INTERRUPT_MODE = True
+    efs2.fit(X, y)
+    efs3 = EFS(knn, checkpoint_path=path, resume=True, **params).fit(X, y)
+    assert efs3.best_idx_ == efs1.best_idx_
+    assert efs3.score_summary_ == efs1.score_summary_
+    dict_compare_utility(d1=efs3.subsets_, d2=efs1.subsets_)
+
+
+def test_checkpoint_append_subsets(tmpdir):
+    iris = load_iris()
+    X = iris.data
+    y = iris.target
+    knn = KNeighborsClassifier(n_neighbors=4)
+    path = str(tmpdir.join("efs.pkl"))
+    params = dict(min_features=1, max_features=3, cv=0, chunksize=4)
+    efs1 = EFS(knn, checkpoint_path=path, **params).fit(X, y)
+
+    # the subsets are appended chunk by chunk, not written with the state
+    state = joblib.load(path)["state"]
+    assert state["subsets_"] is None
+    assert state["n_evaluated"] == 14
+    subsets = load_subsets(path + ".subsets", state["offset"])
+    assert sorted(subsets) == list(range(14))
+
+    # data of an incomplete checkpoint is ignored
+    with open(path + ".subsets", "ab") as f:
+        f.write(b"incomplete chunk")
+    efs2 = EFS(knn, checkpoint_path=path, resume=True, **params).fit(X, y)
+    assert efs2.best_idx_ == efs1.best_idx_
+    dict_compare_utility(d1=efs2.subsets_, d2=efs1.subsets_)
+
+
+class _UnpicklableEFS(EFS):
+    def __getstate__(self):
+        raise TypeError("the selector was sent to the workers")
+
+
+def test_n_jobs_does_not_pickle_selector():
+    # pickling the selector with its growing `subsets_` for every chunk
+    # makes the parallel search quadratic in the number of subsets
+    iris = load_iris()
+    X = iris.data
+    y = iris.target
+    knn = KNeighborsClassifier(n_neighbors=4)
+    params = dict(min_features=1, max_features=4, cv=0, chunksize=4)
+    efs1 = EFS(knn, **params).fit(X, y)
+    efs2 = _UnpicklableEFS(knn, n_jobs=2, **params).fit(X, y)
+    assert efs2.best_idx_ == efs1.best_idx_
+    dict_compare_utility(d1=efs2.subsets_, d2=efs1.subsets_)
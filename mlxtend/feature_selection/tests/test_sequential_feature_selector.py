@@ -3,13 +3,15 @@
 # Author: Sebastian Raschka <sebastianraschka.com>
 #
 # License: BSD 3 clause
+import os
+
 import numpy as np
 import pandas as pd
 from numpy import nan
 from numpy.testing import assert_almost_equal
 from packaging.version import Version
 from sklearn import __version__ as sklearn_version
-from sklearn.datasets import load_boston, load_iris
+from sklearn.datasets import load_boston, load_iris, load_wine
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import accuracy_score, make_scorer, roc_auc_score
@@ -910,3 +912,104 @@ def test_custom_feature_names():
     assert sfs1.k_feature_idx_ == (1, 3)
     assert sfs1.k_feature_names_ == ("sepal width", "petal width")
     assert sfs1.subsets_[2]["feature_names"] == ("sepal width", "petal width")
+
+
+def test_score_cache_floating():
+    X, y = load_wine(return_X_y=True)
+    knn = KNeighborsClassifier()
+    sfs1 = SFS(knn, k_features=8, floating=True, cv=3, cache_size=0)
+    sfs1 = sfs1.fit(X, y)
+    assert sfs1.cache_hits_ == 0
+
+    sfs2 = SFS(knn, k_features=8, floating=True, cv=3)
+    sfs2 = sfs2.fit(X, y)
+    assert sfs2.cache_hits_ > 0
+    assert sfs2.cache_hits_ + sfs2.cache_misses_ == sfs1.cache_misses_
+    assert sfs2.k_feature_idx_ == sfs1.k_feature_idx_
+    dict_compare_utility(d_actual=sfs2.subsets_, d_desired=sfs1.subsets_)
+
+
+def test_score_cache_size():
+    X, y = load_wine(return_X_y=True)
+    knn = KNeighborsClassifier()
+    sfs1 = SFS(knn, k_features=8, floating=True, cv=3)
+    sfs1 = sfs1.fit(X, y)
+    sfs2 = SFS(knn, k_features=8, floating=True, cv=3, cache_size=5)
+    sfs2 = sfs2.fit(X, y)
+    assert sfs2.cache_hits_ < sfs1.cache_hits_
+    n_lookups = sfs1.cache_hits_ + sfs1.cache_misses_
+    assert sfs2.cache_hits_ + sfs2.cache_misses_ == n_lookups
+    assert sfs2.k_feature_idx_ == sfs1.k_feature_idx_
+    assert not hasattr(sfs2, "_score_cache")
+
+    expect = "`cache_size` must be a non-negative integer or None. Got -1."
+    sfs = SFS(knn, k_features=8, cache_size=-1)
+    assert_raises(ValueError, expect, sfs.fit, X, y)
+
+
+def test_score_cache_memory(tmpdir):
+    def n_cached():
+        return sum("output.pkl" in files for _, _, files in os.walk(str(tmpdir)))
+
+    X, y = load_wine(return_X_y=True)
+    sfs1 = SFS(KNeighborsClassifier(), k_features=3, cv=3, memory=str(tmpdir))
+    sfs1 = sfs1.fit(X, y)
+    n_subsets = n_cached()
+    assert n_subsets == sfs1.cache_misses_
+
+    sfs2 = SFS(KNeighborsClassifier(), k_features=3, cv=3, memory=str(tmpdir))
+    sfs2 = sfs2.fit(X, y)
+    assert n_cached() == n_subsets
+    assert sfs2.k_feature_idx_ == sfs1.k_feature_idx_
+    dict_compare_utility(d_actual=sfs2.subsets_, d_desired=sfs1.subsets_)
+
+    sfs3 = SFS(KNeighborsClassifier(3), k_features=3, cv=3, memory=str(tmpdir))
+    sfs3 = sfs3.fit(X, y)
+    assert n_cached() == 2 * n_subsets
+
+
+def test_checkpoint_resume(tmpdir):
+    X, y = load_wine(return_X_y=True)
+    knn = KNeighborsClassifier()
+    path = str(tmpdir.join("sfs.pkl"))
+    for forward in [True, False]:
+        sfs1 = SFS(knn, k_features=6, forward=forward, floating=True, cv=3)
+        sfs1 = sfs1.fit(X, y)
+
+        sfs2 = SFS(
+            knn,
+            k_features=6,
+            forward=forward,
+            floating=True,
+            cv=3,
+            checkpoint_path=path,
+        )
+        sfs2._TESTING_INTERRUPT_MODE = True
+        sfs2 = sfs2.fit(X, y)
+        assert sfs2.interrupted_
+
+        sfs3 = SFS(
+            knn,
+            k_features=6,
+            forward=forward,
+            floating=True,
+            cv=3,
+            checkpoint_path=path,
+            resume=True,
+        )
+        sfs3 = sfs3.fit(X, y)
+        assert not sfs3.interrupted_
+        assert sfs3.k_feature_idx_ == sfs1.k_feature_idx_
+        assert sfs3.cache_hits_ == sfs1.cache_hits_
+        assert sfs3.cache_misses_ == sfs1.cache_misses_
+        dict_compare_utility(d_actual=sfs3.subsets_, d_desired=sfs1.subsets_)
+
+    sfs = SFS(knn, k_features=5, checkpoint_path=path, resume=True)
+    expect = (
+        "The checkpoint %s was written for different data or parameters. "
+        "Remove it, or set `resume=False` to overwrite it." % path
+    )
+    assert_raises(ValueError, expect, sfs.fit, X, y)
+    sfs = SFS(knn, k_features=5, resume=True)
+    expect = "`resume=True` requires a `checkpoint_path`."
+    assert_raises(ValueError, expect, sfs.fit, X, y)
@@ -4,9 +4,29 @@
 #
 # License: BSD 3 clause
 
-from .apriori import apriori
+from .approximate import approximate_itemsets
+from .apriori import apriori, apriori_streaming
 from .association_rules import association_rules
+from .eclat import eclat
+from .fpclose import expand_closed, fpclose
+from .fpcommon import CompactItemsets, MiningStats
 from .fpgrowth import fpgrowth
 from .fpmax import fpmax
+from .incremental import IncrementalItemsetMiner
+from .prefixspan import prefixspan
 
-__all__ = ["apriori", "association_rules", "fpgrowth", "fpmax"]
+__all__ = [
+    "CompactItemsets",
+    "IncrementalItemsetMiner",
+    "MiningStats",
+    "apriori",
+    "apriori_streaming",
+    "approximate_itemsets",
+    "association_rules",
+    "eclat",
+    "expand_closed",
+    "fpclose",
+    "fpgrowth",
+    "fpmax",
+    "prefixspan",
+]
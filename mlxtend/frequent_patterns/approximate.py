@@ -0,0 +1,269 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# Approximate frequent itemset mining on a sample of the transactions
+#
+# License: BSD 3 clause
+
+import math
+import warnings
+
+import numpy as np
+import pandas as pd
+from scipy.stats import beta, binom
+
+from ..frequent_patterns import fpcommon as fpc
+from .apriori import (
+    apriori,
+    bitset_support_counts,
+    generate_candidates,
+    sparse_support_counts,
+)
+from .fpgrowth import fpgrowth
+
+
+def approximate_itemsets(
+    df,
+    min_support=0.5,
+    sample_fraction=None,
+    epsilon=None,
+    delta=0.05,
+    verify=True,
+    algorithm="fpgrowth",
+    use_colnames=False,
+    max_len=None,
+    random_state=None,
+):
+    """Get approximate frequent itemsets from a random sample of a one-hot DataFrame
+
+    The itemsets are mined from a random sample of the transactions
+    (rows) with a threshold that is lowered to the `delta` quantile of
+    the binomial distribution of the sample support, so that an itemset
+    whose support in `df` is at least `min_support` is missed with
+    probability at most `delta`. If `verify=True`, the
+    supports of these candidates and of their negative border (the
+    infrequent itemsets of the sample whose subsets are all frequent)
+    are then counted in a single pass over `df` (Toivonen, 1996), which
+    yields the exact supports.
+
+    Parameters
+    -----------
+    df : pandas DataFrame
+      pandas DataFrame the encoded format, as accepted by `apriori`
+      and `fpgrowth`. Also supports DataFrames with sparse data.
+
+    min_support : float (default: 0.5)
+      A float between 0 and 1 for minimum support of the itemsets returned.
+      The support is computed as the fraction
+      transactions_where_item(s)_occur / total_transactions.
+
+    sample_fraction : float (default: None)
+      Fraction of the transactions to sample, within `(0, 1]`.
+      Either `sample_fraction` or `epsilon` must be given.
+
+    epsilon : float (default: None)
+      Maximum absolute error of the support of an itemset in the sample.
+      The sample size is chosen such that this error is exceeded with
+      probability at most `delta` (Hoeffding's inequality), i.e.,
+      `ln(2 / delta) / (2 * epsilon**2)` transactions, independently
+      of the number of transactions in `df`.
+
+    delta : float (default: 0.05)
+      Probability with which a frequent itemset may be missed, and with
+      which the (Clopper-Pearson) confidence interval of a support may
+      not contain the support in `df`, within `(0, 1)`. This holds for
+      each itemset separately, not for all itemsets at once.
+
+    verify : bool (default: True)
+      If `True`, counts the candidates in a single pass over `df` and
+      returns exact supports and all frequent itemsets. A warning is
+      raised if an itemset of the negative border turns out to be
+      frequent, since some of its supersets may then be missing from
+      the result.
+
+    algorithm : str (default: 'fpgrowth')
+      Algorithm used to mine the sample, 'fpgrowth' or 'apriori'.
+
+    use_colnames : bool (default: False)
+      If `True`, uses the DataFrames' column names in the returned
+      DataFrame instead of column indices.
+
+    max_len : int (default: None)
+      Maximum length of the itemsets generated. If `None` (default) all
+      possible itemsets lengths are evaluated.
+
+    random_state : int or np.random.RandomState (default: None)
+      Seed or random number generator used to draw the sample.
+
+    Returns
+    -----------
+    pandas DataFrame with columns ['support', 'itemsets', 'support_lower',
+      'support_upper']. If `verify=False`, 'support' is the support in
+      the sample, the bounds are its confidence interval, and the
+      itemsets are the candidates, i.e., they may include infrequent
+      itemsets whose support in the sample is close to `min_support`. If
+      `verify=True`, 'support' is the exact support in `df`, the bounds
+      are equal to it, and only the itemsets with a support of at least
+      `min_support` are returned.
+
+    Examples
+    -----------
+    For usage examples, please see
+    http://rasbt.github.io/mlxtend/user_guide/frequent_patterns/approximate_itemsets/
+
+    """
+    fpc.valid_input_check(df)
+
+    if min_support <= 0.0:
+        raise ValueError(
+            "`min_support` must be a positive "
+            "number within the interval `(0, 1]`. "
+            "Got %s." % min_support
+        )
+    if (sample_fraction is None) == (epsilon is None):
+        raise ValueError("Exactly one of `sample_fraction` and `epsilon` must be set.")
+    if sample_fraction is not None and not 0.0 < sample_fraction <= 1.0:
+        raise ValueError(
+            "`sample_fraction` must be within `(0, 1]`. Got %s." % sample_fraction
+        )
+    if epsilon is not None and not 0.0 < epsilon < 1.0:
+        raise ValueError("`epsilon` must be within `(0, 1)`. Got %s." % epsilon)
+    if not 0.0 < delta < 1.0:
+        raise ValueError("`delta` must be within `(0, 1)`. Got %s." % delta)
+    miners = {"fpgrowth": fpgrowth, "apriori": apriori}
+    if algorithm not in miners:
+        raise ValueError(
+            "`algorithm` must be 'fpgrowth' or 'apriori'. Got %s." % algorithm
+        )
+
+    n_rows = len(df.index)
+    if sample_fraction is not None:
+        n_sample = int(math.ceil(sample_fraction * n_rows))
+    else:
+        n_sample = int(math.ceil(math.log(2.0 / delta) / (2.0 * epsilon**2)))
+    n_sample = max(min(n_sample, n_rows), 1)
+
+    if isinstance(random_state, np.random.RandomState):
+        rng = random_state
+    else:
+        rng = np.random.RandomState(random_state)
+    rows = np.sort(rng.choice(n_rows, n_sample, replace=False))
+    sample = df.iloc[rows]
+
+    # An itemset with a support of `min_support` in `df` reaches the
+    # lowered threshold in the sample with probability 1 - delta
+    lowered = min_support
+    if n_sample < n_rows:
+        count = max(binom.ppf(delta, n_sample, min(min_support, 1.0)), 1.0)
+        # halfway between two counts, to be robust to rounding errors
+        lowered = (count - 0.5) / n_sample
+    found = miners[algorithm](sample, min_support=lowered, max_len=max_len)
+    itemsets = [tuple(sorted(itemset)) for itemset in found["itemsets"]]
+    support = found["support"].values
+    lower, upper = support, support
+    if n_sample < n_rows:
+        lower, upper = _clopper_pearson(support, n_sample, delta)
+
+    if verify and n_sample < n_rows:
+        border = negative_border(itemsets, df.shape[1], max_len)
+        counts = _count_itemsets(df, itemsets + border) / float(n_rows)
+        support, border_support = counts[: len(itemsets)], counts[len(itemsets) :]
+        frequent_border = border_support >= min_support
+        if frequent_border.any():
+            warnings.warn(
+                "%d itemset(s) of the negative border of the sample are "
+                "frequent, so the result may miss some of their supersets. "
+                "Use a larger sample to find all frequent itemsets."
+                % frequent_border.sum()
+            )
+        itemsets = itemsets + [c for c, f in zip(border, frequent_border) if f]
+        support = np.append(support, border_support[frequent_border])
+        keep = support >= min_support
+        itemsets = [itemset for itemset, k in zip(itemsets, keep) if k]
+        support = support[keep]
+        lower, upper = support, support
+
+    colnames = df.columns if use_colnames else None
+    res_df = pd.DataFrame(
+        {
+            "support": np.asarray(support, dtype=float),
+            "itemsets": [
+                frozenset(i if colnames is None else colnames[i] for i in itemset)
+                for itemset in itemsets
+            ],
+        }
+    )
+    res_df["support_lower"] = np.asarray(lower, dtype=float)
+    res_df["support_upper"] = np.asarray(upper, dtype=float)
+    return res_df
+
+
+def _clopper_pearson(support, n, delta):
+    """Two-sided binomial confidence intervals of the supports"""
+    k = np.round(np.asarray(support) * n)
+    with np.errstate(invalid="ignore"):
+        lower = np.where(k > 0, beta.ppf(delta / 2, k, n - k + 1), 0.0)
+        upper = np.where(k < n, beta.ppf(1 - delta / 2, k + 1, n - k), 1.0)
+    return lower, upper
+
+
+def negative_border(itemsets, n_items, max_len=None):
+    """
+    Computes the minimal itemsets that are not among `itemsets`.
+
+    Parameters
+    -----------
+    itemsets : list of tuples
+        Downward closed collection of itemsets, as sorted item ids.
+    n_items : int
+        Number of items.
+    max_len : int (default: None)
+        Maximum length of the itemsets of the border.
+
+    Returns
+    -----------
+    list of tuples
+        The itemsets that are not in `itemsets` but whose subsets
+        that are one item smaller all are.
+    """
+    by_size = {}
+    for itemset in itemsets:
+        by_size.setdefault(len(itemset), set()).add(itemset)
+    border = [(item,) for item in range(n_items) if (item,) not in by_size.get(1, ())]
+    for size, same_size in sorted(by_size.items()):
+        if max_len and size >= max_len:
+            break
+        candidates = generate_candidates(np.array(sorted(same_size)))
+        larger = by_size.get(size + 1, set())
+        border.extend(
+            candidate
+            for candidate in map(tuple, candidates.tolist())
+            if candidate not in larger
+        )
+    return border
+
+
+def _count_itemsets(df, itemsets):
+    """Counts the transactions of `df` containing each itemset"""
+    if hasattr(df, "sparse") and df.size > 0:
+        X = df.sparse.to_coo().tocsc()
+        X.eliminate_zeros()
+        is_sparse = True
+    else:
+        X = df.values
+        is_sparse = False
+        packed = fpc.pack_columns(X, is_sparse=False)
+
+    counts = np.zeros(len(itemsets), dtype=np.int64)
+    by_size = {}
+    for idx, itemset in enumerate(itemsets):
+        by_size.setdefault(len(itemset), []).append(idx)
+    for size, indices in by_size.items():
+        combin = np.array([itemsets[i] for i in indices], dtype=np.int64)
+        if is_sparse and size == 1:
+            counts[indices] = np.diff(X.indptr)[combin[:, 0]]
+        elif is_sparse:
+            counts[indices] = sparse_support_counts(X, combin)
+        else:
+            counts[indices] = bitset_support_counts(packed, combin)
+    return counts
@@ -4,11 +4,20 @@
 #
 # License: BSD 3 clause
 
+import os
+import shutil
+import tempfile
+
 import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix, issparse
 
 from ..frequent_patterns import fpcommon as fpc
 
+# upper bound for the size of the temporary bit vectors (in bytes)
+# that are created when counting candidates with `engine="bitset"`
+_BITSET_BLOCK_BYTES = 2**26
+
 
 def generate_new_combinations(old_combinations):
     """
@@ -52,7 +61,86 @@ def generate_new_combinations(old_combinations):
             yield item
 
 
-def generate_new_combinations_low_memory(old_combinations, X, min_support, is_sparse):
+def generate_candidates(old_combinations):
+    """
+    Generates the candidates of the next Apriori level in bulk
+
+    Two combinations of the last level that share all but their last
+    item (their prefix) are joined into a candidate that is one item
+    larger. A candidate is only kept if all of its subsets that are one
+    item smaller are among `old_combinations` (subset pruning), since
+    it cannot have enough support otherwise.
+
+    Parameters
+    -----------
+    old_combinations: np.array
+        All combinations with enough support in the last step
+        Combinations are represented by a matrix.
+        Number of columns is equal to the combination size
+        of the previous step.
+        Each row represents one combination
+        and contains item type ids in the ascending order
+        ```
+               0        1
+        0      15       20
+        1      15       22
+        2      17       19
+        ```
+
+    Returns
+    -----------
+    np.array, shape = (n_candidates, old_combinations.shape[1] + 1)
+        The candidates in lexicographic order, one per row,
+        with item type ids in the ascending order.
+
+    """
+    old_combinations = np.asarray(old_combinations, dtype=np.int64)
+    n_old, size = old_combinations.shape
+    if n_old < 2:
+        return np.zeros((0, size + 1), dtype=np.int64)
+
+    old_combinations, n_partners = _prefix_partners(old_combinations)
+    n_items = int(old_combinations.max()) + 1
+    first = np.repeat(np.arange(n_old), n_partners)
+    second = _ranges(np.arange(1, n_old + 1), n_partners)
+    candidates = np.hstack((old_combinations[first], old_combinations[second, -1:]))
+
+    # The subsets without one of the last two items are the joined
+    # combinations; the other subsets are looked up
+    old_keys = fpc.itemset_keys(old_combinations, n_items)
+    old_keys.sort()
+    keep = np.ones(len(candidates), dtype=bool)
+    for j in range(size - 1):
+        subsets = np.delete(candidates[keep], j, axis=1)
+        keys = fpc.itemset_keys(subsets, n_items)
+        pos = np.searchsorted(old_keys, keys)
+        pos[pos == len(old_keys)] = 0
+        keep[np.nonzero(keep)[0][old_keys[pos] != keys]] = False
+    return candidates[keep]
+
+
+def _prefix_partners(old_combinations):
+    """Sorts the combinations lexicographically and counts, for each of
+    them, the following combinations that share its prefix (i.e., the
+    combinations it is joined with by `generate_candidates`)"""
+    order = np.lexsort(old_combinations.T[::-1])
+    old_combinations = old_combinations[order]
+    n_old = len(old_combinations)
+    if n_old == 0:
+        return old_combinations, np.zeros(0, dtype=np.int64)
+
+    # Combinations with the same prefix are adjacent after sorting
+    n_items = int(old_combinations.max()) + 1
+    prefix_keys = fpc.itemset_keys(old_combinations[:, :-1], n_items)
+    new_group = np.append(True, prefix_keys[1:] != prefix_keys[:-1])
+    group_ends = np.append(np.nonzero(new_group)[0][1:], n_old)
+    ends = group_ends[np.cumsum(new_group) - 1]
+    return old_combinations, ends - np.arange(n_old) - 1
+
+
+def generate_new_combinations_low_memory(
+    old_combinations, X, min_support, is_sparse, sample_weight=None
+):
     """
     Generator of all combinations based on the last state of Apriori algorithm
     Parameters
@@ -93,6 +181,10 @@ def generate_new_combinations_low_memory(old_combinations, X, min_support, is_sp
 
     is_sparse : bool True if X is sparse
 
+    sample_weight : np.array, shape = (n_rows,) (default: None)
+      Weight of each transaction. If not None, the weighted
+      support is yielded instead of the number of transactions.
+
     Returns
     -----------
     Generator of all combinations from the last step x items
@@ -110,7 +202,10 @@ def generate_new_combinations_low_memory(old_combinations, X, min_support, is_sp
     """
 
     items_types_in_previous_step = np.unique(old_combinations.flatten())
-    rows_count = X.shape[0]
+    if is_sparse and issparse(X):
+        X = _canonical_csc(X)
+        X_rows = X.tocsr()
+    rows_count = X.shape[0] if sample_weight is None else sample_weight.sum()
     threshold = min_support * rows_count
     for old_combination in old_combinations:
         max_combination = old_combination[-1]
@@ -118,12 +213,16 @@ def generate_new_combinations_low_memory(old_combinations, X, min_support, is_sp
         valid_items = items_types_in_previous_step[mask]
         old_tuple = tuple(old_combination)
         if is_sparse:
-            mask_rows = X[:, old_tuple].toarray().all(axis=1)
-            X_cols = X[:, valid_items].toarray()
-            supports = X_cols[mask_rows].sum(axis=0)
+            tids = _sparse_tidlist(X, old_combination)
+            supports = _sparse_extension_counts(
+                X, X_rows, tids, valid_items, sample_weight
+            )
         else:
             mask_rows = X[:, old_tuple].all(axis=1)
-            supports = X[mask_rows][:, valid_items].sum(axis=0)
+            if sample_weight is None:
+                supports = X[mask_rows][:, valid_items].sum(axis=0)
+            else:
+                supports = sample_weight[mask_rows] @ X[mask_rows][:, valid_items]
         valid_indices = (supports >= threshold).nonzero()[0]
         for index in valid_indices:
             yield supports[index]
@@ -131,8 +230,170 @@ def generate_new_combinations_low_memory(old_combinations, X, min_support, is_sp
             yield valid_items[index]
 
 
+def bitset_support_counts(packed, combin):
+    """
+    Counts the transactions that contain each candidate itemset
+    by AND-ing the packed item columns and counting the set bits.
+
+    Parameters
+    -----------
+    packed : np.array, shape = (n_items, n_words), dtype = uint64
+      Item columns packed into bit vectors via
+      `fpcommon.pack_columns`.
+
+    combin : np.array, shape = (n_candidates, itemset_size)
+      Candidate itemsets, one per row, as item column indices.
+
+    Returns
+    -----------
+    np.array, shape = (n_candidates,), number of transactions
+      containing each candidate itemset.
+
+    """
+    counts = np.empty(combin.shape[0], dtype=np.int64)
+    block_size = max(1, _BITSET_BLOCK_BYTES // max(1, packed.shape[1] * 8))
+    for start in range(0, combin.shape[0], block_size):
+        block = combin[start : start + block_size]
+        words = packed[block[:, 0]]
+        for n in range(1, block.shape[1]):
+            words &= packed[block[:, n]]
+        counts[start : start + block_size] = fpc.popcount(words)
+    return counts
+
+
+def sparse_support_counts(X, combin, sample_weight=None):
+    """
+    Counts the transactions that contain each candidate itemset
+    from the row indices of the item columns of a sparse matrix.
+
+    The candidates are grouped by their prefix, i.e., all but their
+    last item. The sorted row indices of the transactions containing
+    a prefix are intersected once per group, and the extensions of the
+    prefix are then counted either from the nonzero entries of their
+    columns or of the prefix rows, whichever are fewer. Memory and
+    runtime hence scale with the number of nonzero entries rather
+    than with the number of transactions.
+
+    Parameters
+    -----------
+    X : scipy sparse matrix, shape = (n_rows, n_items)
+      One-hot encoded transactions.
+
+    combin : np.array, shape = (n_candidates, itemset_size)
+      Candidate itemsets, one per row, as item column indices.
+
+    sample_weight : np.array, shape = (n_rows,) (default: None)
+      If not None, the weights of the transactions are summed
+      instead of counting the transactions.
+
+    Returns
+    -----------
+    np.array, shape = (n_candidates,), number of transactions
+      containing each candidate itemset.
+
+    """
+    X = _canonical_csc(X)
+    X_rows = X.tocsr()
+    dtype = np.int64 if sample_weight is None else float
+    counts = np.zeros(combin.shape[0], dtype=dtype)
+    if combin.shape[0] == 0:
+        return counts
+    keys = fpc.itemset_keys(combin[:, :-1], X.shape[1])
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.nonzero(np.append(True, sorted_keys[1:] != sorted_keys[:-1]))[0]
+    ends = np.append(starts[1:], len(order))
+    for start, end in zip(starts, ends):
+        group = order[start:end]
+        tids = _sparse_tidlist(X, combin[group[0], :-1])
+        counts[group] = _sparse_extension_counts(
+            X, X_rows, tids, combin[group, -1], sample_weight
+        )
+    return counts
+
+
+def _canonical_csc(X):
+    """Converts X to CSC format with sorted row indices and no explicit
+    zeros, copying it only if necessary"""
+    X = X.tocsc()
+    if not X.has_canonical_format or not X.data.all():
+        X = X.copy()
+        X.eliminate_zeros()
+        X.sum_duplicates()
+    return X
+
+
+def _sparse_tidlist(X, items):
+    """Sorted row indices of the transactions containing all `items`"""
+    items = sorted(items, key=lambda i: X.indptr[i + 1] - X.indptr[i])
+    tids = X.indices[X.indptr[items[0]] : X.indptr[items[0] + 1]]
+    for item in items[1:]:
+        if len(tids) == 0:
+            break
+        column = X.indices[X.indptr[item] : X.indptr[item + 1]]
+        tids = np.intersect1d(tids, column, assume_unique=True)
+    return tids
+
+
+def _sparse_extension_counts(X, X_rows, tids, items, sample_weight=None):
+    """Number (or total weight) of rows in `tids` that contain each of
+    `items`, counted either from the columns of the items (CSC matrix `X`)
+    or from the rows `tids` (CSR matrix `X_rows`), whichever has fewer
+    entries"""
+    items = np.asarray(items)
+    dtype = np.int64 if sample_weight is None else float
+    if len(tids) == 0 or len(items) == 0:
+        return np.zeros(len(items), dtype=dtype)
+
+    col_starts = X.indptr[items]
+    col_lengths = X.indptr[items + 1] - col_starts
+    row_starts = X_rows.indptr[tids]
+    row_lengths = X_rows.indptr[tids + 1] - row_starts
+    if col_lengths.sum() <= row_lengths.sum():
+        # look up the rows of each item column in `tids`
+        values = X.indices[_ranges(col_starts, col_lengths)]
+        found = np.searchsorted(tids, values)
+        found[found == len(tids)] = 0
+        hits = tids[found] == values
+        owner = np.repeat(np.arange(len(items)), col_lengths)
+        weights = None
+        if sample_weight is not None:
+            weights = sample_weight[values[hits]]
+        return np.bincount(owner[hits], weights=weights, minlength=len(items))
+
+    # look up the items of each row of `tids` in `items`
+    order = np.argsort(items, kind="stable")
+    sorted_items = items[order]
+    values = X_rows.indices[_ranges(row_starts, row_lengths)]
+    found = np.searchsorted(sorted_items, values)
+    found[found == len(items)] = 0
+    hits = sorted_items[found] == values
+    weights = None
+    if sample_weight is not None:
+        weights = np.repeat(sample_weight[tids], row_lengths)[hits]
+    counts = np.zeros(len(items), dtype=dtype)
+    counts[order] = np.bincount(found[hits], weights=weights, minlength=len(items))
+    return counts
+
+
+def _ranges(starts, lengths):
+    """Concatenation of `np.arange(start, start + length)` for all pairs"""
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(lengths.sum()) + np.repeat(starts - offsets, lengths)
+
+
 def apriori(
-    df, min_support=0.5, use_colnames=False, max_len=None, verbose=0, low_memory=False
+    df,
+    min_support=0.5,
+    use_colnames=False,
+    max_len=None,
+    verbose=0,
+    low_memory=False,
+    engine="auto",
+    max_memory=None,
+    compact=False,
+    sample_weight=None,
+    callback=None,
 ):
     """Get frequent itemsets from a one-hot DataFrame
 
@@ -162,6 +423,13 @@ def apriori(
         7     True     True  False    False  False  False
     ```
 
+      With `engine='bitset'`, `df` can also be the uint64 array of
+      bit-packed transactions returned by
+      `TransactionEncoder.transform(X, packed=True)`. It is converted
+      into one bit vector per item once, and the itemsets hold the
+      indices into `TransactionEncoder.columns_`, so `use_colnames`
+      must be False.
+
     min_support : float (default: 0.5)
       A float between 0 and 1 for minumum support of the itemsets returned.
       The support is computed as the fraction
@@ -186,6 +454,49 @@ def apriori(
       if memory resources are limited, because this implementation is approx.
       3-6x slower than the default.
 
+    engine : str (default: 'auto')
+      Strategy for counting the support of candidate itemsets.
+      If 'auto', the candidate columns are combined via boolean
+      NumPy indexing. If 'bitset', each item column is packed into
+      a bit vector once, and the support of a candidate is computed
+      via bitwise AND and counting the set bits of the packed words.
+      'bitset' needs 8x less memory for the data and, unlike 'auto',
+      does not create a temporary array of size
+      `n_rows x n_candidates x itemset_size`; `low_memory`
+      has no effect in this case.
+
+    max_memory : int (default: None)
+      Memory budget in bytes for the data and the intermediate arrays.
+      If not None, the candidate itemsets of each itemset size are
+      counted in blocks that fit into the budget, and the frequent
+      itemsets of each completed size are written to memory-mapped
+      `.npy` files in a temporary directory instead of being kept in
+      memory. If the candidates of an itemset size cannot be generated
+      and counted within the budget, a `MemoryError` with an estimate
+      of the memory needed is raised before they are created.
+      With `low_memory=True`, the estimate counts all combinations
+      that may be stored for an itemset size instead.
+      The returned DataFrame is not included in the budget.
+
+    compact : bool (default: False)
+      If `True`, returns a `CompactItemsets` object that stores the
+      itemsets as flat NumPy arrays of item ids instead of a DataFrame
+      of frozensets. It can be passed to `association_rules` directly
+      and converted into the DataFrame via its `to_frame` method.
+
+    sample_weight : array-like, shape = (n_transactions,) (default: None)
+      Weight of each transaction (row of `df`), e.g., the number of times
+      it occurs if identical transactions have been collapsed into one row.
+      The support of an itemset is then computed as the sum of the weights
+      of the transactions containing it divided by the sum of all weights.
+      If `None` (default), every transaction has a weight of 1.
+
+    callback : callable (default: None)
+      Called with a dict for every itemset size (level), holding the
+      number of candidates counted (None with `low_memory=True`, which
+      does not materialize them), the number of frequent itemsets, the
+      elapsed time and the peak memory. Pass a `MiningStats` object to
+      collect these events.
 
     Returns
     -----------
@@ -215,6 +526,7 @@ def apriori(
         _x : matrix of bools or binary
 
         _n_rows : numeric, number of rows in _x
+          (sum of the weights of the rows if `sample_weight` is not None)
 
         _is_sparse : bool True if _x is sparse
 
@@ -228,6 +540,8 @@ def apriori(
         http://rasbt.github.io/mlxtend/user_guide/frequent_patterns/apriori/
 
         """
+        if sample_weight is not None:
+            return fpc.weighted_item_counts(_x, sample_weight) / _n_rows
         out = np.sum(_x, axis=0) / _n_rows
         return np.array(out).reshape(-1)
 
@@ -238,85 +552,519 @@ def apriori(
             "Got %s." % min_support
         )
 
-    fpc.valid_input_check(df)
+    if engine not in ("auto", "bitset"):
+        raise ValueError("`engine` must be 'auto' or 'bitset'. Got %s." % engine)
 
-    if hasattr(df, "sparse"):
+    if max_memory is not None and max_memory <= 0:
+        raise ValueError(
+            "`max_memory` must be a positive number of bytes. Got %s." % max_memory
+        )
+
+    is_packed = isinstance(df, np.ndarray)
+    if is_packed:
+        fpc.valid_packed_check(df, use_colnames)
+        if engine != "bitset":
+            raise ValueError(
+                "Bit-packed transactions are only supported with "
+                "`engine='bitset'`. Got %s." % engine
+            )
+    else:
+        fpc.valid_input_check(df)
+    fpc.check_callback(callback)
+    sample_weight = fpc.check_sample_weight(sample_weight, len(df))
+    if sample_weight is not None and engine == "bitset":
+        raise ValueError("`sample_weight` is not supported with `engine='bitset'`.")
+
+    if is_packed:
+        # converted into one bit vector per item once
+        X = None
+        packed = fpc.unpack_transactions(df)
+        is_sparse = False
+    elif hasattr(df, "sparse"):
         # DataFrame with SparseArray (pandas >= 0.24)
         if df.size == 0:
             X = df.values
         else:
-            X = df.sparse.to_coo().tocsc()
+            X = _canonical_csc(df.sparse.to_coo())
         is_sparse = True
     else:
         # dense DataFrame
         X = df.values
         is_sparse = False
-    support = _support(X, X.shape[0], is_sparse)
-    ary_col_idx = np.arange(X.shape[1])
+    rows_count = float(len(df))
+    if sample_weight is not None:
+        rows_count = sample_weight.sum()
+    log = None
+    if callback is not None:
+        log = fpc.EventLog("apriori", callback)
+
+    if is_packed:
+        support = fpc.popcount(packed) / rows_count
+    else:
+        support = _support(X, rows_count, is_sparse)
+    ary_col_idx = np.arange(len(support))
     support_dict = {1: support[support >= min_support]}
     itemset_dict = {1: ary_col_idx[support >= min_support].reshape(-1, 1)}
     max_itemset = 1
-    rows_count = float(X.shape[0])
+    if log is not None:
+        log.emit(
+            "level",
+            level=1,
+            n_candidates=len(support),
+            n_frequent=len(itemset_dict[1]),
+        )
 
-    all_ones = np.ones((int(rows_count), 1))
+    if engine == "bitset" and not is_packed:
+        packed = fpc.pack_columns(X, is_sparse and df.size > 0)
 
-    while max_itemset and max_itemset < (max_len or float("inf")):
-        next_max_itemset = max_itemset + 1
+    spill_dir = None
+    if max_memory is not None:
+        # memory of the data, including the copies made for counting
+        if is_packed:
+            data_bytes = df.nbytes
+        elif is_sparse and issparse(X):
+            data_bytes = 2 * (X.data.nbytes + X.indices.nbytes + X.indptr.nbytes)
+        else:
+            data_bytes = X.nbytes
+        if engine == "bitset":
+            data_bytes += packed.nbytes
+        spill_dir = tempfile.mkdtemp(prefix="mlxtend_apriori_")
+        itemset_dict[1] = _spill(spill_dir, "itemsets_1", itemset_dict[1])
+        support_dict[1] = _spill(spill_dir, "support_1", support_dict[1])
 
-        # With exceptionally large datasets, the matrix operations can use a
-        # substantial amount of memory. For low memory applications or large
-        # datasets, set `low_memory=True` to use a slower but more memory-
-        # efficient implementation.
-        if low_memory:
-            combin = generate_new_combinations_low_memory(
-                itemset_dict[max_itemset], X, min_support, is_sparse
-            )
-            # slightly faster than creating an array from a list of tuples
-            combin = np.fromiter(combin, dtype=int)
-            combin = combin.reshape(-1, next_max_itemset + 1)
-
-            if combin.size == 0:
-                break
-            if verbose:
-                print(
-                    "\rProcessing %d combinations | Sampling itemset size %d"
-                    % (combin.size, next_max_itemset),
-                    end="",
-                )
+    try:
+        while max_itemset and max_itemset < (max_len or float("inf")):
+            next_max_itemset = max_itemset + 1
 
-            itemset_dict[next_max_itemset] = combin[:, 1:]
-            support_dict[next_max_itemset] = combin[:, 0].astype(float) / rows_count
-            max_itemset = next_max_itemset
-        else:
-            combin = generate_new_combinations(itemset_dict[max_itemset])
-            combin = np.fromiter(combin, dtype=int)
-            combin = combin.reshape(-1, next_max_itemset)
-
-            if combin.size == 0:
-                break
-            if verbose:
-                print(
-                    "\rProcessing %d combinations | Sampling itemset size %d"
-                    % (combin.size, next_max_itemset),
-                    end="",
+            # With exceptionally large datasets, the matrix operations can use
+            # a substantial amount of memory. For low memory applications or
+            # large datasets, set `low_memory=True` to use a slower but more
+            # memory-efficient implementation.
+            if low_memory and engine != "bitset":
+                if max_memory is not None:
+                    # every itemset is extended by the larger frequent items,
+                    # and at most all of these combinations are stored
+                    old_combinations = itemset_dict[max_itemset]
+                    items = np.unique(old_combinations)
+                    n_extensions = len(items) - np.searchsorted(
+                        items, old_combinations[:, -1], side="right"
+                    )
+                    _check_memory(
+                        max_memory,
+                        data_bytes + old_combinations.nbytes,
+                        int(n_extensions.sum()),
+                        next_max_itemset,
+                        0,
+                    )
+                combin = generate_new_combinations_low_memory(
+                    itemset_dict[max_itemset], X, min_support, is_sparse, sample_weight
+                )
+                # slightly faster than creating an array from a list of tuples
+                combin = np.fromiter(
+                    combin, dtype=int if sample_weight is None else float
                 )
+                combin = combin.reshape(-1, next_max_itemset + 1)
+                if log is not None:
+                    log.emit(
+                        "level",
+                        level=next_max_itemset,
+                        n_candidates=None,
+                        n_frequent=combin.shape[0],
+                    )
 
-            if is_sparse:
-                _bools = X[:, combin[:, 0]] == all_ones
-                for n in range(1, combin.shape[1]):
-                    _bools = _bools & (X[:, combin[:, n]] == all_ones)
-            else:
-                _bools = np.all(X[:, combin], axis=2)
+                if combin.size == 0:
+                    break
+                if verbose:
+                    print(
+                        "\rProcessing %d combinations | Sampling itemset size %d"
+                        % (combin.size, next_max_itemset),
+                        end="",
+                    )
 
-            support = _support(np.array(_bools), rows_count, is_sparse)
-            _mask = (support >= min_support).reshape(-1)
-            if any(_mask):
-                itemset_dict[next_max_itemset] = np.array(combin[_mask])
-                support_dict[next_max_itemset] = np.array(support[_mask])
+                itemset_dict[next_max_itemset] = combin[:, 1:].astype(int)
+                support_dict[next_max_itemset] = combin[:, 0].astype(float) / rows_count
                 max_itemset = next_max_itemset
             else:
-                # Exit condition
-                break
+                block_size = None
+                if max_memory is not None:
+                    # the joined combinations are created at once
+                    _, n_partners = _prefix_partners(itemset_dict[max_itemset])
+                    _check_memory(
+                        max_memory,
+                        data_bytes + itemset_dict[max_itemset].nbytes,
+                        int(n_partners.sum()),
+                        next_max_itemset,
+                        0,
+                    )
+                combin = generate_candidates(itemset_dict[max_itemset])
+
+                if combin.size == 0:
+                    if log is not None:
+                        log.emit(
+                            "level",
+                            level=next_max_itemset,
+                            n_candidates=0,
+                            n_frequent=0,
+                        )
+                    break
+                if verbose:
+                    print(
+                        "\rProcessing %d combinations | Sampling itemset size %d"
+                        % (combin.size, next_max_itemset),
+                        end="",
+                    )
+
+                if max_memory is not None:
+                    # temporary memory needed per counted candidate
+                    if engine == "bitset":
+                        per_candidate = packed.shape[1] * 8
+                    elif is_sparse:
+                        per_candidate = 0
+                    else:
+                        per_candidate = X.shape[0] * (next_max_itemset * X.itemsize + 2)
+                    block_size = _check_memory(
+                        max_memory,
+                        data_bytes,
+                        combin.shape[0],
+                        next_max_itemset,
+                        per_candidate,
+                    )
+
+                support = np.empty(combin.shape[0])
+                block_size = block_size or max(combin.shape[0], 1)
+                for start in range(0, combin.shape[0], block_size):
+                    block = combin[start : start + block_size]
+                    if engine == "bitset":
+                        block_support = bitset_support_counts(packed, block)
+                        block_support = block_support / rows_count
+                    elif is_sparse:
+                        block_support = sparse_support_counts(X, block, sample_weight)
+                        block_support = block_support / rows_count
+                    else:
+                        _bools = np.all(X[:, block], axis=2)
+                        block_support = _support(
+                            np.array(_bools), rows_count, is_sparse
+                        )
+                    support[start : start + block_size] = block_support
+                _mask = (support >= min_support).reshape(-1)
+                if log is not None:
+                    log.emit(
+                        "level",
+                        level=next_max_itemset,
+                        n_candidates=combin.shape[0],
+                        n_frequent=int(_mask.sum()),
+                    )
+                if any(_mask):
+                    itemset_dict[next_max_itemset] = np.array(combin[_mask])
+                    support_dict[next_max_itemset] = np.array(support[_mask])
+                    max_itemset = next_max_itemset
+                else:
+                    # Exit condition
+                    break
+
+            if spill_dir is not None:
+                for name, level_dict in (
+                    ("itemsets", itemset_dict),
+                    ("support", support_dict),
+                ):
+                    level_dict[max_itemset] = _spill(
+                        spill_dir,
+                        "%s_%d" % (name, max_itemset),
+                        level_dict[max_itemset],
+                    )
+
+        res_df = _itemsets_to_frame(
+            itemset_dict,
+            support_dict,
+            df.columns if use_colnames else None,
+            compact,
+        )
+    finally:
+        if spill_dir is not None:
+            itemset_dict.clear()
+            support_dict.clear()
+            shutil.rmtree(spill_dir, ignore_errors=True)
+
+    if verbose:
+        print()  # adds newline if verbose counter was used
+
+    return res_df
+
+
+def apriori_streaming(
+    chunks,
+    min_support=0.5,
+    use_colnames=False,
+    max_len=None,
+    columns=None,
+    verbose=0,
+    compact=False,
+):
+    """Get frequent itemsets from transactions that are read in chunks
+
+    The transactions are never held in memory at once. Instead, the
+    chunks are iterated over once per itemset size: the first pass
+    counts the support of the single items, and each following pass
+    counts the support of the candidate itemsets that are one item
+    larger than the frequent itemsets of the previous pass.
+
+    Parameters
+    -----------
+    chunks : iterable or callable
+      Chunks of transactions. Since the chunks are read several times,
+      `chunks` must either be an iterable that can be iterated over
+      repeatedly (e.g., a list of file-backed arrays), or a callable
+      without arguments that returns a new iterator over the chunks
+      (e.g., a function that reads a file chunk by chunk).
+      Each chunk is either
+
+      - a one-hot pandas DataFrame, as accepted by `apriori`,
+      - a one-hot NumPy array or SciPy sparse matrix, such as
+        the output of `TransactionEncoder.transform`,
+      - a list of transactions, where each transaction is a list
+        of items.
+
+      All chunks must use the same columns.
+
+    min_support : float (default: 0.5)
+      A float between 0 and 1 for minumum support of the itemsets returned.
+      The support is computed as the fraction
+      `transactions_where_item(s)_occur / total_transactions`,
+      where `total_transactions` is the number of transactions
+      in all chunks.
+
+    use_colnames : bool (default: False)
+      If `True`, uses the column names in the returned DataFrame
+      instead of column indices.
+
+    max_len : int (default: None)
+      Maximum length of the itemsets generated. If `None` (default) all
+      possible itemsets lengths (under the apriori condition) are evaluated.
+
+    columns : list (default: None)
+      Column names of the one-hot chunks, or the items to consider
+      if the chunks are lists of transactions. If `None`, the column
+      names of DataFrame chunks or column indices are used for one-hot
+      chunks, and the sorted unique items of all transactions
+      (as in `TransactionEncoder`) for lists of transactions.
+
+    verbose : int (default: 0)
+      Shows the number of combinations if >= 1.
+
+    compact : bool (default: False)
+      If `True`, returns a `CompactItemsets` object that stores the
+      itemsets as flat NumPy arrays of item ids instead of a DataFrame
+      of frozensets. It can be passed to `association_rules` directly
+      and converted into the DataFrame via its `to_frame` method.
+
+    Returns
+    -----------
+    pandas DataFrame with columns ['support', 'itemsets'] of all itemsets
+      that are >= `min_support` and < than `max_len`
+      (if `max_len` is not None), as returned by `apriori`.
+
+    Examples
+    -----------
+    For usage examples, please see
+    http://rasbt.github.io/mlxtend/user_guide/frequent_patterns/apriori/
+
+    """
+    if min_support <= 0.0:
+        raise ValueError(
+            "`min_support` must be a positive "
+            "number within the interval `(0, 1]`. "
+            "Got %s." % min_support
+        )
+
+    if not callable(chunks) and iter(chunks) is chunks:
+        raise ValueError(
+            "`chunks` is an iterator that can only be read once. Please "
+            "provide a list of chunks or a function returning a new iterator."
+        )
+
+    def _iter_chunks():
+        return chunks() if callable(chunks) else iter(chunks)
+
+    # First pass: number of transactions, support of each item
+    # and, for lists of transactions, the item vocabulary
+    rows_count = 0
+    item_counts = None
+    has_lists = False
+    vocabulary = set()
+    for chunk in _iter_chunks():
+        if isinstance(chunk, list):
+            has_lists = True
+            for transaction in chunk:
+                vocabulary.update(transaction)
+            rows_count += len(chunk)
+            continue
+        X, _, chunk_columns = _chunk_to_matrix(chunk, None)
+        if columns is None:
+            columns = chunk_columns
+        counts = np.array(np.sum(X != 0, axis=0)).reshape(-1)
+        item_counts = counts if item_counts is None else item_counts + counts
+        rows_count += X.shape[0]
+
+    if columns is None:
+        if has_lists:
+            columns = sorted(vocabulary)
+        else:
+            columns = range(0 if item_counts is None else len(item_counts))
+    columns = list(columns)
+    mapping = {item: idx for idx, item in enumerate(columns)}
+    if has_lists:
+        # the support of the items in lists of transactions is
+        # only counted once the column of each item is known
+        item_counts = _count_candidates(
+            _iter_chunks(), mapping, np.arange(len(columns)).reshape(-1, 1)
+        )
+
+    if rows_count == 0:
+        if compact:
+            return fpc.CompactItemsets.from_lengths([], [], [])
+        return pd.DataFrame([], columns=["support", "itemsets"])
+
+    support = item_counts / float(rows_count)
+    ary_col_idx = np.arange(len(columns))
+    support_dict = {1: support[support >= min_support]}
+    itemset_dict = {1: ary_col_idx[support >= min_support].reshape(-1, 1)}
+    max_itemset = 1
+
+    while max_itemset < (max_len or float("inf")):
+        next_max_itemset = max_itemset + 1
+        combin = generate_candidates(itemset_dict[max_itemset])
+
+        if combin.size == 0:
+            break
+        if verbose:
+            print(
+                "\rProcessing %d combinations | Sampling itemset size %d"
+                % (combin.size, next_max_itemset),
+                end="",
+            )
+
+        support = _count_candidates(_iter_chunks(), mapping, combin) / rows_count
+        _mask = support >= min_support
+        if not _mask.any():
+            break
+        itemset_dict[next_max_itemset] = combin[_mask]
+        support_dict[next_max_itemset] = support[_mask]
+        max_itemset = next_max_itemset
+
+    res_df = _itemsets_to_frame(
+        itemset_dict, support_dict, columns if use_colnames else None, compact
+    )
+
+    if verbose:
+        print()  # adds newline if verbose counter was used
+
+    return res_df
+
+
+def _check_memory(max_memory, fixed_bytes, n_candidates, itemset_size, per_candidate):
+    """Returns the number of candidates that can be counted at once within
+    `max_memory`, or raises a MemoryError if not even one of them fits"""
+    # the candidates, their supports and the support mask are stored
+    stored_bytes = n_candidates * (itemset_size * 8 + 9)
+    available = max_memory - fixed_bytes - stored_bytes
+    if n_candidates and available < max(per_candidate, 1):
+        needed = fixed_bytes + stored_bytes + per_candidate
+        raise MemoryError(
+            "Counting the %d candidate itemsets of size %d needs an estimated "
+            "%d bytes, which exceeds `max_memory` (%d bytes). Increase "
+            "`min_support` or `max_memory`, or set `max_len`."
+            % (n_candidates, itemset_size, needed, max_memory)
+        )
+    if per_candidate == 0:
+        return max(n_candidates, 1)
+    return max(1, int(available // per_candidate))
+
+
+def _spill(spill_dir, name, array):
+    """Writes `array` to a .npy file in `spill_dir` and returns it
+    memory-mapped (read-only)"""
+    path = os.path.join(spill_dir, name + ".npy")
+    np.save(path, array)
+    return np.load(path, mmap_mode="r")
+
+
+def _chunk_to_matrix(chunk, mapping):
+    """Converts a chunk of transactions into a one-hot matrix
+
+    Returns
+    -----------
+    (X, is_sparse, columns), where columns are the column names of
+    a DataFrame chunk, or None.
+
+    """
+    if isinstance(chunk, list):
+        indices = []
+        indptr = [0]
+        for transaction in chunk:
+            indices.extend(sorted({mapping[i] for i in transaction if i in mapping}))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=bool)
+        X = csr_matrix((data, indices, indptr), shape=(len(chunk), len(mapping)))
+        return X, True, None
+
+    if isinstance(chunk, pd.DataFrame):
+        fpc.valid_input_check(chunk)
+        if hasattr(chunk, "sparse") and chunk.size > 0:
+            return chunk.sparse.to_coo().tocsc(), True, list(chunk.columns)
+        return chunk.values, False, list(chunk.columns)
+
+    if issparse(chunk):
+        return chunk.tocsc(), True, None
+    return np.asarray(chunk), False, None
+
+
+def _count_candidates(chunks, mapping, combin):
+    """Counts the transactions containing each candidate over all chunks"""
+    # only the columns that occur in a candidate are packed
+    items = np.unique(combin)
+    local_combin = np.searchsorted(items, combin)
+    counts = np.zeros(combin.shape[0], dtype=np.int64)
+    for chunk in chunks:
+        X, is_sparse, _ = _chunk_to_matrix(chunk, mapping)
+        packed = fpc.pack_columns(X[:, items], is_sparse)
+        counts += bitset_support_counts(packed, local_combin)
+    return counts
+
+
+def _itemsets_to_frame(itemset_dict, support_dict, colnames, compact=False):
+    """Collects the itemsets of all sizes into a DataFrame
+
+    Parameters
+    -----------
+    itemset_dict : dict
+      Maps the itemset size `k` to an array of shape (n_itemsets, k)
+      of column indices.
+
+    support_dict : dict
+      Maps the itemset size `k` to an array of shape (n_itemsets,)
+      of supports.
+
+    colnames : list or None
+      If not None, the column indices are replaced by these names.
+
+    compact : bool (default: False)
+      If `True`, returns a `CompactItemsets` object instead.
+
+    Returns
+    -----------
+    pandas DataFrame with columns ['support', 'itemsets']
+
+    """
+    if compact:
+        sizes = sorted(itemset_dict)
+        lengths = [np.full(len(itemset_dict[k]), k) for k in sizes]
+        item_ids = [np.asarray(itemset_dict[k]).reshape(-1) for k in sizes]
+        return fpc.CompactItemsets.from_lengths(
+            np.concatenate(lengths),
+            np.concatenate(item_ids),
+            np.concatenate([support_dict[k] for k in sizes]),
+            colnames,
+        )
 
     all_res = []
     for k in sorted(itemset_dict):
@@ -328,14 +1076,10 @@ def apriori(
 
     res_df = pd.concat(all_res)
     res_df.columns = ["support", "itemsets"]
-    if use_colnames:
-        mapping = {idx: item for idx, item in enumerate(df.columns)}
+    if colnames is not None:
+        mapping = {idx: item for idx, item in enumerate(colnames)}
         res_df["itemsets"] = res_df["itemsets"].apply(
             lambda x: frozenset([mapping[i] for i in x])
         )
     res_df = res_df.reset_index(drop=True)
-
-    if verbose:
-        print()  # adds newline if verbose counter was used
-
     return res_df
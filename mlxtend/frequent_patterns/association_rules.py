@@ -13,6 +13,8 @@ from itertools import combinations
 import numpy as np
 import pandas as pd
 
+from ..frequent_patterns import fpcommon as fpc
+
 
 def association_rules(df, metric="confidence", min_threshold=0.8, support_only=False):
     """Generates a DataFrame of association rules including the
@@ -20,9 +22,10 @@ def association_rules(df, metric="confidence", min_threshold=0.8, support_only=F
 
     Parameters
     -----------
-    df : pandas DataFrame
+    df : pandas DataFrame or CompactItemsets
       pandas DataFrame of frequent itemsets
-      with columns ['support', 'itemsets']
+      with columns ['support', 'itemsets'], or the frequent itemsets
+      returned by the frequent pattern miners with `compact=True`
 
     metric : string (default: 'confidence')
       Metric to evaluate if a rule is of interest.
@@ -76,13 +79,15 @@ def association_rules(df, metric="confidence", min_threshold=0.8, support_only=F
     http://rasbt.github.io/mlxtend/user_guide/frequent_patterns/association_rules/
 
     """
-    if not df.shape[0]:
+    if not len(df):
         raise ValueError(
             "The input DataFrame `df` containing " "the frequent itemsets is empty."
         )
 
     # check for mandatory columns
-    if not all(col in df.columns for col in ["support", "itemsets"]):
+    if not isinstance(df, fpc.CompactItemsets) and not all(
+        col in df.columns for col in ["support", "itemsets"]
+    ):
         raise ValueError(
             "Dataframe needs to contain the\
                          columns 'support' and 'itemsets'"
@@ -134,65 +139,140 @@ def association_rules(df, metric="confidence", min_threshold=0.8, support_only=F
                 "Metric must be 'confidence' or 'lift', got '{}'".format(metric)
             )
 
-    # get dict of {frequent itemset} -> support
-    keys = df["itemsets"].values
-    values = df["support"].values
-    frozenset_vect = np.vectorize(lambda x: frozenset(x))
-    frequent_items_dict = dict(zip(frozenset_vect(keys), values))
+    # encode the itemsets as sorted integer item ids, so that the
+    # rules of all itemsets of the same size can be generated at once
+    if not isinstance(df, fpc.CompactItemsets):
+        df = fpc.CompactItemsets.from_frame(df)
+    offsets, item_ids, supports, items = df.offsets, df.item_ids, df.support, df.items
+    lengths = np.diff(offsets)
+    lookup_tables = {}
+    if not support_only:
+        for k in np.unique(lengths):
+            rows = np.nonzero(lengths == k)[0]
+            keys = fpc.itemset_keys(
+                item_ids[offsets[rows, None] + np.arange(k)], len(items)
+            )
+            order = np.argsort(keys)
+            lookup_tables[k] = (keys[order], supports[rows][order])
+
+    def lookup_support(itemsets):
+        keys = fpc.itemset_keys(itemsets, len(items))
+        found = np.zeros(len(keys), dtype=bool)
+        pos = np.zeros(len(keys), dtype=np.int64)
+        if itemsets.shape[1] in lookup_tables:
+            table_keys, table_supports = lookup_tables[itemsets.shape[1]]
+            pos = np.searchsorted(table_keys, keys)
+            pos[pos == len(table_keys)] = 0
+            found = table_keys[pos] == keys
+        if not found.all():
+            missing = frozenset(items[i] for i in itemsets[np.argmin(found)])
+            s = (
+                str(KeyError(missing)) + "You are likely getting this error"
+                " because the DataFrame is missing "
+                " antecedent and/or consequent "
+                " information."
+                " You can try using the "
+                " `support_only=True` option"
+            )
+            raise KeyError(s)
+        return table_supports[pos]
 
     # prepare buckets to collect frequent rules
     rule_antecedents = []
     rule_consequents = []
     rule_supports = []
+    rule_order = []
+
+    # confidence is anti-monotone in the consequent: if X -> Y fails
+    # the threshold, so does every rule with a consequent larger than Y
+    # derived from the same itemset. Consequents are hence grown by one
+    # item at a time, and only from consequents that passed (ap-genrules).
+    prune = metric == "confidence" and not support_only
 
-    # iterate over all frequent itemsets
-    for k in frequent_items_dict.keys():
-        sAC = frequent_items_dict[k]
+    # iterate over all frequent itemsets of the same size at once
+    for k in np.unique(lengths):
+        rows = np.nonzero(lengths == k)[0]
+        itemsets = item_ids[offsets[rows, None] + np.arange(k)]
+        passed = None
+        prev_cons_pos = None
         # to find all possible combinations
-        for idx in range(len(k) - 1, 0, -1):
+        for idx in range(k - 1, 0, -1):
             # of antecedent and consequent
-            for c in combinations(k, r=idx):
-                antecedent = frozenset(c)
-                consequent = k.difference(antecedent)
-
-                if support_only:
-                    # support doesn't need these,
-                    # hence, placeholders should suffice
-                    sA = None
-                    sC = None
-
-                else:
-                    try:
-                        sA = frequent_items_dict[antecedent]
-                        sC = frequent_items_dict[consequent]
-                    except KeyError as e:
-                        s = (
-                            str(e) + "You are likely getting this error"
-                            " because the DataFrame is missing "
-                            " antecedent and/or consequent "
-                            " information."
-                            " You can try using the "
-                            " `support_only=True` option"
-                        )
-                        raise KeyError(s)
-                    # check for the threshold
-
-                score = metric_dict[metric](sAC, sA, sC)
-                if score >= min_threshold:
-                    rule_antecedents.append(antecedent)
-                    rule_consequents.append(consequent)
-                    rule_supports.append([sAC, sA, sC])
+            ant_pos = np.array(list(combinations(range(k), r=idx)))
+            cons_pos = np.array([[i for i in range(k) if i not in c] for c in ant_pos])
+            n_splits = len(ant_pos)
+
+            if prune and passed is not None:
+                # a rule is only a candidate if all rules whose consequent
+                # is one item smaller (and from the same itemset) passed
+                prev_index = {tuple(c): j for j, c in enumerate(prev_cons_pos)}
+                subsets = np.array(
+                    [
+                        [prev_index[c] for c in combinations(cons, len(cons) - 1)]
+                        for cons in cons_pos
+                    ]
+                )
+                candidates = np.nonzero(passed[:, subsets].all(axis=2).reshape(-1))[0]
+            else:
+                candidates = np.arange(len(rows) * n_splits)
+            itemset_idx = candidates // n_splits
+            split_idx = candidates % n_splits
+            antecedents = itemsets[itemset_idx[:, None], ant_pos[split_idx]]
+            consequents = itemsets[itemset_idx[:, None], cons_pos[split_idx]]
+            sAC = supports[rows][itemset_idx]
+
+            if support_only:
+                # support doesn't need these,
+                # hence, placeholders should suffice
+                sA = np.full(sAC.shape, np.nan)
+                sC = np.full(sAC.shape, np.nan)
+            else:
+                sA = lookup_support(antecedents)
+                sC = lookup_support(consequents)
+
+            # check for the threshold
+            score = metric_dict[metric](sAC, sA, sC)
+            keep = np.nonzero(score >= min_threshold)[0]
+            rule_antecedents.extend(map(frozenset, items[antecedents[keep]].tolist()))
+            rule_consequents.extend(map(frozenset, items[consequents[keep]].tolist()))
+            rule_supports.append(np.array([sAC[keep], sA[keep], sC[keep]]))
+            # rules are sorted by itemset in the order of the input, then
+            # from the largest to the smallest antecedent, and then by the
+            # item ids of the antecedent (not by the iteration order of the
+            # frozensets, which the rules of an itemset followed before)
+            rule_order.append(
+                np.array(
+                    [
+                        rows[itemset_idx[keep]],
+                        np.full(len(keep), k - idx),
+                        split_idx[keep],
+                    ]
+                )
+            )
+
+            if prune:
+                passed = np.zeros(len(rows) * n_splits, dtype=bool)
+                passed[candidates[keep]] = True
+                passed = passed.reshape(len(rows), n_splits)
+                prev_cons_pos = [tuple(c) for c in cons_pos]
+                if not passed.any():
+                    break
 
     # check if frequent rule was generated
-    if not rule_supports:
+    if not rule_antecedents:
         return pd.DataFrame(columns=["antecedents", "consequents"] + columns_ordered)
 
     else:
         # generate metrics
-        rule_supports = np.array(rule_supports).T.astype(float)
+        rule_supports = np.concatenate(rule_supports, axis=1).astype(float)
+        rule_order = np.concatenate(rule_order, axis=1)
+        order = np.lexsort(rule_order[::-1])
+        rule_supports = rule_supports[:, order]
         df_res = pd.DataFrame(
-            data=list(zip(rule_antecedents, rule_consequents)),
-            columns=["antecedents", "consequents"],
+            {
+                "antecedents": np.array(rule_antecedents, dtype=object)[order],
+                "consequents": np.array(rule_consequents, dtype=object)[order],
+            }
         )
 
         if support_only:
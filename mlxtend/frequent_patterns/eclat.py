@@ -0,0 +1,199 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# Eclat algorithm for mining frequent itemsets
+#
+# License: BSD 3 clause
+
+import math
+
+import numpy as np
+
+from ..frequent_patterns import fpcommon as fpc
+
+
+def eclat(
+    df, min_support=0.5, use_colnames=False, max_len=None, verbose=0, compact=False
+):
+    """Get frequent itemsets from a one-hot DataFrame
+
+    Eclat mines the itemsets depth-first on the vertical data layout:
+    every item is represented by the set of transactions (TID-set)
+    it occurs in, stored as a packed bit vector, and the support of
+    an itemset is obtained by intersecting the TID-sets of its items.
+    This makes it well-suited for dense datasets, on which the
+    FP-trees of `fpgrowth` become large.
+
+    Parameters
+    -----------
+    df : pandas DataFrame
+      pandas DataFrame the encoded format. Also supports
+      DataFrames with sparse data; for more info, please
+      see (https://pandas.pydata.org/pandas-docs/stable/
+           user_guide/sparse.html#sparse-data-structures)
+
+      Please note that the old pandas SparseDataFrame format
+      is no longer supported in mlxtend >= 0.17.2.
+
+      The allowed values are either 0/1 or True/False.
+      For example,
+
+    ```
+           Apple  Bananas   Beer  Chicken   Milk   Rice
+        0   True    False   True     True  False   True
+        1   True    False   True    False  False   True
+        2   True    False   True    False  False  False
+        3   True     True  False    False  False  False
+        4  False    False   True     True   True   True
+        5  False    False   True    False   True   True
+        6  False    False   True    False   True  False
+        7   True     True  False    False  False  False
+    ```
+
+      `df` can also be the uint64 array of bit-packed transactions
+      returned by `TransactionEncoder.transform(X, packed=True)`. It is
+      converted into one TID-set per item once, and the itemsets hold
+      the indices into `TransactionEncoder.columns_`, so `use_colnames`
+      must be False.
+
+    min_support : float (default: 0.5)
+      A float between 0 and 1 for minimum support of the itemsets returned.
+      The support is computed as the fraction
+      transactions_where_item(s)_occur / total_transactions.
+
+    use_colnames : bool (default: False)
+      If true, uses the DataFrames' column names in the returned DataFrame
+      instead of column indices.
+
+    max_len : int (default: None)
+      Maximum length of the itemsets generated. If `None` (default) all
+      possible itemsets lengths are evaluated.
+
+    verbose : int (default: 0)
+      Shows the number of itemsets found for each prefix.
+
+    compact : bool (default: False)
+      If `True`, returns a `CompactItemsets` object that stores the
+      itemsets as flat NumPy arrays of item ids instead of a DataFrame
+      of frozensets. It can be passed to `association_rules` directly
+      and converted into the DataFrame via its `to_frame` method.
+
+    Returns
+    -----------
+    pandas DataFrame with columns ['support', 'itemsets'] of all itemsets
+      that are >= `min_support` and < than `max_len`
+      (if `max_len` is not None).
+      Each itemset in the 'itemsets' column is of type `frozenset`,
+      which is a Python built-in type that behaves similarly to
+      sets except that it is immutable
+      (For more info, see
+      https://docs.python.org/3.6/library/stdtypes.html#frozenset).
+
+    Examples
+    ----------
+    For usage examples, please see
+    http://rasbt.github.io/mlxtend/user_guide/frequent_patterns/eclat/
+
+    """
+    is_packed = isinstance(df, np.ndarray)
+    if is_packed:
+        fpc.valid_packed_check(df, use_colnames)
+    else:
+        fpc.valid_input_check(df)
+
+    if min_support <= 0.0:
+        raise ValueError(
+            "`min_support` must be a positive "
+            "number within the interval `(0, 1]`. "
+            "Got %s." % min_support
+        )
+
+    colname_map = None
+    if use_colnames:
+        colname_map = {idx: item for idx, item in enumerate(df.columns)}
+
+    if is_packed:
+        tidsets = fpc.unpack_transactions(df)
+    elif hasattr(df, "sparse") and df.size > 0:
+        # DataFrame with SparseArray (pandas >= 0.24)
+        tidsets = fpc.pack_columns(df.sparse.to_coo().tocsc(), is_sparse=True)
+    else:
+        tidsets = fpc.pack_columns(df.values, is_sparse=False)
+
+    minsup = math.ceil(min_support * len(df))  # min support as count
+    if is_packed:
+        # the items padding the last word must not be frequent
+        minsup = max(minsup, 1)
+    supports = fpc.popcount(tidsets)
+    items = np.nonzero(supports >= minsup)[0]
+
+    # Extending items in the order of increasing support keeps
+    # the intermediate TID-sets small
+    items = items[supports[items].argsort(kind="stable")]
+    generator = eclat_step(
+        [],
+        items,
+        tidsets[items],
+        supports[items],
+        minsup,
+        colname_map,
+        max_len,
+        verbose,
+    )
+
+    return fpc.generate_itemsets(generator, len(df), colname_map, compact)
+
+
+def eclat_step(prefix, items, tidsets, supports, minsup, colnames, max_len, verbose):
+    """
+    Performs a recursive step of the eclat algorithm.
+
+    Parameters
+    ----------
+    prefix : list
+        Items shared by all itemsets of the current equivalence class.
+    items : np.array, shape = (n_items,)
+        Items that extend `prefix` to a frequent itemset.
+    tidsets : np.array, shape = (n_items, n_words), dtype = uint64
+        Packed TID-sets of `prefix` extended by each of `items`.
+    supports : np.array, shape = (n_items,)
+        Number of transactions in each of `tidsets`.
+    minsup : int
+
+    Yields
+    ------
+    lists of strings
+        Set of items that has occurred in minsup itemsets.
+    """
+    for i, item in enumerate(items):
+        itemset = prefix + [item]
+        yield supports[i], itemset
+
+        if (max_len and len(itemset) >= max_len) or i + 1 == len(items):
+            continue
+
+        # TID-sets of the equivalence class with prefix `itemset`
+        child_tidsets = tidsets[i + 1 :] & tidsets[i]
+        child_supports = fpc.popcount(child_tidsets)
+        mask = child_supports >= minsup
+        if mask.any():
+            for sup, iset in eclat_step(
+                itemset,
+                items[i + 1 :][mask],
+                child_tidsets[mask],
+                child_supports[mask],
+                minsup,
+                colnames,
+                max_len,
+                verbose,
+            ):
+                yield sup, iset
+
+    if verbose:
+        prefix_items = [str(i) for i in prefix]
+        if colnames:
+            prefix_items = [str(colnames[i]) for i in prefix]
+        print(
+            "\r%d itemset(s) with prefix (%s)" % (len(items), ", ".join(prefix_items)),
+            end="\n",
+        )
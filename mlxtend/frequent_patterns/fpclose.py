@@ -0,0 +1,325 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# FP-Close algorithm for mining closed frequent itemsets
+#
+# License: BSD 3 clause
+
+import collections
+import math
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from ..frequent_patterns import fpcommon as fpc
+
+
+def fpclose(
+    df,
+    min_support=0.5,
+    use_colnames=False,
+    max_len=None,
+    verbose=0,
+    n_jobs=1,
+    compact=False,
+):
+    """Get closed frequent itemsets from a one-hot DataFrame
+
+    An itemset is closed if none of its supersets has the same support.
+    The closed itemsets and their supports are a lossless representation
+    of all frequent itemsets: the support of any frequent itemset is the
+    highest support of the closed itemsets that contain it.
+
+    Parameters
+    -----------
+    df : pandas DataFrame
+      pandas DataFrame the encoded format. Also supports
+      DataFrames with sparse data; for more info, please
+      see (https://pandas.pydata.org/pandas-docs/stable/
+           user_guide/sparse.html#sparse-data-structures)
+
+      Please note that the old pandas SparseDataFrame format
+      is no longer supported in mlxtend >= 0.17.2.
+
+      The allowed values are either 0/1 or True/False.
+      For example,
+
+    ```
+           Apple  Bananas   Beer  Chicken   Milk   Rice
+        0   True    False   True     True  False   True
+        1   True    False   True    False  False   True
+        2   True    False   True    False  False  False
+        3   True     True  False    False  False  False
+        4  False    False   True     True   True   True
+        5  False    False   True    False   True   True
+        6  False    False   True    False   True  False
+        7   True     True  False    False  False  False
+    ```
+
+    min_support : float (default: 0.5)
+      A float between 0 and 1 for minimum support of the itemsets returned.
+      The support is computed as the fraction
+      transactions_where_item(s)_occur / total_transactions.
+
+    use_colnames : bool (default: False)
+      If true, uses the DataFrames' column names in the returned DataFrame
+      instead of column indices.
+
+    max_len : int (default: None)
+      Given the set of all closed itemsets,
+      return those that are less than `max_len`. If `None` (default) all
+      possible itemsets lengths are evaluated.
+
+    verbose : int (default: 0)
+      Shows the stages of conditional tree generation.
+
+    n_jobs : int (default: 1)
+      The number of CPUs to use for mining the conditional trees
+      of the frequent items in parallel. -1 means 'all CPUs'.
+      The returned itemsets do not depend on `n_jobs`.
+
+    compact : bool (default: False)
+      If `True`, returns a `CompactItemsets` object that stores the
+      itemsets as flat NumPy arrays of item ids instead of a DataFrame
+      of frozensets. It can be converted into the DataFrame via its
+      `to_frame` method.
+
+    Returns
+    -----------
+    pandas DataFrame with columns ['support', 'itemsets'] of all closed
+      itemsets that are >= `min_support` and < than `max_len`
+      (if `max_len` is not None).
+      Each itemset in the 'itemsets' column is of type `frozenset`,
+      which is a Python built-in type that behaves similarly to
+      sets except that it is immutable
+      (For more info, see
+      https://docs.python.org/3.6/library/stdtypes.html#frozenset).
+      The subsets of the closed itemsets are not included, so pass the
+      result through `expand_closed` before `association_rules`.
+
+    Examples
+    ----------
+    For usage examples, please see
+    http://rasbt.github.io/mlxtend/user_guide/frequent_patterns/fpclose/
+
+    """
+    fpc.valid_input_check(df)
+
+    if min_support <= 0.0:
+        raise ValueError(
+            "`min_support` must be a positive "
+            "number within the interval `(0, 1]`. "
+            "Got %s." % min_support
+        )
+
+    colname_map = None
+    if use_colnames:
+        colname_map = {idx: item for idx, item in enumerate(df.columns)}
+
+    tree, _ = fpc.setup_fptree(df, min_support)
+    minsup = math.ceil(min_support * len(df.index))  # min support as count
+    candidates = fpclose_step(tree, minsup, colname_map, verbose, n_jobs)
+
+    generator = (
+        (support, itemset)
+        for support, itemset in filter_closed(candidates)
+        if max_len is None or len(itemset) <= max_len
+    )
+    return fpc.generate_itemsets(generator, len(df.index), colname_map, compact)
+
+
+def expand_closed(df, max_len=None):
+    """Get all frequent itemsets and their supports from the closed itemsets
+
+    The support of a frequent itemset is the highest support of the
+    closed itemsets that contain it. Hence, all frequent itemsets, e.g.,
+    the antecedents and consequents needed by `association_rules`, can
+    be derived from the result of `fpclose` without another pass over
+    the transactions.
+
+    Parameters
+    -----------
+    df : pandas DataFrame or CompactItemsets
+      The closed itemsets with columns ['support', 'itemsets'], as
+      returned by `fpclose` without `max_len` (which would drop the
+      closed itemsets that determine the supports of some subsets).
+
+    max_len : int (default: None)
+      Maximum length of the itemsets returned. If `None` (default) all
+      frequent itemsets are returned.
+
+    Returns
+    -----------
+    pandas DataFrame with columns ['support', 'itemsets'] of all frequent
+      itemsets, i.e., all subsets of the closed itemsets, or a
+      `CompactItemsets` object if `df` is one. The itemsets and supports
+      are the same as those returned by `fpgrowth`, but ordered by
+      decreasing support.
+
+    Examples
+    -----------
+    For usage examples, please see
+    http://rasbt.github.io/mlxtend/user_guide/frequent_patterns/fpclose/
+
+    """
+    compact = isinstance(df, fpc.CompactItemsets)
+    if compact:
+        df = df.to_frame()
+
+    # Visiting the closed itemsets by decreasing support assigns every
+    # subset the support of the first closed itemset containing it. The
+    # subsets of an itemset that was already visited need not be visited
+    # again, since they are subsets of the same closed itemset.
+    supports = {}
+    order = np.argsort(-df["support"].values, kind="stable")
+    itemsets = df["itemsets"].values[order]
+    for support, closed in zip(df["support"].values[order], itemsets):
+        closed = frozenset(closed)
+        if closed in supports or not closed:
+            continue
+        supports[closed] = support
+        stack = [closed]
+        while stack:
+            itemset = stack.pop()
+            if len(itemset) == 1:
+                continue
+            for item in itemset:
+                subset = itemset - {item}
+                if subset not in supports:
+                    supports[subset] = support
+                    stack.append(subset)
+
+    res_df = pd.DataFrame(
+        {
+            "support": list(supports.values()),
+            "itemsets": list(supports.keys()),
+        },
+        columns=["support", "itemsets"],
+    )
+    if max_len is not None:
+        res_df = res_df[res_df["itemsets"].apply(len) <= max_len]
+    res_df = res_df.reset_index(drop=True)
+    if compact:
+        return fpc.CompactItemsets.from_frame(res_df)
+    return res_df
+
+
+def fpclose_step(tree, minsup, colnames, verbose, n_jobs=1):
+    """
+    Performs a recursive step of the fpclose algorithm.
+
+    Items that occur in every transaction of the tree are merged into
+    the conditioning itemset, which yields its closure within the tree.
+    The closures are candidates only: an itemset that is closed within
+    a conditional tree can have a superset with the same support that
+    contains items outside of the tree.
+
+    Parameters
+    ----------
+    tree : FPTree
+    minsup : int
+    n_jobs : int (default: 1)
+        Number of processes that mine the conditional trees
+        of this step. The recursive steps always run sequentially.
+
+    Yields
+    ------
+    support, itemset
+        Candidate closed itemset and its support count.
+    """
+    count = 0
+    root_count = tree.count[0]
+    if tree.is_path():
+        # The prefixes of the path that end before a drop in
+        # the count are the closures of all itemsets of the path
+        path = []
+        node = tree.first_child[0]
+        support = root_count
+        while node != -1:
+            if tree.count[node] < support and (tree.cond_items or path):
+                count += 1
+                yield support, tree.cond_items + path
+            path = path + [tree.item[node]]
+            support = tree.count[node]
+            node = tree.first_child[node]
+        if tree.cond_items or path:
+            count += 1
+            yield support, tree.cond_items + path
+        if verbose:
+            tree.print_status(count, colnames)
+        return
+
+    supports = {item: tree.count[tree.nodes[item]].sum() for item in tree.nodes}
+    full = [item for item in tree.nodes if supports[item] == root_count]
+    closure = tree.cond_items + full
+    if closure:
+        count += 1
+        yield root_count, closure
+
+    if verbose:
+        tree.print_status(count, colnames)
+
+    # The items in `full` are ranked above all other items, so they
+    # are part of the closure of every conditional tree of the others
+    items = [item for item in tree.nodes if supports[item] < root_count]
+    if n_jobs == 1:
+        for item in items:
+            cond_tree = tree.conditional_tree(item, minsup)
+            for support, itemset in fpclose_step(cond_tree, minsup, colnames, verbose):
+                yield support, itemset
+    else:
+        parallel = Parallel(n_jobs=n_jobs)
+        results = parallel(
+            delayed(_fpclose_collect)(
+                tree.conditional_tree(item, minsup), minsup, colnames, verbose
+            )
+            for item in items
+        )
+        for itemsets in results:
+            for support, itemset in itemsets:
+                yield support, itemset
+
+
+def _fpclose_collect(tree, minsup, colnames, verbose):
+    return list(fpclose_step(tree, minsup, colnames, verbose))
+
+
+def filter_closed(candidates):
+    """
+    Removes the duplicates and the itemsets that have a superset
+    with the same support from the candidates.
+
+    Parameters
+    ----------
+    candidates : iterable of (support, itemset)
+
+    Returns
+    -------
+    list of (support, itemset)
+        The closed itemsets, in the order of their first occurrence.
+    """
+    candidates = [(support, frozenset(itemset)) for support, itemset in candidates]
+    by_support = collections.defaultdict(set)
+    for support, itemset in candidates:
+        by_support[support].add(itemset)
+
+    closed = set()
+    for support, itemsets in by_support.items():
+        # Index the closed itemsets of equal support by their items to
+        # only compare a candidate with the itemsets sharing an item
+        containing = collections.defaultdict(list)
+        for itemset in sorted(itemsets, key=len, reverse=True):
+            item = min(itemset, key=lambda i: len(containing[i]))
+            if any(itemset < superset for superset in containing[item]):
+                continue
+            closed.add((support, itemset))
+            for i in itemset:
+                containing[i].append(itemset)
+
+    result = []
+    for candidate in candidates:
+        if candidate in closed:
+            closed.remove(candidate)
+            result.append(candidate)
+    return result
@@ -1,12 +1,21 @@
-import collections
+import sys
+import time
 from distutils.version import LooseVersion as Version
 
 import numpy as np
 import pandas as pd
 from pandas import __version__ as pandas_version
 
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
 
-def setup_fptree(df, min_support):
+# number of set bits for every possible byte value
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def setup_fptree(df, min_support, sample_weight=None):
     num_itemsets = len(df.index)  # number of itemsets in the database
 
     is_sparse = False
@@ -23,7 +32,11 @@ def setup_fptree(df, min_support):
 
     # support of each individual item
     # if itemsets is sparse, np.sum returns an np.matrix of shape (1, N)
-    item_support = np.array(np.sum(itemsets, axis=0) / float(num_itemsets))
+    if sample_weight is None:
+        item_support = np.array(np.sum(itemsets, axis=0) / float(num_itemsets))
+    else:
+        item_support = weighted_item_counts(itemsets, sample_weight)
+        item_support = item_support / sample_weight.sum()
     item_support = item_support.reshape(-1)
 
     items = np.nonzero(item_support >= min_support)[0]
@@ -39,27 +52,50 @@ def setup_fptree(df, min_support):
     # Building tree by inserting itemsets in sorted order
     # Heuristic for reducing tree size is inserting in order
     #   of most frequent to least frequent
+    if is_sparse:
+        # itemsets has been converted to CSR format to get the row and
+        # column of each non null element without densifying the matrix:
+        #  - itemsets.indices contains the column number of non null
+        #    elements, shape(#nnz,)
+        #  - itemsets.indptr[i] contains the offset in itemset.indices of
+        #    the first non null element in row i, shape(1+#nrows,)
+        rows = np.repeat(np.arange(num_itemsets), np.diff(itemsets.indptr))
+        cols = itemsets.indices
+    else:
+        rows, cols = np.nonzero(itemsets)
+
+    if sample_weight is None:
+        sample_weight = np.ones(num_itemsets, dtype=np.int64)
+
+    # Transactions that are identical after removing the infrequent
+    # items are inserted only once, with the sum of their counts
+    frequent = np.zeros(len(item_support), dtype=bool)
+    frequent[items] = True
+    keep = frequent[cols]
+    rows, cols, sample_weight = deduplicate_transactions(
+        rows[keep], cols[keep], sample_weight
+    )
+
     tree = FPTree(rank)
-    for i in range(num_itemsets):
-        if is_sparse:
-            # itemsets has been converted to CSR format to speed-up the line
-            # below.  It has 3 attributes:
-            #  - itemsets.data contains non null values, shape(#nnz,)
-            #  - itemsets.indices contains the column number of non null
-            #    elements, shape(#nnz,)
-            #  - itemsets.indptr[i] contains the offset in itemset.indices of
-            #    the first non null element in row i, shape(1+#nrows,)
-            nonnull = itemsets.indices[itemsets.indptr[i] : itemsets.indptr[i + 1]]
-        else:
-            nonnull = np.where(itemsets[i, :])[0]
-        itemset = [item for item in nonnull if item in rank]
-        itemset.sort(key=rank.get, reverse=True)
-        tree.insert_itemset(itemset)
+    tree.insert_transactions(rows, cols, sample_weight)
 
     return tree, rank
 
 
-def generate_itemsets(generator, num_itemsets, colname_map):
+def generate_itemsets(generator, num_itemsets, colname_map, compact=False):
+    if compact:
+        ids = []
+        lengths = []
+        supports = []
+        for sup, iset in generator:
+            ids.extend(iset)
+            lengths.append(len(iset))
+            supports.append(sup / num_itemsets)
+        items = None
+        if colname_map is not None:
+            items = [colname_map[i] for i in range(len(colname_map))]
+        return CompactItemsets.from_lengths(lengths, ids, supports, items)
+
     itemsets = []
     supports = []
     for sup, iset in generator:
@@ -76,6 +112,263 @@ def generate_itemsets(generator, num_itemsets, colname_map):
     return res_df
 
 
+def check_sample_weight(sample_weight, n_rows):
+    """
+    Validates the weights of the transactions.
+
+    Parameters
+    ----------
+    sample_weight : array-like, shape = (n_rows,) or None
+    n_rows : int
+        Number of transactions.
+
+    Returns
+    -------
+    None if `sample_weight` is None, otherwise
+    np.array, shape = (n_rows,), dtype = float
+    """
+    if sample_weight is None:
+        return None
+    sample_weight = np.asarray(sample_weight, dtype=float).reshape(-1)
+    if len(sample_weight) != n_rows:
+        raise ValueError(
+            "`sample_weight` must contain one weight per transaction. "
+            "Got %d weights for %d transactions." % (len(sample_weight), n_rows)
+        )
+    if not np.isfinite(sample_weight).all() or (sample_weight < 0).any():
+        raise ValueError("`sample_weight` must be non-negative and finite.")
+    return sample_weight
+
+
+def weighted_item_counts(X, sample_weight):
+    """
+    Sums the weights of the transactions that contain each item.
+
+    Parameters
+    ----------
+    X : np.array or scipy sparse matrix, shape = (n_rows, n_items)
+        Matrix with values 0/1 or True/False.
+    sample_weight : np.array, shape = (n_rows,)
+
+    Returns
+    -------
+    np.array, shape = (n_items,), dtype = float
+    """
+    if hasattr(X, "tocsc"):
+        X = X.tocsc()
+        weights = sample_weight[X.indices] * (X.data != 0)
+        cols = np.repeat(np.arange(X.shape[1]), np.diff(X.indptr))
+        return np.bincount(cols, weights=weights, minlength=X.shape[1])
+    return sample_weight @ (np.asarray(X) != 0)
+
+
+def deduplicate_transactions(rows, cols, counts):
+    """
+    Merges identical transactions into a single transaction.
+
+    The items of every transaction are hashed with two independent
+    polynomial hashes modulo 2**64. Transactions with equal hashes and
+    lengths are compared item by item before they are merged, so that
+    hash collisions never merge different transactions.
+
+    Parameters
+    ----------
+    rows : np.array, shape = (n_entries,)
+        Transaction index of every (transaction, item) entry.
+    cols : np.array, shape = (n_entries,)
+        Item of every (transaction, item) entry. A transaction must
+        not contain the same item twice.
+    counts : np.array, shape = (n_transactions,)
+        The number of occurrences of each transaction.
+
+    Returns
+    -------
+    rows, cols, counts
+        The entries and counts of the distinct transactions, in the
+        order of their first occurrence.
+    """
+    n_rows = len(counts)
+    if n_rows == 0:
+        return rows, cols, counts
+    order = np.lexsort((cols, rows))
+    rows, cols = rows[order], cols[order]
+    lengths = np.bincount(rows, minlength=n_rows)
+    starts = np.cumsum(lengths) - lengths
+    pos = np.arange(len(rows)) - starts[rows]
+
+    values = cols.astype(np.uint64) + np.uint64(1)
+    nonempty = lengths > 0
+    hashes = []
+    for base in (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F):
+        powers = np.cumprod(
+            np.full(max(lengths.max(), 1), base, dtype=np.uint64), dtype=np.uint64
+        )
+        h = np.zeros(n_rows, dtype=np.uint64)
+        if len(rows):
+            h[nonempty] = np.add.reduceat(values * powers[pos], starts[nonempty])
+        hashes.append(h)
+
+    # The first transaction of every group of equal hashes is its
+    # representative
+    by_hash = np.lexsort((np.arange(n_rows), hashes[1], hashes[0], lengths))
+    is_first = np.ones(n_rows, dtype=bool)
+    is_first[1:] = (
+        (np.diff(lengths[by_hash]) != 0)
+        | (np.diff(hashes[0][by_hash]) != 0)
+        | (np.diff(hashes[1][by_hash]) != 0)
+    )
+    group = np.cumsum(is_first) - 1
+    representative = np.empty(n_rows, dtype=np.int64)
+    representative[by_hash] = by_hash[is_first][group]
+
+    # Transactions that collide with their representative are kept
+    mismatch = cols != cols[starts[representative[rows]] + pos]
+    representative[rows[mismatch]] = rows[mismatch]
+
+    distinct = representative == np.arange(n_rows)
+    if distinct.all():
+        return rows, cols, counts
+    new_index = np.cumsum(distinct) - 1
+    merged = np.bincount(
+        new_index[representative], weights=counts, minlength=distinct.sum()
+    ).astype(counts.dtype)
+    keep = distinct[rows]
+    return new_index[rows[keep]], cols[keep], merged
+
+
+def pack_columns(X, is_sparse):
+    """
+    Packs every column of a binary matrix into a bit vector.
+
+    Parameters
+    ----------
+    X : np.array or scipy sparse matrix, shape = (n_rows, n_columns)
+        Matrix with values 0/1 or True/False.
+    is_sparse : bool
+        True if X is a scipy sparse matrix.
+
+    Returns
+    -------
+    packed : np.array, shape = (n_columns, ceil(n_rows / 64)), dtype = uint64
+        Row `j` holds the bits of column `j`, where transaction `i`
+        is stored in bit `i`. Padding bits are always 0.
+    """
+    n_rows, n_cols = X.shape
+    n_bytes = 8 * ((n_rows + 63) // 64)
+    packed = np.zeros((n_cols, n_bytes), dtype=np.uint8)
+    if is_sparse:
+        X = X.tocsc()
+        cols = np.repeat(np.arange(n_cols), np.diff(X.indptr))
+        nonzero = X.data != 0
+        rows = X.indices[nonzero]
+        cols = cols[nonzero]
+        bits = np.left_shift(1, 7 - (rows & 7)).astype(np.uint8)
+        np.bitwise_or.at(packed, (cols, rows >> 3), bits)
+    elif n_rows > 0:
+        bits = np.packbits(np.asarray(X, dtype=bool), axis=0)
+        packed[:, : bits.shape[0]] = bits.T
+    return packed.view(np.uint64)
+
+
+def unpack_transactions(packed):
+    """
+    Converts bit-packed transactions into the layout of `pack_columns`.
+
+    Parameters
+    ----------
+    packed : np.array, shape = (n_rows, n_words), dtype = uint64
+        Transactions as returned by `TransactionEncoder.transform` with
+        `packed=True`, where item `j` is stored in bit `j % 64` of
+        word `j // 64` of a row.
+
+    Returns
+    -------
+    packed : np.array, shape = (64 * n_words, ceil(n_rows / 64)), dtype = uint64
+        One bit vector per item, see `pack_columns`. The items that only
+        pad the last word never occur in a transaction.
+    """
+    n_rows, n_words = packed.shape
+    tidsets = np.zeros((64 * n_words, (n_rows + 63) // 64), dtype=np.uint64)
+    # unpack blocks of 64 * 128 transactions to bound the memory of the
+    # boolean matrix; blocks of a multiple of 64 rows fill whole words
+    block_size = 64 * 128
+    for start in range(0, n_rows, block_size):
+        block = np.ascontiguousarray(packed[start : start + block_size], "<u8")
+        X = np.unpackbits(block.view(np.uint8), axis=1, bitorder="little")
+        words = pack_columns(X, is_sparse=False)
+        tidsets[:, start // 64 : start // 64 + words.shape[1]] = words
+    return tidsets
+
+
+def popcount(words):
+    """
+    Counts the set bits in each row of a 2D uint64 array.
+
+    Parameters
+    ----------
+    words : np.array, shape = (n_bitsets, n_words), dtype = uint64
+
+    Returns
+    -------
+    np.array, shape = (n_bitsets,), dtype = int64
+    """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    words = np.ascontiguousarray(words)
+    return _POPCOUNT_TABLE[words.view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+
+def itemset_keys(itemsets, n_items=None):
+    """
+    Views each itemset of equal length as a single scalar key.
+
+    Keys can be sorted and searched with `np.searchsorted` to look up
+    many itemsets at once. Two itemsets have the same key if and only
+    if they contain the same item ids in the same order.
+
+    Parameters
+    ----------
+    itemsets : np.array, shape = (n_itemsets, itemset_size)
+        Integer item ids, one itemset per row, sorted within each row.
+    n_items : int (default: None)
+        Upper bound for the item ids. If given and small enough, the
+        keys are integers, which are faster to compare. Keys are only
+        comparable if they were created with the same `n_items`.
+
+    Returns
+    -------
+    np.array, shape = (n_itemsets,)
+    """
+    itemsets = np.ascontiguousarray(itemsets, dtype=np.int64)
+    size = itemsets.shape[1]
+    if n_items is not None and max(n_items, 1) ** size < 2**63:
+        keys = np.zeros(itemsets.shape[0], dtype=np.int64)
+        for j in range(size):
+            keys = keys * max(n_items, 1) + itemsets[:, j]
+        return keys
+    key_dtype = np.dtype((np.void, itemsets.dtype.itemsize * size))
+    return itemsets.view(key_dtype).reshape(-1)
+
+
+def valid_packed_check(packed, use_colnames):
+    if not isinstance(packed, np.ndarray) or packed.ndim != 2:
+        raise ValueError(
+            "Bit-packed transactions must be a 2D array. Got an array "
+            "with %d dimensions." % np.ndim(packed)
+        )
+    if packed.dtype != np.uint64:
+        raise ValueError(
+            "Bit-packed transactions must be of type uint64, as returned by "
+            "`TransactionEncoder.transform(X, packed=True)`. Got %s." % packed.dtype
+        )
+    if use_colnames:
+        raise ValueError(
+            "`use_colnames=True` is not supported for bit-packed transactions, "
+            "which do not store the column names. The item ids of the "
+            "itemsets are the indices into `TransactionEncoder.columns_`."
+        )
+
+
 def valid_input_check(df):
 
     if f"{type(df)}" == "<class 'pandas.core.frame.SparseDataFrame'>":
@@ -124,12 +417,253 @@ def valid_input_check(df):
             raise ValueError(s)
 
 
+def peak_memory():
+    """
+    Returns the peak resident set size of the current process in bytes,
+    or None if it is not available on this platform.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+def check_callback(callback):
+    if callback is not None and not callable(callback):
+        raise ValueError("`callback` must be callable. Got %s." % callback)
+
+
+class EventLog(object):
+    """
+    Passes the progress events of a miner to the user's callback.
+
+    Every event is a dict with the keys 'algorithm', 'event', the
+    event-specific fields, 'time' (seconds since the miner started)
+    and 'peak_memory' (peak resident set size in bytes of the process
+    that emitted the event). The log of a worker process records its
+    events instead, so that they can be replayed by the main process.
+
+    Parameters
+    ----------
+    algorithm : str
+    callback : callable or None
+    colnames : dict or None
+        Maps the item ids to the column names.
+    """
+
+    def __init__(self, algorithm, callback, colnames=None, start=None):
+        self.algorithm = algorithm
+        self.callback = callback
+        self.colnames = colnames
+        self.start = time.time() if start is None else start
+        self.records = None
+
+    def emit(self, event, **fields):
+        record = {"algorithm": self.algorithm, "event": event}
+        record.update(fields)
+        record["time"] = time.time() - self.start
+        record["peak_memory"] = peak_memory()
+        if self.records is not None:
+            self.records.append(record)
+        else:
+            self.callback(record)
+
+    def tree(self, tree, n_itemsets):
+        """Emits the size of an FP-tree and the number of itemsets it yielded"""
+        cond_items = list(tree.cond_items)
+        if self.colnames:
+            cond_items = [self.colnames[i] for i in cond_items]
+        self.emit(
+            "conditional_tree" if cond_items else "tree",
+            cond_items=cond_items,
+            n_nodes=len(tree.item) - 1,
+            n_items=len(tree.nodes),
+            n_itemsets=n_itemsets,
+        )
+
+    def worker(self):
+        """Returns a log that records the events of a worker process"""
+        log = EventLog(self.algorithm, None, self.colnames, self.start)
+        log.records = []
+        return log
+
+    def replay(self, records):
+        for record in records:
+            self.callback(record)
+
+
+class MiningStats(object):
+    """
+    Collects the progress events of the frequent pattern miners.
+
+    Pass an instance as the `callback` of `apriori`, `fpgrowth` or
+    `fpmax` to record an event per candidate level (apriori) or per
+    mined FP-tree (fpgrowth and fpmax). Any other callable that accepts
+    the event dicts can be used as `callback` instead, e.g., to export
+    the events to a metrics system.
+
+    Attributes
+    ----------
+    events_ : list of dict
+        The events in the order they were emitted. Every event has the
+        keys 'algorithm', 'event', 'time' (seconds since the miner
+        started) and 'peak_memory' (peak resident set size in bytes, or
+        None if not available). Level events of apriori ('level') have
+        the keys 'level', 'n_candidates' and 'n_frequent'. Tree events
+        ('tree' for the initial FP-tree, 'conditional_tree' otherwise)
+        have the keys 'cond_items', 'n_nodes', 'n_items' and
+        'n_itemsets'.
+
+    Examples
+    ----------
+    For usage examples, please see
+    http://rasbt.github.io/mlxtend/user_guide/frequent_patterns/MiningStats/
+    """
+
+    def __init__(self):
+        self.events_ = []
+
+    def __call__(self, event):
+        self.events_.append(event)
+
+    def __len__(self):
+        return len(self.events_)
+
+    @property
+    def total_time_(self):
+        """Seconds from the start of the miner to its last event"""
+        return max([e["time"] for e in self.events_], default=0.0)
+
+    @property
+    def peak_memory_(self):
+        """Highest peak resident set size of all events in bytes"""
+        peaks = [e["peak_memory"] for e in self.events_ if e["peak_memory"]]
+        return max(peaks, default=None)
+
+    def to_frame(self):
+        """Returns the events as a DataFrame with one row per event"""
+        return pd.DataFrame(self.events_)
+
+
+class CompactItemsets(object):
+    """
+    Frequent itemsets stored in flat NumPy arrays.
+
+    The item ids of itemset `i` are `item_ids[offsets[i]:offsets[i + 1]]`
+    in ascending order, and its support is `support[i]`. The item with
+    id `j` is `items[j]`, i.e., a column index or a column name of the
+    one-hot DataFrame. Unlike the DataFrame of frozensets returned by
+    the miners by default, this needs a few bytes per item only, and it
+    can be passed to `association_rules` directly.
+
+    Parameters
+    ----------
+    offsets : np.array, shape = (n_itemsets + 1,)
+    item_ids : np.array, shape = (n_items_total,)
+    support : np.array, shape = (n_itemsets,)
+    items : np.array, shape = (n_distinct_items,)
+    """
+
+    def __init__(self, offsets, item_ids, support, items):
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.item_ids = np.asarray(item_ids, dtype=np.int64)
+        self.support = np.asarray(support, dtype=float)
+        self.items = np.asarray(items)
+
+    def __len__(self):
+        return len(self.support)
+
+    @property
+    def lengths(self):
+        """Number of items of each itemset"""
+        return np.diff(self.offsets)
+
+    @classmethod
+    def from_lengths(cls, lengths, item_ids, support, items=None):
+        """
+        Creates the itemsets from the concatenated item ids and the
+        number of items of each itemset, sorting the ids of each itemset.
+
+        If `items` is None, the item ids are used as the items.
+        """
+        lengths = np.asarray(lengths, dtype=np.int64)
+        item_ids = np.asarray(item_ids, dtype=np.int64).reshape(-1)
+        owner = np.repeat(np.arange(len(lengths)), lengths)
+        item_ids = item_ids[np.lexsort((item_ids, owner))]
+        offsets = np.append(0, np.cumsum(lengths))
+        if items is None:
+            items = np.arange(item_ids.max() + 1 if len(item_ids) else 0)
+        else:
+            # assigned one by one, since items can be tuples
+            item_array = np.empty(len(items), dtype=object)
+            for i, item in enumerate(items):
+                item_array[i] = item
+            items = item_array
+        return cls(offsets, item_ids, support, items)
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Encodes a DataFrame with columns ['support', 'itemsets'].
+
+        If an itemset occurs several times, the last occurrence is kept.
+        """
+        frequent_items_dict = dict(
+            zip((frozenset(x) for x in df["itemsets"].values), df["support"].values)
+        )
+        vocabulary = {}
+        item_ids = []
+        lengths = []
+        for itemset in frequent_items_dict:
+            item_ids.extend(
+                vocabulary.setdefault(item, len(vocabulary)) for item in itemset
+            )
+            lengths.append(len(itemset))
+        return cls.from_lengths(
+            lengths, item_ids, list(frequent_items_dict.values()), list(vocabulary)
+        )
+
+    def to_frame(self):
+        """
+        Returns the itemsets as a DataFrame with columns
+        ['support', 'itemsets'], as returned by the miners by default.
+        """
+        itemsets = [
+            frozenset(x.tolist())
+            for x in np.split(self.items[self.item_ids], self.offsets[1:-1])
+        ]
+        if not len(self):
+            itemsets = []
+        return pd.DataFrame({"support": self.support, "itemsets": itemsets})
+
+
 class FPTree(object):
+    """
+    FP-tree stored as parallel NumPy arrays.
+
+    Node 0 is the root; for every node `i`, `item[i]`, `count[i]` and
+    `parent[i]` hold its item, count and parent node. The children of a
+    node are stored contiguously and can be traversed via `first_child`
+    and `next_sibling` (-1 marks the end of a list). The header table
+    `nodes` maps every item to the array of nodes that hold it.
+    """
+
     def __init__(self, rank=None):
-        self.root = FPNode(None)
-        self.nodes = collections.defaultdict(list)
+        self.item = np.array([-1], dtype=np.int64)
+        self.count = np.zeros(1, dtype=np.int64)
+        self.parent = np.array([-1], dtype=np.int64)
+        self.first_child = np.array([-1], dtype=np.int64)
+        self.next_sibling = np.array([-1], dtype=np.int64)
+        self.nodes = {}
         self.cond_items = []
         self.rank = rank
+        self._is_path = True
+
+        # items ordered by rank, i.e. from least to most frequent
+        self._items_by_rank = np.array(
+            sorted(rank, key=rank.get) if rank else [], dtype=np.int64
+        )
 
     def conditional_tree(self, cond_item, minsup):
         """
@@ -146,72 +680,151 @@ class FPTree(object):
         -------
         cond_tree : FPtree
         """
-        # Find all path from root node to nodes for item
-        branches = []
-        count = collections.defaultdict(int)
-        for node in self.nodes[cond_item]:
-            branch = node.itempath_from_root()
-            branches.append(branch)
-            for item in branch:
-                count[item] += node.count
+        # Find all path from root node to nodes for item by walking
+        # from all nodes for item towards the root at the same time
+        cond_nodes = self.nodes[cond_item]
+        counts = self.count[cond_nodes]
+        rows, items = [], []
+        branch = np.arange(len(cond_nodes))
+        node = self.parent[cond_nodes]
+        while True:
+            in_branch = node > 0
+            branch, node = branch[in_branch], node[in_branch]
+            if len(node) == 0:
+                break
+            rows.append(branch)
+            items.append(self.item[node])
+            node = self.parent[node]
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        items = np.concatenate(items) if items else np.zeros(0, dtype=np.int64)
 
         # Define new ordering or deep trees may have combinatorially explosion
-        items = [item for item in count if count[item] >= minsup]
-        items.sort(key=count.get)
-        rank = {item: i for i, item in enumerate(items)}
+        uniq, inverse = np.unique(items, return_inverse=True)
+        count = np.bincount(inverse, weights=counts[rows], minlength=len(uniq))
+        frequent = np.nonzero(count >= minsup)[0]
+        frequent = frequent[count[frequent].argsort(kind="stable")]
+        rank = {item: i for i, item in enumerate(uniq[frequent])}
+        codes = np.full(len(uniq), -1, dtype=np.int64)
+        codes[frequent] = np.arange(len(frequent))
 
         # Create conditional tree
         cond_tree = FPTree(rank)
-        for idx, branch in enumerate(branches):
-            branch = sorted(
-                [i for i in branch if i in rank], key=rank.get, reverse=True
-            )
-            cond_tree.insert_itemset(branch, self.nodes[cond_item][idx].count)
+        cond_tree._build(rows, codes[inverse], counts)
         cond_tree.cond_items = self.cond_items + [cond_item]
 
         return cond_tree
 
-    def insert_itemset(self, itemset, count=1):
+    def insert_transactions(self, rows, items, counts):
         """
-        Inserts a list of items into the tree.
+        Inserts a batch of transactions into the empty tree.
 
         Parameters
         ----------
-        itemset : list
-            Items that will be inserted into the tree.
-        count : int
-            The number of occurrences of the itemset.
+        rows : np.array, shape = (n_entries,)
+            Transaction index of every (transaction, item) entry.
+        items : np.array, shape = (n_entries,)
+            Item of every (transaction, item) entry. Items that are
+            not ranked in `self.rank` are ignored.
+        counts : np.array, shape = (n_transactions,)
+            The number of occurrences of each transaction.
         """
-        self.root.count += count
-
-        if len(itemset) == 0:
-            return
-
-        # Follow existing path in tree as long as possible
-        index = 0
-        node = self.root
-        for item in itemset:
-            if item in node.children:
-                child = node.children[item]
-                child.count += count
-                node = child
-                index += 1
-            else:
-                break
+        if len(self.item) > 1:
+            raise ValueError("Transactions can only be inserted into an empty FPTree")
+
+        sorted_items = np.sort(self._items_by_rank)
+        pos = np.searchsorted(sorted_items, items)
+        pos[pos == len(sorted_items)] = 0
+        if len(sorted_items):
+            known = sorted_items[pos] == items
+        else:
+            known = np.zeros(len(items), dtype=bool)
+        codes = np.full(len(items), -1, dtype=np.int64)
+        codes[known] = np.argsort(self._items_by_rank)[pos[known]]
 
-        # Insert any remaining items
-        for item in itemset[index:]:
-            child_node = FPNode(item, count, node)
-            self.nodes[item].append(child_node)
-            node = child_node
+        self._build(np.asarray(rows), codes, np.asarray(counts))
+
+    def _build(self, rows, codes, counts):
+        """
+        Builds the tree level by level from the items of each transaction.
+
+        Every transaction is sorted from its most to least frequent item,
+        so that the d-th item of a transaction is at depth d of the tree.
+        A node at depth d is then uniquely defined by the pair
+        (node at depth d - 1, item), and all nodes of one level are
+        created at once by finding the unique pairs.
+
+        Parameters
+        ----------
+        rows : np.array, shape = (n_entries,)
+            Transaction index of every entry.
+        codes : np.array, shape = (n_entries,)
+            Rank of the item of every entry, or -1 for unranked items.
+        counts : np.array, shape = (n_transactions,)
+            The number of occurrences of each transaction.
+        """
+        n_codes = max(len(self._items_by_rank), 1)
+        ranked = codes >= 0
+        rows, codes = rows[ranked], codes[ranked]
+
+        # Sort transactions from most to least frequent item
+        order = np.lexsort((-codes, rows))
+        rows, codes = rows[order], codes[order]
+
+        # Depth of every entry, i.e. its position in the sorted transaction
+        starts = np.nonzero(np.diff(rows, prepend=-1))[0]
+        lengths = np.diff(np.append(starts, len(rows)))
+        depth = np.arange(len(rows)) - np.repeat(starts, lengths)
+        by_depth = np.argsort(depth, kind="stable")
+
+        parents = [np.array([-1], dtype=np.int64)]
+        node_codes = [np.array([-1], dtype=np.int64)]
+        node_counts = [np.array([counts.sum()], dtype=counts.dtype)]
+        node_of_row = np.zeros(len(counts), dtype=np.int64)
+        n_nodes = 1
+        offset = 0
+        for size in np.bincount(depth):
+            level = by_depth[offset : offset + size]
+            offset += size
+            level_rows = node_of_row[rows[level]]
+            keys, inverse = np.unique(
+                level_rows * n_codes + codes[level], return_inverse=True
+            )
+            weights = np.bincount(
+                inverse, weights=counts[rows[level]], minlength=len(keys)
+            )
+            parents.append(keys // n_codes)
+            node_codes.append(keys % n_codes)
+            node_counts.append(weights.astype(counts.dtype))
+            node_of_row[rows[level]] = n_nodes + inverse
+            n_nodes += len(keys)
+
+        self.parent = np.concatenate(parents)
+        self.count = np.concatenate(node_counts)
+        node_codes = np.concatenate(node_codes)
+        self.item = np.append(-1, self._items_by_rank[node_codes[1:]])
+
+        # Nodes of one level are sorted by parent, hence siblings are adjacent
+        child = np.arange(1, n_nodes)
+        parent = self.parent[1:]
+        is_first = np.diff(parent, prepend=-1) != 0
+        self.first_child = np.full(n_nodes, -1, dtype=np.int64)
+        self.first_child[parent[is_first]] = child[is_first]
+        has_next = parent[1:] == parent[:-1]
+        self.next_sibling = np.full(n_nodes, -1, dtype=np.int64)
+        self.next_sibling[child[:-1][has_next]] = child[1:][has_next]
+        self._is_path = n_nodes == 1 or np.bincount(parent).max() <= 1
+
+        # Header table, from most to least frequent item
+        by_code = np.argsort(-node_codes[1:], kind="stable") + 1
+        bounds = np.nonzero(np.diff(node_codes[by_code]))[0] + 1
+        self.nodes = {
+            self._items_by_rank[node_codes[group[0]]]: group
+            for group in np.split(by_code, bounds)
+            if len(group)
+        }
 
     def is_path(self):
-        if len(self.root.children) > 1:
-            return False
-        for i in self.nodes:
-            if len(self.nodes[i]) > 1 or len(self.nodes[i][0].children) > 1:
-                return False
-        return True
+        return self._is_path
 
     def print_status(self, count, colnames):
         cond_items = [str(i) for i in self.cond_items]
@@ -222,29 +835,3 @@ class FPTree(object):
             "\r%d itemset(s) from tree conditioned on items (%s)" % (count, cond_items),
             end="\n",
         )
-
-
-class FPNode(object):
-    def __init__(self, item, count=0, parent=None):
-        self.item = item
-        self.count = count
-        self.parent = parent
-        self.children = collections.defaultdict(FPNode)
-
-        if parent is not None:
-            parent.children[item] = self
-
-    def itempath_from_root(self):
-        """Returns the top-down sequence of items from self to
-        (but not including) the root node."""
-        path = []
-        if self.item is None:
-            return path
-
-        node = self.parent
-        while node.item is not None:
-            path.append(node.item)
-            node = node.parent
-
-        path.reverse()
-        return path
@@ -3,13 +3,29 @@
 #
 # License: BSD 3 clause
 
+import copy
+import heapq
 import itertools
 import math
 
+import numpy as np
+from joblib import Parallel, delayed
+
 from ..frequent_patterns import fpcommon as fpc
 
 
-def fpgrowth(df, min_support=0.5, use_colnames=False, max_len=None, verbose=0):
+def fpgrowth(
+    df,
+    min_support=0.5,
+    use_colnames=False,
+    max_len=None,
+    verbose=0,
+    n_jobs=1,
+    top_k=None,
+    compact=False,
+    sample_weight=None,
+    callback=None,
+):
     """Get frequent itemsets from a one-hot DataFrame
 
     Parameters
@@ -53,6 +69,38 @@ def fpgrowth(df, min_support=0.5, use_colnames=False, max_len=None, verbose=0):
     verbose : int (default: 0)
       Shows the stages of conditional tree generation.
 
+    n_jobs : int (default: 1)
+      The number of CPUs to use for mining the conditional trees
+      of the frequent items in parallel. -1 means 'all CPUs'.
+      The returned itemsets do not depend on `n_jobs`.
+
+    top_k : int (default: None)
+      If not None, `min_support` is ignored and the `top_k` itemsets
+      with the highest support are returned (together with all itemsets
+      whose support ties with the `top_k`-th highest support). The support
+      threshold starts at the `top_k`-th highest support of a single item
+      and is raised whenever an itemset with a higher support is found,
+      so that the tree is only mined once.
+
+    compact : bool (default: False)
+      If `True`, returns a `CompactItemsets` object that stores the
+      itemsets as flat NumPy arrays of item ids instead of a DataFrame
+      of frozensets. It can be passed to `association_rules` directly
+      and converted into the DataFrame via its `to_frame` method.
+
+    sample_weight : array-like, shape = (n_transactions,) (default: None)
+      Weight of each transaction (row of `df`), e.g., the number of times
+      it occurs if identical transactions have been collapsed into one row.
+      The support of an itemset is then computed as the sum of the weights
+      of the transactions containing it divided by the sum of all weights.
+      If `None` (default), every transaction has a weight of 1.
+
+    callback : callable (default: None)
+      Called with a dict for every mined FP-tree, holding the items the
+      tree is conditioned on, its number of nodes and items, the number
+      of itemsets it yielded, the elapsed time and the peak memory.
+      Pass a `MiningStats` object to collect these events.
+
     Returns
     -----------
     pandas DataFrame with columns ['support', 'itemsets'] of all itemsets
@@ -71,6 +119,33 @@ def fpgrowth(df, min_support=0.5, use_colnames=False, max_len=None, verbose=0):
 
     """
     fpc.valid_input_check(df)
+    fpc.check_callback(callback)
+    sample_weight = fpc.check_sample_weight(sample_weight, len(df.index))
+    num_itemsets = len(df.index)
+    if sample_weight is not None:
+        num_itemsets = sample_weight.sum()
+
+    topk = None
+    if top_k is not None:
+        if top_k < 1:
+            raise ValueError("`top_k` must be a positive integer. Got %s." % top_k)
+        # The k-th highest support of a single item is a lower bound
+        # for the k-th highest support of any itemset
+        if sample_weight is None:
+            item_counts = np.asarray(df.sum(axis=0), dtype=np.int64)
+            lowest = 1
+        else:
+            X = df.values
+            if hasattr(df, "sparse") and df.size > 0:
+                X = df.sparse.to_coo()
+            item_counts = fpc.weighted_item_counts(X, sample_weight)
+            lowest = sample_weight[sample_weight > 0].min(initial=1.0)
+        item_counts = np.sort(item_counts)[::-1]
+        minsup = lowest
+        if len(item_counts) >= top_k:
+            minsup = max(item_counts[top_k - 1], lowest)
+        topk = _TopK(top_k, minsup)
+        min_support = minsup / float(num_itemsets or 1)
 
     if min_support <= 0.0:
         raise ValueError(
@@ -83,14 +158,27 @@ def fpgrowth(df, min_support=0.5, use_colnames=False, max_len=None, verbose=0):
     if use_colnames:
         colname_map = {idx: item for idx, item in enumerate(df.columns)}
 
-    tree, _ = fpc.setup_fptree(df, min_support)
-    minsup = math.ceil(min_support * len(df.index))  # min support as count
-    generator = fpg_step(tree, minsup, colname_map, max_len, verbose)
+    log = None
+    if callback is not None:
+        log = fpc.EventLog("fpgrowth", callback, colname_map)
+
+    tree, _ = fpc.setup_fptree(df, min_support, sample_weight)
+    if sample_weight is None:
+        minsup = math.ceil(min_support * len(df.index))  # min support as count
+    else:
+        minsup = min_support * num_itemsets  # min support as sum of weights
+    generator = fpg_step(tree, minsup, colname_map, max_len, verbose, n_jobs, topk, log)
 
-    return fpc.generate_itemsets(generator, len(df.index), colname_map)
+    if topk is not None:
+        # Itemsets found before the threshold reached its final
+        # value can be below it
+        found = list(generator)
+        generator = ((sup, iset) for sup, iset in found if sup >= topk.minsup)
 
+    return fpc.generate_itemsets(generator, num_itemsets, colname_map, compact)
 
-def fpg_step(tree, minsup, colnames, max_len, verbose):
+
+def fpg_step(tree, minsup, colnames, max_len, verbose, n_jobs=1, topk=None, log=None):
     """
     Performs a recursive step of the fpgrowth algorithm.
 
@@ -98,6 +186,14 @@ def fpg_step(tree, minsup, colnames, max_len, verbose):
     ----------
     tree : FPTree
     minsup : int
+    n_jobs : int (default: 1)
+        Number of processes that mine the conditional trees
+        of this step. The recursive steps always run sequentially.
+    topk : _TopK (default: None)
+        If not None, collects the supports of the yielded itemsets
+        and replaces `minsup` by its current threshold.
+    log : EventLog (default: None)
+        If not None, receives an event for every mined tree.
 
     Yields
     ------
@@ -106,6 +202,10 @@ def fpg_step(tree, minsup, colnames, max_len, verbose):
     """
     count = 0
     items = tree.nodes.keys()
+    if topk is not None:
+        minsup = topk.minsup
+        items = [i for i in items if tree.count[tree.nodes[i]].sum() >= minsup]
+
     if tree.is_path():
         # If the tree is a path, we can combinatorally generate all
         # remaining itemsets without generating additional conditional trees
@@ -115,20 +215,89 @@ def fpg_step(tree, minsup, colnames, max_len, verbose):
         for i in range(1, size_remain):
             for itemset in itertools.combinations(items, i):
                 count += 1
-                support = min([tree.nodes[i][0].count for i in itemset])
+                support = min([tree.count[tree.nodes[i][0]] for i in itemset])
+                if topk is not None:
+                    topk.push(support)
                 yield support, tree.cond_items + list(itemset)
     elif not max_len or max_len > len(tree.cond_items):
         for item in items:
             count += 1
-            support = sum([node.count for node in tree.nodes[item]])
+            support = tree.count[tree.nodes[item]].sum()
+            if topk is not None:
+                topk.push(support)
             yield support, tree.cond_items + [item]
 
     if verbose:
         tree.print_status(count, colnames)
+    if log is not None:
+        log.tree(tree, count)
 
     # Generate conditional trees to generate frequent itemsets one item larger
     if not tree.is_path() and (not max_len or max_len > len(tree.cond_items)):
-        for item in items:
-            cond_tree = tree.conditional_tree(item, minsup)
-            for sup, iset in fpg_step(cond_tree, minsup, colnames, max_len, verbose):
-                yield sup, iset
+        if n_jobs == 1:
+            for item in items:
+                if topk is not None:
+                    # No itemset of the conditional tree has a higher
+                    # support than `item`
+                    minsup = topk.minsup
+                    if tree.count[tree.nodes[item]].sum() < minsup:
+                        continue
+                cond_tree = tree.conditional_tree(item, minsup)
+                for sup, iset in fpg_step(
+                    cond_tree, minsup, colnames, max_len, verbose, topk=topk, log=log
+                ):
+                    yield sup, iset
+        else:
+            # The conditional trees are independent of each other; results
+            # are returned in the order of `items`, as in the sequential case.
+            # In top-k mode, each process raises the threshold of its own
+            # copy of `topk`, which is a lower bound for the global threshold.
+            parallel = Parallel(n_jobs=n_jobs)
+            results = parallel(
+                delayed(_fpg_collect)(
+                    tree.conditional_tree(item, minsup),
+                    minsup,
+                    colnames,
+                    max_len,
+                    verbose,
+                    copy.deepcopy(topk),
+                    None if log is None else log.worker(),
+                )
+                for item in items
+            )
+            for itemsets, records in results:
+                if log is not None:
+                    log.replay(records)
+                for sup, iset in itemsets:
+                    if topk is not None:
+                        topk.push(sup)
+                    yield sup, iset
+
+
+def _fpg_collect(tree, minsup, colnames, max_len, verbose, topk=None, log=None):
+    itemsets = list(
+        fpg_step(tree, minsup, colnames, max_len, verbose, topk=topk, log=log)
+    )
+    return itemsets, None if log is None else log.records
+
+
+class _TopK(object):
+    """
+    Min-heap of the `k` highest supports yielded so far.
+
+    Once `k` supports have been collected, `minsup` is the lowest of
+    them, i.e., the support an itemset needs to be among the top `k`.
+    """
+
+    def __init__(self, k, minsup):
+        self.k = k
+        self.minsup = minsup
+        self.heap = []
+
+    def push(self, support):
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, support)
+        elif support > self.heap[0]:
+            heapq.heapreplace(self.heap, support)
+        if len(self.heap) == self.k:
+            self.minsup = max(self.minsup, self.heap[0])
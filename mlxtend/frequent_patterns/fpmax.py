@@ -6,10 +6,22 @@
 import collections
 import math
 
+from joblib import Parallel, delayed
+
 from ..frequent_patterns import fpcommon as fpc
 
 
-def fpmax(df, min_support=0.5, use_colnames=False, max_len=None, verbose=0):
+def fpmax(
+    df,
+    min_support=0.5,
+    use_colnames=False,
+    max_len=None,
+    verbose=0,
+    n_jobs=1,
+    compact=False,
+    sample_weight=None,
+    callback=None,
+):
     """Get maximal frequent itemsets from a one-hot DataFrame
 
     Parameters
@@ -55,6 +67,33 @@ def fpmax(df, min_support=0.5, use_colnames=False, max_len=None, verbose=0):
     verbose : int (default: 0)
       Shows the stages of conditional tree generation.
 
+    n_jobs : int (default: 1)
+      The number of CPUs to use for mining the conditional trees
+      of the frequent items in parallel. -1 means 'all CPUs'.
+      The returned itemsets do not depend on `n_jobs`. The conditional
+      trees are always mined sequentially if `max_len` is set, since
+      the maximal itemsets are then found via a depth-limited search
+      that depends on the itemsets found in the previous trees.
+
+    compact : bool (default: False)
+      If `True`, returns a `CompactItemsets` object that stores the
+      itemsets as flat NumPy arrays of item ids instead of a DataFrame
+      of frozensets. It can be passed to `association_rules` directly
+      and converted into the DataFrame via its `to_frame` method.
+
+    sample_weight : array-like, shape = (n_transactions,) (default: None)
+      Weight of each transaction (row of `df`), e.g., the number of times
+      it occurs if identical transactions have been collapsed into one row.
+      The support of an itemset is then computed as the sum of the weights
+      of the transactions containing it divided by the sum of all weights.
+      If `None` (default), every transaction has a weight of 1.
+
+    callback : callable (default: None)
+      Called with a dict for every mined FP-tree, holding the items the
+      tree is conditioned on, its number of nodes and items, the number
+      of itemsets it yielded, the elapsed time and the peak memory.
+      Pass a `MiningStats` object to collect these events.
+
     Returns
     -----------
     pandas DataFrame with columns ['support', 'itemsets'] of all maximal
@@ -73,6 +112,7 @@ def fpmax(df, min_support=0.5, use_colnames=False, max_len=None, verbose=0):
 
     """
     fpc.valid_input_check(df)
+    fpc.check_callback(callback)
 
     if min_support <= 0.0:
         raise ValueError(
@@ -85,15 +125,31 @@ def fpmax(df, min_support=0.5, use_colnames=False, max_len=None, verbose=0):
     if use_colnames:
         colname_map = {idx: item for idx, item in enumerate(df.columns)}
 
-    tree, rank = fpc.setup_fptree(df, min_support)
-
-    minsup = math.ceil(min_support * len(df.values))  # min support as count
-    generator = fpmax_step(tree, minsup, MFITree(rank), colname_map, max_len, verbose)
+    sample_weight = fpc.check_sample_weight(sample_weight, len(df.index))
+    log = None
+    if callback is not None:
+        log = fpc.EventLog("fpmax", callback, colname_map)
+    tree, rank = fpc.setup_fptree(df, min_support, sample_weight)
+
+    num_itemsets = len(df.values)
+    if sample_weight is None:
+        minsup = math.ceil(min_support * len(df.values))  # min support as count
+    else:
+        num_itemsets = sample_weight.sum()
+        minsup = min_support * num_itemsets  # min support as sum of weights
+    if n_jobs == 1 or max_len is not None or tree.is_path():
+        generator = fpmax_step(
+            tree, minsup, MFITree(rank), colname_map, max_len, verbose, log
+        )
+    else:
+        generator = fpmax_parallel(
+            tree, minsup, rank, colname_map, max_len, verbose, n_jobs, log
+        )
 
-    return fpc.generate_itemsets(generator, len(df.values), colname_map)
+    return fpc.generate_itemsets(generator, num_itemsets, colname_map, compact)
 
 
-def fpmax_step(tree, minsup, mfit, colnames, max_len, verbose):
+def fpmax_step(tree, minsup, mfit, colnames, max_len, verbose, log=None):
     count = 0
     items = list(tree.nodes.keys())
     largest_set = sorted(tree.cond_items + items, key=mfit.rank.get)
@@ -106,13 +162,15 @@ def fpmax_step(tree, minsup, mfit, colnames, max_len, verbose):
             mfit.cache = largest_set
             mfit.insert_itemset(largest_set)
             if max_len is None or len(largest_set) <= max_len:
-                support = tree.root.count
+                support = tree.count[0]
                 if len(items) > 0:
-                    support = min([tree.nodes[i][0].count for i in items])
+                    support = min([tree.count[tree.nodes[i][0]] for i in items])
                 yield support, largest_set
 
     if verbose:
         tree.print_status(count, colnames)
+    if log is not None:
+        log.tree(tree, count)
 
     if not tree.is_path() and (not max_len or max_len > len(tree.cond_items)):
         # Loop over each item in tree creating another conditional tree
@@ -124,11 +182,61 @@ def fpmax_step(tree, minsup, mfit, colnames, max_len, verbose):
             largest_set.remove(item)
             cond_tree = tree.conditional_tree(item, minsup)
             for support, mfi in fpmax_step(
-                cond_tree, minsup, mfit, colnames, max_len, verbose
+                cond_tree, minsup, mfit, colnames, max_len, verbose, log
             ):
                 yield support, mfi
 
 
+def fpmax_parallel(tree, minsup, rank, colnames, max_len, verbose, n_jobs, log=None):
+    """
+    Mines the maximal itemsets of the conditional tree of each item
+    in parallel.
+
+    The itemsets that are maximal within the conditional tree of an
+    item are not necessarily maximal overall, since they can be subsets
+    of an itemset found in the conditional tree of another item. Each
+    globally maximal itemset is however found in the conditional tree
+    of its least frequent item, so the results are merged by discarding
+    the itemsets that are contained in a larger one. Only used without
+    `max_len`.
+    """
+    if log is not None:
+        log.tree(tree, 0)
+    parallel = Parallel(n_jobs=n_jobs)
+    results = parallel(
+        delayed(_fpmax_collect)(
+            tree.conditional_tree(item, minsup),
+            minsup,
+            rank,
+            colnames,
+            verbose,
+            None if log is None else log.worker(),
+        )
+        for item in sorted(tree.nodes, key=rank.get)
+    )
+
+    candidates = []
+    for itemsets, records in results:
+        if log is not None:
+            log.replay(records)
+        candidates.extend(itemsets)
+    candidates.sort(key=lambda x: len(x[1]), reverse=True)
+    mfit = MFITree(rank)
+    for support, mfi in candidates:
+        mfi = sorted(mfi, key=rank.get)
+        if not mfit.contains(mfi):
+            mfit.insert_itemset(mfi[::-1])
+            if max_len is None or len(mfi) <= max_len:
+                yield support, mfi
+
+
+def _fpmax_collect(tree, minsup, rank, colnames, verbose, log=None):
+    itemsets = list(
+        fpmax_step(tree, minsup, MFITree(rank), colnames, None, verbose, log)
+    )
+    return itemsets, None if log is None else log.records
+
+
 class MFITree(object):
     def __init__(self, rank):
         self.root = self.Node(None)
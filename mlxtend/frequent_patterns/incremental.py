@@ -0,0 +1,234 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# Incremental maintenance of frequent itemsets
+#
+# License: BSD 3 clause
+
+import numpy as np
+import pandas as pd
+
+from ..frequent_patterns import fpcommon as fpc
+from .apriori import _itemsets_to_frame, bitset_support_counts, generate_candidates
+
+
+class IncrementalItemsetMiner(object):
+    """Frequent itemsets that are updated as transactions are appended
+
+    The miner keeps the transaction counts of all frequent itemsets and
+    of their negative border, i.e., the infrequent itemsets whose subsets
+    are all frequent. When a batch of transactions is appended (or the
+    oldest batch expires), only the batch itself is scanned to update
+    these counts (FUP algorithm). The full history is only scanned again
+    if an itemset of the negative border becomes frequent, since its
+    supersets then need to be counted for the first time.
+
+    Parameters
+    ------------
+    min_support : float (default: 0.5)
+      A float between 0 and 1 for minumum support of the itemsets returned.
+      The support is computed as the fraction
+      `transactions_where_item(s)_occur / total_transactions`
+      over all transactions that have been added and not expired.
+
+    use_colnames : bool (default: False)
+      If `True`, uses the DataFrames' column names in the returned DataFrame
+      instead of column indices.
+
+    max_len : int (default: None)
+      Maximum length of the itemsets generated. If `None` (default) all
+      possible itemsets lengths (under the apriori condition) are evaluated.
+
+    Attributes
+    ------------
+    frequent_itemsets_ : pandas DataFrame
+      DataFrame with columns ['support', 'itemsets'] of all frequent
+      itemsets, in the format returned by `apriori`.
+
+    columns_ : list
+      Column names of the transaction DataFrames.
+
+    n_transactions_ : int
+      Number of transactions that have been added and not expired.
+
+    n_batches_ : int
+      Number of batches that have been added and not expired.
+
+    n_rescans_ : int
+      Number of times the full history had to be scanned again
+      after the initial fit.
+
+    Examples
+    -----------
+    For usage examples, please see
+    http://rasbt.github.io/mlxtend/user_guide/frequent_patterns/IncrementalItemsetMiner/
+
+    """
+
+    def __init__(self, min_support=0.5, use_colnames=False, max_len=None):
+        if min_support <= 0.0:
+            raise ValueError(
+                "`min_support` must be a positive "
+                "number within the interval `(0, 1]`. "
+                "Got %s." % min_support
+            )
+        self.min_support = min_support
+        self.use_colnames = use_colnames
+        self.max_len = max_len
+
+    def fit(self, df):
+        """Mine the frequent itemsets of a first batch of transactions
+
+        Parameters
+        ------------
+        df : pandas DataFrame
+          One-hot encoded transactions, as accepted by `apriori`.
+
+        Returns
+        ------------
+        self : object
+
+        """
+        self.columns_ = list(df.columns)
+        self._batches = []
+        self._batch_sizes = []
+        self._counts = {}
+        self._add_batch(df)
+        self.n_rescans_ = 0
+        self._update(count_rescans=False)
+        return self
+
+    def partial_fit(self, df):
+        """Append a batch of transactions and update the frequent itemsets
+
+        Parameters
+        ------------
+        df : pandas DataFrame
+          One-hot encoded transactions with the same columns
+          as the DataFrame passed to `fit`.
+
+        Returns
+        ------------
+        self : object
+
+        """
+        if not hasattr(self, "columns_"):
+            return self.fit(df)
+        if list(df.columns) != self.columns_:
+            raise ValueError(
+                "The columns of the new transactions do not match "
+                "the columns of the transactions passed to `fit`."
+            )
+        self._add_batch(df)
+        self._update_counts(self._batches[-1], sign=1)
+        self._update()
+        return self
+
+    def expire(self, n_batches=1):
+        """Remove the oldest batches and update the frequent itemsets
+
+        Parameters
+        ------------
+        n_batches : int (default: 1)
+          Number of batches to remove, starting from the
+          oldest batch (the one passed to `fit`).
+
+        Returns
+        ------------
+        self : object
+
+        """
+        if n_batches > len(self._batches):
+            raise ValueError(
+                "Cannot expire %d batches; only %d batches are stored."
+                % (n_batches, len(self._batches))
+            )
+        for _ in range(n_batches):
+            self._update_counts(self._batches.pop(0), sign=-1)
+            self._batch_sizes.pop(0)
+        self._update()
+        return self
+
+    @property
+    def n_transactions_(self):
+        return sum(self._batch_sizes)
+
+    @property
+    def n_batches_(self):
+        return len(self._batches)
+
+    def _add_batch(self, df):
+        fpc.valid_input_check(df)
+        if hasattr(df, "sparse") and df.size > 0:
+            packed = fpc.pack_columns(df.sparse.to_coo().tocsc(), is_sparse=True)
+        else:
+            packed = fpc.pack_columns(df.values, is_sparse=False)
+        self._batches.append(packed)
+        self._batch_sizes.append(len(df.index))
+
+    def _count(self, itemsets, batches):
+        """Counts the transactions of `batches` containing each itemset"""
+        counts = {}
+        by_size = {}
+        for itemset in itemsets:
+            by_size.setdefault(len(itemset), []).append(itemset)
+        for same_size in by_size.values():
+            combin = np.array(same_size, dtype=int)
+            total = np.zeros(len(same_size), dtype=np.int64)
+            for packed in batches:
+                total += bitset_support_counts(packed, combin)
+            counts.update(zip(same_size, total.tolist()))
+        return counts
+
+    def _update_counts(self, packed, sign):
+        for itemset, count in self._count(self._counts, [packed]).items():
+            self._counts[itemset] += sign * count
+
+    def _update(self, count_rescans=True):
+        """Recomputes the frequent itemsets and the negative border level by
+        level from the stored counts, counting untracked candidates over
+        the full history."""
+        n_transactions = float(self.n_transactions_)
+        level = [(item,) for item in range(len(self.columns_))]
+        tracked = {}
+        itemset_dict = {}
+        support_dict = {}
+        k = 1
+        while level:
+            untracked = [itemset for itemset in level if itemset not in self._counts]
+            if untracked:
+                self._counts.update(self._count(untracked, self._batches))
+                if count_rescans and k > 1:
+                    self.n_rescans_ += 1
+
+            frequent = []
+            for itemset in level:
+                tracked[itemset] = self._counts[itemset]
+                if (
+                    n_transactions > 0
+                    and self._counts[itemset] / n_transactions >= self.min_support
+                ):
+                    frequent.append(itemset)
+            if not frequent:
+                break
+            itemset_dict[k] = np.array(frequent)
+            support_dict[k] = (
+                np.array([self._counts[itemset] for itemset in frequent])
+                / n_transactions
+            )
+            if self.max_len and k >= self.max_len:
+                break
+            level = [tuple(c) for c in generate_candidates(frequent).tolist()]
+            k += 1
+
+        # only the frequent itemsets and the negative border are kept
+        self._counts = tracked
+
+        if itemset_dict:
+            self.frequent_itemsets_ = _itemsets_to_frame(
+                itemset_dict,
+                support_dict,
+                self.columns_ if self.use_colnames else None,
+            )
+        else:
+            self.frequent_itemsets_ = pd.DataFrame([], columns=["support", "itemsets"])
@@ -0,0 +1,226 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# PrefixSpan algorithm for mining frequent sequential patterns
+#
+# License: BSD 3 clause
+
+import math
+from bisect import bisect_right
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+
+from ..preprocessing import TransactionEncoder
+
+
+def prefixspan(sequences, min_support=0.5, max_len=None, n_jobs=1):
+    """Get frequent sequential patterns from a list of sequences
+
+    A sequence is an ordered list of elements, e.g., the baskets of
+    one customer ordered by time, and every element is an item or a
+    set of items that occur at the same time. A pattern is contained
+    in a sequence if its elements are subsets of elements of the
+    sequence in the same order, e.g., `[['a'], ['b', 'c']]` is
+    contained in `[['a', 'd'], ['e'], ['b', 'c']]`.
+
+    The patterns are grown one item at a time, either by adding the
+    item to the last element of the pattern or as a new element, from
+    the pseudo-projected database of the pattern, i.e., the position
+    of its first occurrence in each sequence (Pei et al., 2004).
+
+    Parameters
+    -----------
+    sequences : list of lists
+      The sequences, where every element is either a single item or a
+      list (or set) of items, e.g.,
+
+    ```
+        [[['Milk', 'Bread'], 'Beer', ['Milk', 'Diapers']],
+         ['Bread', ['Beer', 'Diapers']],
+         [['Milk', 'Bread'], 'Diapers', 'Beer']]
+    ```
+
+      The items must be sortable, as for `TransactionEncoder`, and
+      an item occurs at most once per element.
+
+    min_support : float (default: 0.5)
+      A float between 0 and 1 for minimum support of the patterns returned.
+      The support is computed as the fraction
+      sequences_containing_the_pattern / total_sequences.
+
+    max_len : int (default: None)
+      Maximum number of items of the patterns generated. If `None`
+      (default) all possible pattern lengths are evaluated.
+
+    n_jobs : int (default: 1)
+      The number of CPUs to use for mining the patterns that start
+      with each frequent item in parallel. -1 means 'all CPUs'.
+      The returned patterns do not depend on `n_jobs`.
+
+    Returns
+    -----------
+    pandas DataFrame with columns ['support', 'sequence'] of all patterns
+      that are >= `min_support` and have at most `max_len` items
+      (if `max_len` is not None). Each pattern in the 'sequence'
+      column is a tuple of its elements, and each element is a
+      `frozenset` of items.
+
+    Examples
+    -----------
+    For usage examples, please see
+    http://rasbt.github.io/mlxtend/user_guide/frequent_patterns/prefixspan/
+
+    """
+    if min_support <= 0.0:
+        raise ValueError(
+            "`min_support` must be a positive "
+            "number within the interval `(0, 1]`. "
+            "Got %s." % min_support
+        )
+    if max_len is not None and max_len < 1:
+        raise ValueError("`max_len` must be a positive integer. Got %s." % max_len)
+
+    sequences = [[_element_items(element) for element in seq] for seq in sequences]
+    encoder = TransactionEncoder().fit(element for seq in sequences for element in seq)
+    minsup = math.ceil(min_support * len(sequences))  # min support as count
+
+    # Integer encode the sequences, and remove the infrequent items
+    # since they cannot be part of any frequent pattern
+    mapping = encoder.columns_mapping_
+    encoded = [
+        [sorted(set(mapping[item] for item in element)) for element in seq]
+        for seq in sequences
+    ]
+    counts = np.zeros(len(encoder.columns_), dtype=np.int64)
+    for seq in encoded:
+        items = set(item for element in seq for item in element)
+        counts[list(items)] += 1
+    frequent = counts >= max(minsup, 1)
+    db = []
+    for seq in encoded:
+        elements = [tuple(i for i in element if frequent[i]) for element in seq]
+        db.append([element for element in elements if element])
+    items = np.nonzero(frequent)[0].tolist()
+
+    if n_jobs == 1:
+        patterns = _prefixspan_collect(db, items, minsup, max_len)
+    else:
+        n_chunks = min(effective_n_jobs(n_jobs), max(len(items), 1))
+        chunks = [items[i::n_chunks] for i in range(n_chunks)]
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_prefixspan_collect)(db, chunk, minsup, max_len) for chunk in chunks
+        )
+        by_item = {}
+        for result in results:
+            for support, pattern in result:
+                by_item.setdefault(pattern[0][0], []).append((support, pattern))
+        patterns = [p for item in items for p in by_item.get(item, [])]
+
+    columns = encoder.columns_
+    res_df = pd.DataFrame(
+        {
+            "support": np.array(
+                [support / float(len(db)) for support, _ in patterns], dtype=float
+            ),
+            "sequence": [
+                tuple(frozenset(columns[i] for i in element) for element in pattern)
+                for _, pattern in patterns
+            ],
+        },
+        columns=["support", "sequence"],
+    )
+    return res_df
+
+
+def _element_items(element):
+    if isinstance(element, (list, tuple, set, frozenset)):
+        return list(element)
+    return [element]
+
+
+def _prefixspan_collect(db, items, minsup, max_len):
+    """Mines the patterns that start with one of `items`"""
+    sets = [[frozenset(element) for element in seq] for seq in db]
+    # first occurrence of every item in every sequence
+    projections = {item: [] for item in items}
+    for sid, seq in enumerate(db):
+        seen = set()
+        for e, element in enumerate(seq):
+            for q, item in enumerate(element):
+                if item not in seen and item in projections:
+                    seen.add(item)
+                    projections[item].append((sid, e, q))
+
+    patterns = []
+    for item in items:
+        projection = projections[item]
+        if len(projection) < minsup:
+            continue
+        pattern = ((item,),)
+        patterns.append((len(projection), pattern))
+        if max_len is None or max_len > 1:
+            prefixspan_step(db, sets, projection, pattern, 1, minsup, max_len, patterns)
+    return patterns
+
+
+def prefixspan_step(db, sets, projection, pattern, length, minsup, max_len, out):
+    """
+    Appends the frequent extensions of a pattern to `out`, recursively.
+
+    Parameters
+    ----------
+    db : list of lists of tuples
+        The sequences, whose elements are sorted tuples of item ids.
+    sets : list of lists of frozensets
+        The elements of `db` as sets.
+    projection : list of (sid, e, p)
+        The pseudo-projected database of `pattern`: for every sequence
+        `sid` that contains `pattern`, the element `e` and the position
+        `p` in that element of the last item of the first occurrence
+        of `pattern`.
+    pattern : tuple of tuples
+        The pattern, as a tuple of sorted tuples of item ids.
+    length : int
+        The number of items of `pattern`.
+    minsup : int
+    max_len : int or None
+    out : list of (support, pattern)
+    """
+    last = pattern[-1]
+    last_set = frozenset(last)
+    # extensions of the last element, and by a new element
+    i_proj, s_proj = {}, {}
+    for sid, e0, p0 in projection:
+        seq = db[sid]
+        seen = set()
+        for q in range(p0 + 1, len(seq[e0])):
+            seen.add(seq[e0][q])
+            i_proj.setdefault(seq[e0][q], []).append((sid, e0, q))
+        for e in range(e0 + 1, len(seq)):
+            if last_set <= sets[sid][e]:
+                element = seq[e]
+                for q in range(bisect_right(element, last[-1]), len(element)):
+                    if element[q] not in seen:
+                        seen.add(element[q])
+                        i_proj.setdefault(element[q], []).append((sid, e, q))
+        seen = set()
+        for e in range(e0 + 1, len(seq)):
+            for q, item in enumerate(seq[e]):
+                if item not in seen:
+                    seen.add(item)
+                    s_proj.setdefault(item, []).append((sid, e, q))
+
+    grow = max_len is None or length + 1 < max_len
+    extensions = [
+        (pattern[:-1] + (last + (item,),), i_proj[item]) for item in sorted(i_proj)
+    ] + [(pattern + ((item,),), s_proj[item]) for item in sorted(s_proj)]
+    for new_pattern, new_projection in extensions:
+        if len(new_projection) < minsup:
+            continue
+        out.append((len(new_projection), new_pattern))
+        if grow:
+            prefixspan_step(
+                db, sets, new_projection, new_pattern, length + 1, minsup, max_len, out
+            )
@@ -0,0 +1,90 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# License: BSD 3 clause
+
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose
+from test_fpbase import compare_dataframes
+
+from mlxtend.frequent_patterns import approximate_itemsets, fpgrowth
+from mlxtend.frequent_patterns.approximate import negative_border
+from mlxtend.utils import assert_raises
+
+
+class TestApproximate(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        probs = np.linspace(0.05, 0.6, 10)
+        self.df = pd.DataFrame(rng.rand(2000, 10) < probs)
+        self.expect = fpgrowth(self.df, min_support=0.1)
+
+    def test_verify(self):
+        sdf = self.df.astype(pd.SparseDtype("bool", False))
+        for df in (self.df, sdf):
+            for algorithm in ("fpgrowth", "apriori"):
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    res_df = approximate_itemsets(
+                        df,
+                        min_support=0.1,
+                        sample_fraction=0.3,
+                        algorithm=algorithm,
+                        random_state=0,
+                    )
+                assert res_df.shape[0] == self.expect.shape[0]
+                compare_dataframes(res_df, self.expect)
+                assert_allclose(res_df["support_lower"], res_df["support"])
+                assert_allclose(res_df["support_upper"], res_df["support"])
+
+    def test_full_sample(self):
+        res_df = approximate_itemsets(self.df, min_support=0.1, sample_fraction=1.0)
+        compare_dataframes(res_df, self.expect)
+
+    def test_bounds(self):
+        res_df = approximate_itemsets(
+            self.df, min_support=0.1, epsilon=0.05, verify=False, random_state=0
+        )
+        assert (res_df["support_lower"] <= res_df["support"]).all()
+        assert (res_df["support"] <= res_df["support_upper"]).all()
+
+        # the candidates contain the frequent itemsets,
+        # and the bounds mostly contain their supports
+        supports = dict(zip(res_df["itemsets"], res_df.index))
+        covered = []
+        for itemset, support in zip(self.expect["itemsets"], self.expect["support"]):
+            row = res_df.loc[supports[itemset]]
+            covered.append(row["support_lower"] <= support <= row["support_upper"])
+        assert np.mean(covered) > 0.8
+
+    def test_negative_border(self):
+        border = negative_border([(0,), (1,), (2,), (0, 1), (1, 2)], 4)
+        assert sorted(border) == [(0, 2), (3,)]
+        assert negative_border([(0,), (1,)], 2, max_len=1) == []
+
+    def test_errors(self):
+        assert_raises(
+            ValueError,
+            "Exactly one of `sample_fraction` and `epsilon` must be set.",
+            approximate_itemsets,
+            self.df,
+        )
+        assert_raises(
+            ValueError,
+            "`sample_fraction` must be within `(0, 1]`. Got 1.5.",
+            approximate_itemsets,
+            self.df,
+            sample_fraction=1.5,
+        )
+        assert_raises(
+            ValueError,
+            "`algorithm` must be 'fpgrowth' or 'apriori'. Got eclat.",
+            approximate_itemsets,
+            self.df,
+            sample_fraction=0.5,
+            algorithm="eclat",
+        )
@@ -7,21 +7,36 @@
 import unittest
 
 import numpy as np
+import pandas as pd
+from numpy.testing import assert_array_equal
+from scipy.sparse import csr_matrix
 from test_fpbase import (
     FPTestEdgeCases,
     FPTestErrors,
     FPTestEx1All,
     FPTestEx2All,
     FPTestEx3All,
+    FPTestSampleWeight,
+    compare_dataframes,
 )
 
-from mlxtend.frequent_patterns import apriori
+from mlxtend.frequent_patterns import MiningStats, apriori, apriori_streaming
+from mlxtend.frequent_patterns.apriori import (
+    generate_candidates,
+    sparse_support_counts,
+)
+from mlxtend.preprocessing import TransactionEncoder
+from mlxtend.utils import assert_raises
 
 
 def apriori_wrapper_low_memory(*args, **kwargs):
     return apriori(*args, **kwargs, low_memory=True)
 
 
+def apriori_wrapper_bitset(*args, **kwargs):
+    return apriori(*args, **kwargs, engine="bitset")
+
+
 class TestEdgeCases(unittest.TestCase, FPTestEdgeCases):
     def setUp(self):
         FPTestEdgeCases.setUp(self, apriori)
@@ -42,6 +57,11 @@ class TestAprioriLowMemory(unittest.TestCase, FPTestEx1All):
         FPTestEx1All.setUp(self, apriori_wrapper_low_memory)
 
 
+class TestAprioriBitset(unittest.TestCase, FPTestEx1All):
+    def setUp(self):
+        FPTestEx1All.setUp(self, apriori_wrapper_bitset)
+
+
 class TestAprioriBoolInput(unittest.TestCase, FPTestEx1All):
     def setUp(self):
         one_ary = np.array(
@@ -100,3 +120,231 @@ class TestEx2(unittest.TestCase, FPTestEx2All):
 class TestEx3(unittest.TestCase, FPTestEx3All):
     def setUp(self):
         FPTestEx3All.setUp(self, apriori)
+
+
+class TestEngine(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(123)
+        # more than 64 rows so that the bit vectors span several words
+        self.df = pd.DataFrame(rng.rand(150, 12) < 0.4)
+
+    def test_bitset_matches_auto(self):
+        expect = apriori(self.df, min_support=0.05)
+        res = apriori(self.df, min_support=0.05, engine="bitset")
+        assert res.shape == expect.shape
+        compare_dataframes(res, expect)
+
+    def test_bitset_sparse(self):
+        sdf = self.df.astype(pd.SparseDtype(bool, fill_value=False))
+        expect = apriori(self.df, min_support=0.05)
+        res = apriori(sdf, min_support=0.05, engine="bitset")
+        assert res.shape == expect.shape
+        compare_dataframes(res, expect)
+
+    def test_bitset_packed(self):
+        # more than 64 items so that the transactions span several words
+        rng = np.random.RandomState(0)
+        df = pd.DataFrame(rng.rand(150, 70) < 0.2)
+        te = TransactionEncoder().fit([range(70)])
+        packed = te.transform([np.flatnonzero(row) for row in df.values], packed=True)
+        expect = apriori(df, min_support=0.05)
+        for max_memory in (None, 10**8):
+            res = apriori(
+                packed, min_support=0.05, engine="bitset", max_memory=max_memory
+            )
+            assert res.shape == expect.shape
+            compare_dataframes(res, expect)
+
+        assert_raises(
+            ValueError,
+            "Bit-packed transactions are only supported with "
+            "`engine='bitset'`. Got auto.",
+            apriori,
+            packed,
+        )
+        assert_raises(
+            ValueError,
+            "`use_colnames=True` is not supported for bit-packed transactions, "
+            "which do not store the column names. The item ids of the "
+            "itemsets are the indices into `TransactionEncoder.columns_`.",
+            apriori,
+            packed,
+            use_colnames=True,
+            engine="bitset",
+        )
+
+    def test_invalid_engine(self):
+        assert_raises(
+            ValueError,
+            "`engine` must be 'auto' or 'bitset'. Got foo.",
+            apriori,
+            self.df,
+            engine="foo",
+        )
+
+
+class TestGenerateCandidates(unittest.TestCase):
+    def test_prefix_join(self):
+        old = np.array([[1, 2], [1, 3], [1, 4], [2, 3], [3, 4]])
+        res = generate_candidates(old)
+        # (1, 2, 4) is pruned since (2, 4) is infrequent
+        assert_array_equal(res, [[1, 2, 3], [1, 3, 4]])
+
+    def test_unsorted_input(self):
+        old = np.array([[3], [0], [2]])
+        assert_array_equal(generate_candidates(old), [[0, 2], [0, 3], [2, 3]])
+
+    def test_empty(self):
+        assert generate_candidates(np.array([[1, 2]])).shape == (0, 3)
+
+
+class TestSparseCounts(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.X = rng.rand(200, 12) < np.linspace(0.05, 0.6, 12)
+        self.df = pd.DataFrame(self.X)
+
+    def test_counts(self):
+        combin = np.array([[0, 1, 2], [0, 1, 5], [3, 4, 11], [0, 1, 11], [2, 6, 7]])
+        counts = sparse_support_counts(csr_matrix(self.X), combin)
+        assert_array_equal(counts, self.X[:, combin].all(axis=2).sum(axis=0))
+
+    def test_sparse_dataframe(self):
+        sdf = self.df.astype(pd.SparseDtype("bool", False))
+        expect = apriori(self.df, min_support=0.02)
+        for low_memory in (False, True):
+            res_df = apriori(sdf, min_support=0.02, low_memory=low_memory)
+            assert res_df.shape == expect.shape
+            compare_dataframes(res_df, expect)
+
+
+class TestMaxMemory(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(rng.rand(300, 15) < np.linspace(0.1, 0.7, 15))
+        self.expect = apriori(self.df, min_support=0.05)
+
+    def test_blocks(self):
+        sdf = self.df.astype(pd.SparseDtype("bool", False))
+        for df in (self.df, sdf):
+            for engine in ("auto", "bitset"):
+                res_df = apriori(df, min_support=0.05, engine=engine, max_memory=2**18)
+                assert res_df.shape == self.expect.shape
+                compare_dataframes(res_df, self.expect)
+
+    def test_low_memory(self):
+        res_df = apriori(self.df, min_support=0.05, low_memory=True, max_memory=2**18)
+        compare_dataframes(res_df, self.expect)
+
+    def test_exceeded(self):
+        with self.assertRaisesRegex(MemoryError, "exceeds `max_memory`"):
+            apriori(self.df, min_support=0.05, max_memory=1000)
+        with self.assertRaisesRegex(MemoryError, "exceeds `max_memory`"):
+            apriori(self.df, min_support=0.05, low_memory=True, max_memory=1000)
+
+    def test_invalid(self):
+        assert_raises(
+            ValueError,
+            "`max_memory` must be a positive number of bytes. Got 0.",
+            apriori,
+            self.df,
+            max_memory=0,
+        )
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.dataset = [
+            ["Milk", "Onion", "Nutmeg", "Kidney Beans", "Eggs", "Yogurt"],
+            ["Dill", "Onion", "Nutmeg", "Kidney Beans", "Eggs", "Yogurt"],
+            ["Milk", "Apple", "Kidney Beans", "Eggs"],
+            ["Milk", "Unicorn", "Corn", "Kidney Beans", "Yogurt"],
+            ["Corn", "Onion", "Onion", "Kidney Beans", "Ice cream", "Eggs"],
+        ]
+        self.te = TransactionEncoder().fit(self.dataset)
+        self.df = pd.DataFrame(
+            self.te.transform(self.dataset), columns=self.te.columns_
+        )
+        self.expect = apriori(self.df, min_support=0.4, use_colnames=True)
+
+    def test_lists(self):
+        chunks = [self.dataset[:2], self.dataset[2:4], self.dataset[4:]]
+        res_df = apriori_streaming(chunks, min_support=0.4, use_colnames=True)
+        assert res_df.shape == self.expect.shape
+        compare_dataframes(res_df, self.expect)
+
+    def test_sparse_chunks(self):
+        def chunks():
+            for i in range(0, len(self.dataset), 2):
+                yield self.te.transform(self.dataset[i : i + 2], sparse=True)
+
+        res_df = apriori_streaming(
+            chunks, min_support=0.4, use_colnames=True, columns=self.te.columns_
+        )
+        assert res_df.shape == self.expect.shape
+        compare_dataframes(res_df, self.expect)
+
+    def test_dataframe_chunks(self):
+        chunks = [self.df.iloc[:3], self.df.iloc[3:]]
+        res_df = apriori_streaming(
+            chunks, min_support=0.4, use_colnames=True, max_len=2
+        )
+        expect = apriori(self.df, min_support=0.4, use_colnames=True, max_len=2)
+        assert res_df.shape == expect.shape
+        compare_dataframes(res_df, expect)
+
+    def test_iterator(self):
+        assert_raises(
+            ValueError,
+            "`chunks` is an iterator that can only be read once. Please "
+            "provide a list of chunks or a function returning a new iterator.",
+            apriori_streaming,
+            iter([self.dataset]),
+        )
+
+
+class TestSampleWeight(unittest.TestCase, FPTestSampleWeight):
+    def setUp(self):
+        FPTestSampleWeight.setUp(self, apriori)
+
+    def test_low_memory(self):
+        expect = apriori(self.repeated, min_support=0.2)
+        res_df = apriori(
+            self.df, min_support=0.2, sample_weight=self.weights, low_memory=True
+        )
+        compare_dataframes(res_df, expect)
+
+    def test_bitset(self):
+        assert_raises(
+            ValueError,
+            "`sample_weight` is not supported with `engine='bitset'`.",
+            apriori,
+            self.df,
+            sample_weight=self.weights,
+            engine="bitset",
+        )
+
+
+class TestCallback(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(rng.rand(50, 6) < np.linspace(0.3, 0.8, 6))
+
+    def test_levels(self):
+        for engine in ("auto", "bitset"):
+            stats = MiningStats()
+            res_df = apriori(self.df, min_support=0.2, engine=engine, callback=stats)
+            events = stats.to_frame()
+            assert (events["event"] == "level").all()
+            assert list(events["level"]) == list(range(1, len(events) + 1))
+            assert events["n_candidates"][0] == 6
+            assert (events["n_frequent"] <= events["n_candidates"]).all()
+            assert events["n_frequent"].sum() == len(res_df)
+            assert events["n_frequent"].iloc[-1] == 0
+
+    def test_low_memory(self):
+        stats = MiningStats()
+        res_df = apriori(self.df, min_support=0.2, low_memory=True, callback=stats)
+        events = stats.to_frame()
+        assert events["n_frequent"].sum() == len(res_df)
+        assert events["n_candidates"][1:].isnull().all()
@@ -3,7 +3,7 @@ import pandas as pd
 import pytest
 from numpy.testing import assert_raises as numpy_assert_raises
 
-from mlxtend.frequent_patterns import apriori, association_rules
+from mlxtend.frequent_patterns import CompactItemsets, apriori, association_rules
 
 one_ary = np.array(
     [
@@ -276,3 +276,29 @@ def test_with_empty_dataframe():
     df = df_freq_items_with_colnames.iloc[:0]
     with pytest.raises(ValueError):
         association_rules(df)
+
+
+def test_confidence_pruning():
+    # rules with larger consequents are pruned during the generation,
+    # the result must match filtering all possible rules afterwards
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame(rng.rand(200, 8) < 0.7)
+    freq_items = apriori(df, min_support=0.1)
+
+    res_df = association_rules(freq_items, metric="confidence", min_threshold=0.75)
+    all_rules = association_rules(freq_items, metric="support", min_threshold=0.0)
+    expect = all_rules[all_rules["confidence"] >= 0.75]
+
+    assert res_df.shape == expect.shape
+    assert res_df.reset_index(drop=True).equals(expect.reset_index(drop=True))
+
+
+def test_compact_itemsets():
+    freq_items = apriori(df, min_support=0.6, use_colnames=True, compact=True)
+    assert isinstance(freq_items, CompactItemsets)
+    res_df = association_rules(freq_items)
+    expect = association_rules(df_freq_items_with_colnames)
+    assert res_df.equals(expect)
+
+    with pytest.raises(ValueError):
+        association_rules(CompactItemsets.from_frame(df_freq_items.iloc[:0]))
@@ -0,0 +1,128 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from test_fpbase import (
+    FPTestEdgeCases,
+    FPTestErrors,
+    FPTestEx1All,
+    FPTestEx2All,
+    FPTestEx3All,
+    compare_dataframes,
+)
+
+from mlxtend.frequent_patterns import eclat, fpgrowth
+from mlxtend.preprocessing import TransactionEncoder
+from mlxtend.utils import assert_raises
+
+
+class TestEdgeCases(unittest.TestCase, FPTestEdgeCases):
+    def setUp(self):
+        FPTestEdgeCases.setUp(self, eclat)
+
+
+class TestErrors(unittest.TestCase, FPTestErrors):
+    def setUp(self):
+        FPTestErrors.setUp(self, eclat)
+
+
+class TestEx1(unittest.TestCase, FPTestEx1All):
+    def setUp(self):
+        FPTestEx1All.setUp(self, eclat)
+
+
+class TestEx1BoolInput(unittest.TestCase, FPTestEx1All):
+    def setUp(self):
+        one_ary = np.array(
+            [
+                [False, False, False, True, False, True, True, True, True, False, True],
+                [False, False, True, True, False, True, False, True, True, False, True],
+                [
+                    True,
+                    False,
+                    False,
+                    True,
+                    False,
+                    True,
+                    True,
+                    False,
+                    False,
+                    False,
+                    False,
+                ],
+                [
+                    False,
+                    True,
+                    False,
+                    False,
+                    False,
+                    True,
+                    True,
+                    False,
+                    False,
+                    True,
+                    True,
+                ],
+                [
+                    False,
+                    True,
+                    False,
+                    True,
+                    True,
+                    True,
+                    False,
+                    False,
+                    True,
+                    False,
+                    False,
+                ],
+            ]
+        )
+        FPTestEx1All.setUp(self, eclat, one_ary=one_ary)
+
+
+class TestEx2(unittest.TestCase, FPTestEx2All):
+    def setUp(self):
+        FPTestEx2All.setUp(self, eclat)
+
+
+class TestEx3(unittest.TestCase, FPTestEx3All):
+    def setUp(self):
+        FPTestEx3All.setUp(self, eclat)
+
+
+class TestFpgrowthEquivalence(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(rng.rand(200, 10) < 0.5)
+
+    def test_dense(self):
+        res = eclat(self.df, min_support=0.05)
+        expect = fpgrowth(self.df, min_support=0.05)
+        assert res.shape == expect.shape
+        compare_dataframes(res, expect)
+
+    def test_max_len(self):
+        res = eclat(self.df, min_support=0.05, max_len=2)
+        expect = fpgrowth(self.df, min_support=0.05, max_len=2)
+        assert res.shape == expect.shape
+        compare_dataframes(res, expect)
+
+    def test_packed(self):
+        # more than one block of transactions is unpacked
+        rng = np.random.RandomState(0)
+        df = pd.DataFrame(rng.rand(8300, 70) < 0.3)
+        te = TransactionEncoder().fit([range(70)])
+        packed = te.transform([np.flatnonzero(row) for row in df.values], packed=True)
+        res = eclat(packed, min_support=0.2)
+        expect = eclat(df, min_support=0.2)
+        assert res.shape == expect.shape
+        compare_dataframes(res, expect)
+
+        assert_raises(
+            ValueError,
+            "Bit-packed transactions must be of type uint64, as returned by "
+            "`TransactionEncoder.transform(X, packed=True)`. Got bool.",
+            eclat,
+            df.values,
+        )
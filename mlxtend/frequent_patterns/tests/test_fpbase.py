@@ -15,6 +15,7 @@ from packaging.version import Version
 from pandas import __version__ as pandas_version
 from scipy.sparse import csr_matrix
 
+from mlxtend.frequent_patterns import MiningStats
 from mlxtend.preprocessing import TransactionEncoder
 from mlxtend.utils import assert_raises
 
@@ -328,6 +329,87 @@ class FPTestEx3All(FPTestEx3):
         )
 
 
+class FPTestSampleWeight(object):
+    """
+    Base class for testing that weighted transactions give the same
+    result as repeating each transaction according to its weight.
+    """
+
+    def setUp(self, fpalgo):
+        self.fpalgo = fpalgo
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(rng.rand(30, 6) < np.linspace(0.3, 0.8, 6))
+        self.weights = rng.randint(0, 4, size=30)
+        self.repeated = self.df.loc[self.df.index.repeat(self.weights)]
+
+    def test_repeated_rows(self):
+        expect = self.fpalgo(self.repeated, min_support=0.2)
+        sdf = self.df.astype(pd.SparseDtype("bool", False))
+        for df in (self.df, sdf):
+            res_df = self.fpalgo(df, min_support=0.2, sample_weight=self.weights)
+            assert res_df.shape == expect.shape
+            compare_dataframes(res_df, expect)
+
+    def test_invalid_weights(self):
+        assert_raises(
+            ValueError,
+            "`sample_weight` must contain one weight per transaction. "
+            "Got 29 weights for 30 transactions.",
+            self.fpalgo,
+            self.df,
+            sample_weight=self.weights[1:],
+        )
+        assert_raises(
+            ValueError,
+            "`sample_weight` must be non-negative and finite.",
+            self.fpalgo,
+            self.df,
+            sample_weight=-self.weights,
+        )
+
+
+class FPTestCallback(object):
+    """
+    Base class for testing the events that the FP-tree based
+    algorithms pass to the `callback`.
+    """
+
+    def setUp(self, fpalgo):
+        self.fpalgo = fpalgo
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(
+            rng.rand(50, 6) < np.linspace(0.3, 0.8, 6), columns=list("abcdef")
+        )
+
+    def test_events(self):
+        stats = MiningStats()
+        res_df = self.fpalgo(
+            self.df, min_support=0.2, use_colnames=True, callback=stats
+        )
+        expect = self.fpalgo(self.df, min_support=0.2, use_colnames=True)
+        compare_dataframes(res_df, expect)
+
+        events = stats.to_frame()
+        assert list(events["event"]) == ["tree"] + ["conditional_tree"] * (
+            len(events) - 1
+        )
+        assert events["n_nodes"][0] > 0
+        assert events["n_items"][0] == 6
+        assert all(len(items) == 0 for items in events["cond_items"][:1])
+        assert all(set(items) <= set("abcdef") for items in events["cond_items"])
+        assert (events["time"] >= 0).all()
+        assert stats.total_time_ == events["time"].max()
+
+    def test_invalid_callback(self):
+        assert_raises(
+            ValueError,
+            "`callback` must be callable. Got 1.",
+            self.fpalgo,
+            self.df,
+            callback=1,
+        )
+
+
 def compare_dataframes(df1, df2):
     itemsets1 = [sorted(list(i)) for i in df1["itemsets"]]
     itemsets2 = [sorted(list(i)) for i in df2["itemsets"]]
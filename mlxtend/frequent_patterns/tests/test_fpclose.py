@@ -0,0 +1,134 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from test_fpbase import (
+    FPTestEdgeCases,
+    FPTestErrors,
+    FPTestEx1,
+    FPTestEx3All,
+    compare_dataframes,
+)
+
+from mlxtend.frequent_patterns import (
+    association_rules,
+    expand_closed,
+    fpclose,
+    fpgrowth,
+)
+
+
+class TestEdgeCases(unittest.TestCase, FPTestEdgeCases):
+    def setUp(self):
+        FPTestEdgeCases.setUp(self, fpclose)
+
+
+class TestErrors(unittest.TestCase, FPTestErrors):
+    def setUp(self):
+        FPTestErrors.setUp(self, fpclose)
+
+
+class TestEx1(unittest.TestCase, FPTestEx1):
+    def setUp(self):
+        FPTestEx1.setUp(self, fpclose)
+
+    def test_default(self):
+        res_df = fpclose(self.df)
+        expect = pd.DataFrame(
+            [
+                [1.0, frozenset([5])],
+                [0.8, frozenset([3, 5])],
+                [0.6, frozenset([5, 6])],
+                [0.6, frozenset([5, 10])],
+                [0.6, frozenset([3, 5, 8])],
+            ],
+            columns=["support", "itemsets"],
+        )
+
+        assert res_df.shape == expect.shape
+        compare_dataframes(res_df, expect)
+
+    def test_max_len(self):
+        res_df = fpclose(self.df, max_len=2)
+        max_len = np.max(res_df["itemsets"].apply(len))
+        assert max_len == 2
+        assert len(res_df) == 4
+
+
+class TestEx3(unittest.TestCase, FPTestEx3All):
+    def setUp(self):
+        FPTestEx3All.setUp(self, fpclose)
+
+
+class TestEx4(unittest.TestCase):
+    def test_output(self):
+        df = pd.DataFrame([[1, 1, 0], [1, 0, 1], [0, 0, 1]], columns=["a", "b", "c"])
+        res_df = fpclose(df, min_support=0.01, use_colnames=True)
+        expect = pd.DataFrame(
+            [
+                [0.6666666666666666, frozenset(["a"])],
+                [0.6666666666666666, frozenset(["c"])],
+                [0.3333333333333333, frozenset(["a", "b"])],
+                [0.3333333333333333, frozenset(["a", "c"])],
+            ],
+            columns=["support", "itemsets"],
+        )
+
+        assert res_df.shape == expect.shape
+        compare_dataframes(res_df, expect)
+
+
+class TestFpgrowthEquivalence(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(rng.rand(100, 10) < np.linspace(0.2, 0.9, 10))
+
+    def test_supports(self):
+        res_df = fpclose(self.df, min_support=0.05)
+        closed = dict(zip(res_df["itemsets"], res_df["support"]))
+        frequent = fpgrowth(self.df, min_support=0.05)
+        assert len(closed) < len(frequent)
+        # the support of every frequent itemset is the highest
+        # support of the closed itemsets containing it
+        for itemset, support in zip(frequent["itemsets"], frequent["support"]):
+            derived = max(sup for iset, sup in closed.items() if itemset <= iset)
+            assert derived == support
+            if itemset in closed:
+                assert closed[itemset] == support
+
+    def test_parallel(self):
+        res_df = fpclose(self.df, min_support=0.05, n_jobs=2)
+        expect = fpclose(self.df, min_support=0.05)
+        assert res_df.shape == expect.shape
+        compare_dataframes(res_df, expect)
+
+    def test_expand_closed(self):
+        res_df = expand_closed(fpclose(self.df, min_support=0.05))
+        expect = fpgrowth(self.df, min_support=0.05)
+        assert res_df.shape == expect.shape
+        compare_dataframes(res_df, expect)
+        assert (np.diff(res_df["support"].values) <= 0).all()
+
+        res_df = expand_closed(fpclose(self.df, min_support=0.05), max_len=2)
+        expect = fpgrowth(self.df, min_support=0.05, max_len=2)
+        assert res_df.shape == expect.shape
+        compare_dataframes(res_df, expect)
+
+        res = expand_closed(fpclose(self.df, min_support=0.05, compact=True))
+        expect = fpgrowth(self.df, min_support=0.05)
+        compare_dataframes(res.to_frame(), expect)
+
+    def test_association_rules(self):
+        def sort_rules(rules):
+            keys = rules["antecedents"].apply(sorted).astype(str)
+            keys += rules["consequents"].apply(sorted).astype(str)
+            return rules.assign(key=keys).sort_values("key").reset_index(drop=True)
+
+        for metric, min_threshold in (("confidence", 0.6), ("lift", 1.0)):
+            closed = fpclose(self.df, min_support=0.1)
+            res_df = association_rules(expand_closed(closed), metric, min_threshold)
+            expect = association_rules(
+                fpgrowth(self.df, min_support=0.1), metric, min_threshold
+            )
+            assert len(res_df) > 0
+            pd.testing.assert_frame_equal(sort_rules(res_df), sort_rules(expect))
@@ -1,15 +1,27 @@
 import unittest
 
 import numpy as np
+import pandas as pd
+from numpy.testing import assert_array_equal
 from test_fpbase import (
+    FPTestCallback,
     FPTestEdgeCases,
     FPTestErrors,
     FPTestEx1All,
     FPTestEx2All,
     FPTestEx3All,
+    FPTestSampleWeight,
 )
 
-from mlxtend.frequent_patterns import fpgrowth
+from mlxtend.frequent_patterns import CompactItemsets, MiningStats, fpgrowth
+from mlxtend.frequent_patterns.fpcommon import (
+    deduplicate_transactions,
+    setup_fptree,
+)
+
+
+def fpgrowth_wrapper_parallel(*args, **kwargs):
+    return fpgrowth(*args, **kwargs, n_jobs=2)
 
 
 class TestEdgeCases(unittest.TestCase, FPTestEdgeCases):
@@ -27,6 +39,11 @@ class TestEx1(unittest.TestCase, FPTestEx1All):
         FPTestEx1All.setUp(self, fpgrowth)
 
 
+class TestEx1Parallel(unittest.TestCase, FPTestEx1All):
+    def setUp(self):
+        FPTestEx1All.setUp(self, fpgrowth_wrapper_parallel)
+
+
 class TestEx1BoolInput(unittest.TestCase, FPTestEx1All):
     def setUp(self):
         one_ary = np.array(
@@ -85,3 +102,137 @@ class TestEx2(unittest.TestCase, FPTestEx2All):
 class TestEx3(unittest.TestCase, FPTestEx3All):
     def setUp(self):
         FPTestEx3All.setUp(self, fpgrowth)
+
+
+class TestFPTree(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(
+            [[1, 1, 0], [1, 1, 0], [1, 0, 1], [0, 1, 0], [0, 0, 0]],
+            columns=["a", "b", "c"],
+        )
+
+    def test_structure(self):
+        tree, rank = setup_fptree(self.df, min_support=0.2)
+        assert tree.count[0] == 5
+        assert not tree.is_path()
+        # c is the least frequent item
+        assert rank[2] == 0
+        assert_array_equal(sorted(tree.count[tree.nodes[0]]), [1, 2])
+        assert tree.count[tree.nodes[1]].sum() == 3
+        assert tree.count[tree.nodes[2]].sum() == 1
+
+        # the children of the root are linked as siblings
+        children = []
+        child = tree.first_child[0]
+        while child != -1:
+            children.append(child)
+            child = tree.next_sibling[child]
+        assert_array_equal(tree.parent[children], [0, 0])
+        assert tree.count[children].sum() == 4
+
+    def test_conditional_tree(self):
+        tree, _ = setup_fptree(self.df, min_support=0.2)
+        cond_tree = tree.conditional_tree(2, minsup=1)
+        assert cond_tree.cond_items == [2]
+        assert cond_tree.is_path()
+        assert cond_tree.count[0] == 1
+        assert list(cond_tree.nodes) == [0]
+
+    def test_deduplicate_transactions(self):
+        rows = np.array([0, 0, 1, 1, 2, 3, 3, 4])
+        cols = np.array([0, 1, 1, 0, 2, 1, 0, 1])
+        counts = np.array([1, 2, 1, 3, 1, 4])
+        rows, cols, counts = deduplicate_transactions(rows, cols, counts)
+        assert_array_equal(rows, [0, 0, 1, 2])
+        assert_array_equal(cols, [0, 1, 2, 1])
+        # the empty transaction is kept
+        assert_array_equal(counts, [6, 1, 1, 4])
+
+    def test_duplicates(self):
+        df = pd.concat([self.df] * 3, ignore_index=True)
+        tree, _ = setup_fptree(df, min_support=0.2)
+        expect, _ = setup_fptree(self.df, min_support=0.2)
+        assert_array_equal(tree.count, 3 * expect.count)
+        assert_array_equal(tree.item, expect.item)
+        assert_array_equal(tree.parent, expect.parent)
+
+
+class TestTopK(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(rng.rand(50, 8) < np.linspace(0.2, 0.8, 8))
+        self.all = fpgrowth(self.df, min_support=0.01)
+
+    def expect(self, k):
+        supports = np.sort(self.all["support"].values)[::-1]
+        return set(self.all["itemsets"][self.all["support"] >= supports[k - 1]])
+
+    def test_top_k(self):
+        for k in (1, 5, 20, 100):
+            res_df = fpgrowth(self.df, top_k=k)
+            assert len(res_df) >= k
+            assert set(res_df["itemsets"]) == self.expect(k)
+
+    def test_parallel(self):
+        res_df = fpgrowth(self.df, top_k=20, n_jobs=2)
+        assert set(res_df["itemsets"]) == self.expect(20)
+
+    def test_ignores_min_support(self):
+        res_df = fpgrowth(self.df, min_support=0.9, top_k=5)
+        assert set(res_df["itemsets"]) == self.expect(5)
+
+    def test_invalid(self):
+        with self.assertRaisesRegex(ValueError, "`top_k` must be a positive"):
+            fpgrowth(self.df, top_k=0)
+
+
+class TestCompact(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(
+            [[1, 1, 0], [1, 1, 0], [1, 0, 1], [0, 1, 0]], columns=["a", "b", "c"]
+        )
+
+    def test_to_frame(self):
+        res = fpgrowth(self.df, min_support=0.25, use_colnames=True, compact=True)
+        expect = fpgrowth(self.df, min_support=0.25, use_colnames=True)
+        assert isinstance(res, CompactItemsets)
+        assert len(res) == len(expect)
+        assert res.to_frame().equals(expect)
+
+    def test_layout(self):
+        res = fpgrowth(self.df, min_support=0.5, compact=True)
+        # ids are sorted within each itemset
+        assert_array_equal(res.lengths, [1, 1, 2])
+        assert_array_equal(sorted(res.item_ids[:2]), [0, 1])
+        assert_array_equal(res.item_ids[res.offsets[2] :], [0, 1])
+        assert_array_equal(res.support, [0.75, 0.75, 0.5])
+
+    def test_from_frame(self):
+        expect = fpgrowth(self.df, min_support=0.25, use_colnames=True)
+        res = CompactItemsets.from_frame(expect)
+        assert res.to_frame().equals(expect)
+
+
+class TestSampleWeight(unittest.TestCase, FPTestSampleWeight):
+    def setUp(self):
+        FPTestSampleWeight.setUp(self, fpgrowth)
+
+
+class TestCallback(unittest.TestCase, FPTestCallback):
+    def setUp(self):
+        FPTestCallback.setUp(self, fpgrowth)
+
+    def test_itemset_counts(self):
+        stats = MiningStats()
+        res_df = fpgrowth(self.df, min_support=0.2, callback=stats)
+        assert stats.to_frame()["n_itemsets"].sum() == len(res_df)
+
+    def test_parallel(self):
+        def summary(stats):
+            events = stats.to_frame()
+            return sorted(zip(events["cond_items"].map(tuple), events["n_nodes"]))
+
+        stats, parallel_stats = MiningStats(), MiningStats()
+        fpgrowth(self.df, min_support=0.2, callback=stats)
+        fpgrowth(self.df, min_support=0.2, callback=parallel_stats, n_jobs=2)
+        assert summary(parallel_stats) == summary(stats)
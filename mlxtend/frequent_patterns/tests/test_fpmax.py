@@ -3,11 +3,13 @@ import unittest
 import numpy as np
 import pandas as pd
 from test_fpbase import (
+    FPTestCallback,
     FPTestEdgeCases,
     FPTestErrors,
     FPTestEx1,
     FPTestEx2,
     FPTestEx3All,
+    FPTestSampleWeight,
     compare_dataframes,
 )
 
@@ -143,3 +145,26 @@ class TestEx4(unittest.TestCase):
         )
 
         compare_dataframes(res_df, expect)
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(rng.rand(100, 10) < 0.5)
+
+    def test_matches_sequential(self):
+        for max_len in (None, 2, 3, 4):
+            res_df = fpmax(self.df, min_support=0.05, max_len=max_len, n_jobs=2)
+            expect = fpmax(self.df, min_support=0.05, max_len=max_len)
+            assert res_df.shape == expect.shape
+            compare_dataframes(res_df, expect)
+
+
+class TestSampleWeight(unittest.TestCase, FPTestSampleWeight):
+    def setUp(self):
+        FPTestSampleWeight.setUp(self, fpmax)
+
+
+class TestCallback(unittest.TestCase, FPTestCallback):
+    def setUp(self):
+        FPTestCallback.setUp(self, fpmax)
@@ -0,0 +1,73 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# License: BSD 3 clause
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from test_fpbase import compare_dataframes
+
+from mlxtend.frequent_patterns import IncrementalItemsetMiner, apriori
+from mlxtend.utils import assert_raises
+
+
+class TestIncremental(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        probs = np.linspace(0.1, 0.7, 8)
+        self.df = pd.DataFrame(
+            rng.rand(120, 8) < probs, columns=["c%d" % i for i in range(8)]
+        )
+        self.batches = [self.df.iloc[i : i + 30] for i in range(0, 120, 30)]
+
+    def test_partial_fit(self):
+        miner = IncrementalItemsetMiner(min_support=0.2, use_colnames=True)
+        miner.fit(self.batches[0])
+        for i, batch in enumerate(self.batches[1:]):
+            miner.partial_fit(batch)
+            df = self.df.iloc[: 30 * (i + 2)]
+            expect = apriori(df, min_support=0.2, use_colnames=True)
+            assert miner.frequent_itemsets_.shape == expect.shape
+            compare_dataframes(miner.frequent_itemsets_, expect)
+        assert miner.n_transactions_ == 120
+        assert miner.n_batches_ == 4
+
+    def test_expire(self):
+        miner = IncrementalItemsetMiner(min_support=0.2, max_len=2)
+        for batch in self.batches:
+            miner.partial_fit(batch)
+        miner.expire(2)
+        expect = apriori(self.df.iloc[60:], min_support=0.2, max_len=2)
+        compare_dataframes(miner.frequent_itemsets_, expect)
+        assert miner.n_transactions_ == 60
+
+    def test_no_rescan(self):
+        miner = IncrementalItemsetMiner(min_support=0.2)
+        miner.fit(self.df)
+        # the relative supports do not change
+        miner.partial_fit(self.df)
+        assert miner.n_rescans_ == 0
+
+    def test_sparse(self):
+        sdf = self.df.astype(pd.SparseDtype("bool", False))
+        miner = IncrementalItemsetMiner(min_support=0.2)
+        miner.fit(sdf.iloc[:60]).partial_fit(sdf.iloc[60:])
+        compare_dataframes(miner.frequent_itemsets_, apriori(self.df, min_support=0.2))
+
+    def test_errors(self):
+        miner = IncrementalItemsetMiner(min_support=0.2).fit(self.batches[0])
+        assert_raises(
+            ValueError,
+            "The columns of the new transactions do not match "
+            "the columns of the transactions passed to `fit`.",
+            miner.partial_fit,
+            self.batches[1].iloc[:, ::-1],
+        )
+        assert_raises(
+            ValueError,
+            "Cannot expire 2 batches; only 1 batches are stored.",
+            miner.expire,
+            2,
+        )
@@ -0,0 +1,123 @@
+# Sebastian Raschka 2014-2020
+# mlxtend Machine Learning Library Extensions
+#
+# License: BSD 3 clause
+
+import itertools
+import math
+import unittest
+
+import numpy as np
+
+from mlxtend.frequent_patterns import prefixspan
+from mlxtend.utils import assert_raises
+
+
+def contains(sequence, pattern):
+    pos = 0
+    for element in pattern:
+        while pos < len(sequence) and not element <= sequence[pos]:
+            pos += 1
+        if pos == len(sequence):
+            return False
+        pos += 1
+    return True
+
+
+def brute_force(sequences, min_support, items, max_len):
+    elements = [
+        frozenset(c)
+        for r in range(1, max_len + 1)
+        for c in itertools.combinations(items, r)
+    ]
+    sequences = [
+        [frozenset(e) if isinstance(e, list) else frozenset([e]) for e in seq]
+        for seq in sequences
+    ]
+    minsup = math.ceil(min_support * len(sequences))
+    result = {}
+    patterns = [((e,), len(e)) for e in elements]
+    while patterns:
+        pattern, length = patterns.pop()
+        count = sum(contains(seq, pattern) for seq in sequences)
+        if count >= minsup:
+            result[pattern] = count / float(len(sequences))
+            patterns.extend(
+                (pattern + (e,), length + len(e))
+                for e in elements
+                if length + len(e) <= max_len
+            )
+    return result
+
+
+class TestPrefixSpan(unittest.TestCase):
+    def setUp(self):
+        self.sequences = [
+            [["Milk", "Bread"], "Beer", ["Milk", "Diapers"]],
+            ["Bread", ["Beer", "Diapers"]],
+            [["Milk", "Bread"], "Diapers", "Beer"],
+        ]
+
+    def test_example(self):
+        res_df = prefixspan(self.sequences, min_support=0.6)
+        assert list(res_df.columns) == ["support", "sequence"]
+        result = dict(zip(res_df["sequence"], res_df["support"]))
+        assert len(result) == len(res_df) == 11
+        assert result[(frozenset(["Bread"]), frozenset(["Diapers"]))] == 1.0
+        np.testing.assert_almost_equal(
+            result[(frozenset(["Milk", "Bread"]), frozenset(["Beer"]))], 2.0 / 3
+        )
+        # 'Beer' and 'Diapers' occur together only once
+        assert (frozenset(["Beer", "Diapers"]),) not in result
+
+    def test_brute_force(self):
+        rng = np.random.RandomState(0)
+        items = list("abcd")
+        for _ in range(10):
+            sequences = [
+                [
+                    (
+                        list(rng.choice(items, rng.randint(1, 4), replace=False))
+                        if rng.rand() < 0.5
+                        else items[rng.randint(4)]
+                    )
+                    for _ in range(rng.randint(0, 6))
+                ]
+                for _ in range(rng.randint(1, 12))
+            ]
+            res_df = prefixspan(sequences, min_support=0.3, max_len=4)
+            expect = brute_force(sequences, 0.3, items, 4)
+            assert dict(zip(res_df["sequence"], res_df["support"])) == expect
+
+    def test_max_len(self):
+        res_df = prefixspan(self.sequences, min_support=0.6, max_len=1)
+        assert len(res_df) == 4
+        assert all(len(seq) == 1 for seq in res_df["sequence"])
+
+    def test_parallel(self):
+        res_df = prefixspan(self.sequences, min_support=0.3, n_jobs=2)
+        expect = prefixspan(self.sequences, min_support=0.3)
+        assert list(res_df["sequence"]) == list(expect["sequence"])
+        np.testing.assert_array_equal(res_df["support"], expect["support"])
+
+    def test_no_patterns(self):
+        res_df = prefixspan([], min_support=0.5)
+        assert list(res_df.columns) == ["support", "sequence"]
+        assert len(res_df) == 0
+
+    def test_errors(self):
+        assert_raises(
+            ValueError,
+            "`min_support` must be a positive "
+            "number within the interval `(0, 1]`. Got 0.0.",
+            prefixspan,
+            self.sequences,
+            0.0,
+        )
+        assert_raises(
+            ValueError,
+            "`max_len` must be a positive integer. Got 0.",
+            prefixspan,
+            self.sequences,
+            max_len=0,
+        )
@@ -69,6 +69,14 @@ def test_transform_sparse():
     np.testing.assert_array_equal(expect, trans.todense())
 
 
+def test_transform_sparse_subset_shape():
+    oht = TransactionEncoder()
+    oht.fit(dataset)
+    trans = oht.transform(dataset[:1], sparse=True)
+    assert trans.shape == (1, len(oht.columns_))
+    np.testing.assert_array_equal(expect[:1], trans.todense())
+
+
 def test_fit_transform():
     oht = TransactionEncoder()
     trans = oht.fit_transform(dataset)
@@ -94,3 +102,81 @@ def test_cloning():
 
     trans = oht2.fit_transform(dataset)
     np.testing.assert_array_equal(expect, trans)
+
+
+def test_partial_fit():
+    oht = TransactionEncoder()
+    first = oht.partial_fit(dataset[:3]).transform(dataset[:3])
+    assert oht.columns_ == ["Apple", "Beer", "Chicken", "Rice"]
+    # new items are appended, so the earlier columns stay put
+    oht.partial_fit(dataset[3:])
+    assert oht.columns_ == ["Apple", "Beer", "Chicken", "Rice", "Bananas", "Milk"]
+    trans = oht.transform(dataset)
+    np.testing.assert_array_equal(first, trans[:3, :4])
+    np.testing.assert_array_equal(expect[:, [0, 2, 3, 5, 1, 4]], trans)
+
+    # fit discards the columns of previous batches
+    oht.fit(dataset[:1])
+    assert oht.columns_ == ["Apple", "Beer", "Chicken", "Rice"]
+
+
+def test_transform_chunksize():
+    oht = TransactionEncoder().fit(dataset)
+    for sparse in (False, True):
+        trans = oht.transform(iter(dataset), sparse=sparse, chunksize=3)
+        if sparse:
+            assert isinstance(trans, csr_matrix)
+            trans = trans.toarray()
+        np.testing.assert_array_equal(expect, trans)
+    assert oht.transform(iter([]), chunksize=3).shape == (0, 6)
+
+    msg = "`chunksize` must be a positive integer. Got 0."
+    assert_raises(ValueError, msg, oht.transform, dataset, False, 0)
+
+
+def test_transform_sparse_duplicates():
+    oht = TransactionEncoder().fit(dataset)
+    trans = oht.transform([["Rice", "Apple", "Rice"]], sparse=True)
+    np.testing.assert_array_equal(trans.indices, [0, 5])
+    np.testing.assert_array_equal(trans.toarray(), [[1, 0, 0, 0, 0, 1]])
+
+
+def test_transform_unknown_item():
+    oht = TransactionEncoder().fit(dataset)
+    assert_raises(KeyError, "'Bread'", oht.transform, [["Apple", "Bread"]])
+
+
+def test_transform_packed():
+    oht = TransactionEncoder().fit(dataset)
+    trans = oht.transform(dataset, packed=True)
+    assert trans.dtype == np.uint64
+    assert trans.shape == (8, 1)
+    # item j is stored in bit j
+    np.testing.assert_array_equal(trans[:, 0], expect @ (2 ** np.arange(6)))
+    unpacked = np.unpackbits(
+        trans.astype("<u8").view(np.uint8), axis=1, bitorder="little"
+    )
+    np.testing.assert_array_equal(expect, unpacked[:, :6])
+
+    # transactions and chunks without any items
+    np.testing.assert_array_equal(
+        oht.transform([[], []], packed=True), np.zeros((2, 1), dtype=np.uint64)
+    )
+    assert oht.transform([], packed=True).shape == (0, 1)
+    trans = oht.transform([["Bananas"], [], []], chunksize=1, packed=True)
+    np.testing.assert_array_equal(trans[:, 0], [2, 0, 0])
+
+    msg = "`sparse` and `packed` cannot both be True."
+    assert_raises(ValueError, msg, oht.transform, dataset, True, None, True)
+
+
+def test_transform_n_jobs():
+    oht = TransactionEncoder(n_jobs=2).fit(dataset)
+    np.testing.assert_array_equal(expect, oht.transform(dataset))
+    np.testing.assert_array_equal(
+        expect, oht.transform(dataset, sparse=True, chunksize=3).toarray()
+    )
+    np.testing.assert_array_equal(
+        TransactionEncoder().fit(dataset).transform(dataset, packed=True),
+        oht.transform(dataset, packed=True),
+    )
@@ -4,8 +4,12 @@
 #
 # License: BSD 3 clause
 
+import math
+from itertools import chain, islice
+
 import numpy as np
-from scipy.sparse import csr_matrix
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy.sparse import csr_matrix, vstack
 from sklearn.base import BaseEstimator, TransformerMixin
 
 
@@ -14,7 +18,9 @@ class TransactionEncoder(BaseEstimator, TransformerMixin):
 
     Parameters
     ------------
-    None
+    n_jobs : int (default: 1)
+      The number of CPUs to use for encoding partitions of the
+      transactions in `transform` in parallel. -1 means 'all CPUs'.
 
     Attributes
     ------------
@@ -28,8 +34,8 @@ class TransactionEncoder(BaseEstimator, TransformerMixin):
 
     """
 
-    def __init__(self):
-        return None
+    def __init__(self, n_jobs=1):
+        self.n_jobs = n_jobs
 
     def fit(self, X):
         """Learn unique column names from transaction DataFrame
@@ -52,18 +58,42 @@ class TransactionEncoder(BaseEstimator, TransformerMixin):
            ['Apple', 'Bananas']]
 
         """
-        unique_items = set()
-        for transaction in X:
-            for item in transaction:
-                unique_items.add(item)
-        self.columns_ = sorted(unique_items)
-        columns_mapping = {}
-        for col_idx, item in enumerate(self.columns_):
-            columns_mapping[item] = col_idx
-        self.columns_mapping_ = columns_mapping
+        for attr in ("columns_", "columns_mapping_"):
+            if hasattr(self, attr):
+                delattr(self, attr)
+        return self.partial_fit(X)
+
+    def partial_fit(self, X):
+        """Add the unique column names of a batch of transactions
+
+        The items of a batch that are not yet columns are appended in
+        sorted order, so the columns of earlier batches keep their
+        indices and each batch can be transformed right after its
+        `partial_fit`. The arrays of earlier batches then lack the
+        columns of new items, which are all False. Unlike after `fit`,
+        `columns_` is only sorted within the items added by each batch.
+
+        Parameters
+        ------------
+        X : iterable of lists
+          The transactions of the batch, as for `fit`.
+
+        Returns
+        ------------
+        self : object
+
+        """
+        unique_items = set(chain.from_iterable(X))
+        if not hasattr(self, "columns_"):
+            self.columns_ = []
+            self.columns_mapping_ = {}
+        new_items = sorted(unique_items.difference(self.columns_mapping_))
+        for col_idx, item in enumerate(new_items, start=len(self.columns_)):
+            self.columns_mapping_[item] = col_idx
+        self.columns_ = self.columns_ + new_items
         return self
 
-    def transform(self, X, sparse=False):
+    def transform(self, X, sparse=False, chunksize=None, packed=False):
         """Transform transactions into a one-hot encoded NumPy array.
 
         Parameters
@@ -87,11 +117,32 @@ class TransactionEncoder(BaseEstimator, TransformerMixin):
           If True, transform will return Compressed Sparse Row matrix
           instead of the regular one.
 
+        chunksize: int (default=None)
+          If not None, `X` can be any iterable of transactions, e.g., a
+          generator, and is encoded `chunksize` transactions at a time.
+          The encoded chunks are stacked into one array. With `n_jobs`,
+          the chunks are encoded in parallel, and `X` is split into one
+          chunk per CPU if `chunksize` is None.
+
+        packed: bool (default=False)
+          If True, transform returns the transactions as bit vectors,
+          i.e., a uint64 array of shape [n_transactions, n_words], where
+          `n_words = ceil(n_unique_items / 64)` and item `j` is stored in
+          bit `j % 64` of word `j // 64`. This needs 1 bit per item
+          instead of 1 byte for the boolean array. The boolean array can
+          be recovered via `np.unpackbits(array.astype('<u8').view(np.uint8),
+          axis=1, bitorder='little')[:, :n_unique_items]`.
+          Only `apriori` with `engine='bitset'` and `eclat` accept the
+          packed array as input; the other functions in
+          `mlxtend.frequent_patterns` need the DataFrame of the boolean
+          array.
+
         Returns
         ------------
         array : NumPy array [n_transactions, n_unique_items]
            if sparse=False (default).
-           Compressed Sparse Row matrix otherwise
+           Compressed Sparse Row matrix if sparse=True, and
+           bit-packed NumPy array if packed=True
            The one-hot encoded boolean array of the input transactions,
            where the columns represent the unique items found in the input
            array in alphabetic order. Exact representation depends
@@ -109,25 +160,38 @@ class TransactionEncoder(BaseEstimator, TransformerMixin):
           The corresponding column labels are available as self.columns_, e.g.,
           ['Apple', 'Bananas', 'Beer', 'Chicken', 'Milk', 'Rice']
         """
-        if sparse:
-            indptr = [0]
-            indices = []
-            for transaction in X:
-                # set is necessary because conversion to SparseDataFrame
-                # will fail if there are duplicate items
-                for item in set(transaction):
-                    col_idx = self.columns_mapping_[item]
-                    indices.append(col_idx)
-                indptr.append(len(indices))
-            non_sparse_values = [True] * len(indices)
-            array = csr_matrix((non_sparse_values, indices, indptr), dtype=bool)
+        if sparse and packed:
+            raise ValueError("`sparse` and `packed` cannot both be True.")
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(
+                "`chunksize` must be a positive integer. Got %s." % chunksize
+            )
+        output = "sparse" if sparse else "packed" if packed else "dense"
+        n_cols = len(self.columns_)
+        n_jobs = effective_n_jobs(self.n_jobs)
+        if chunksize is None and n_jobs == 1:
+            return _encode(X, self.columns_mapping_, n_cols, output)
+
+        if chunksize is None:
+            X = list(X)
+            chunksize = max(int(math.ceil(len(X) / float(n_jobs))), 1)
+        transactions = iter(X)
+        chunks = iter(lambda: list(islice(transactions, chunksize)), [])
+        if n_jobs == 1:
+            arrays = [
+                _encode(chunk, self.columns_mapping_, n_cols, output)
+                for chunk in chunks
+            ]
         else:
-            array = np.zeros((len(X), len(self.columns_)), dtype=bool)
-            for row_idx, transaction in enumerate(X):
-                for item in transaction:
-                    col_idx = self.columns_mapping_[item]
-                    array[row_idx, col_idx] = True
-        return array
+            arrays = Parallel(n_jobs=n_jobs)(
+                delayed(_encode)(chunk, self.columns_mapping_, n_cols, output)
+                for chunk in chunks
+            )
+        if not arrays:
+            return _encode([], self.columns_mapping_, n_cols, output)
+        if sparse:
+            return vstack(arrays, format="csr")
+        return np.concatenate(arrays)
 
     def inverse_transform(self, array):
         """Transforms an encoded NumPy array back into transactions.
@@ -181,3 +245,45 @@ class TransactionEncoder(BaseEstimator, TransformerMixin):
     def fit_transform(self, X, sparse=False):
         """Fit a TransactionEncoder encoder and transform a dataset."""
         return self.fit(X).transform(X, sparse=sparse)
+
+
+def _encode(X, columns_mapping, n_cols, output):
+    """Encodes transactions as a 'dense', 'sparse' or 'packed' array"""
+    # item codes of all transactions at once, and the offsets of the
+    # transactions in the codes, i.e., the CSR layout
+    if not isinstance(X, (list, tuple)):
+        X = list(X)
+    n_rows = len(X)
+    lengths = np.fromiter(map(len, X), dtype=np.int64, count=n_rows)
+    codes = np.fromiter(
+        map(columns_mapping.__getitem__, chain.from_iterable(X)),
+        dtype=np.int64,
+        count=int(lengths.sum()),
+    )
+    if output == "sparse":
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        array = csr_matrix(
+            (np.ones(len(codes), dtype=bool), codes, indptr),
+            shape=(n_rows, n_cols),
+            dtype=bool,
+        )
+        # duplicate items of a transaction would break the
+        # conversion into a sparse DataFrame
+        array.sum_duplicates()
+    elif output == "packed":
+        # OR the bits of the items stored in the same word
+        n_words = (n_cols + 63) // 64
+        words = np.repeat(np.arange(n_rows) * n_words, lengths) + (codes >> 6)
+        bits = np.left_shift(np.uint64(1), (codes & 63).astype(np.uint64))
+        array = np.zeros(n_rows * n_words, dtype=np.uint64)
+        if len(words):
+            order = np.argsort(words, kind="stable")
+            words, bits = words[order], bits[order]
+            starts = np.flatnonzero(np.append(True, words[1:] != words[:-1]))
+            array[words[starts]] = np.bitwise_or.reduceat(bits, starts)
+        array = array.reshape(n_rows, n_words)
+    else:
+        array = np.zeros((n_rows, n_cols), dtype=bool)
+        array[np.repeat(np.arange(n_rows), lengths), codes] = True
+    return array
@@ -26,7 +26,7 @@ setup(
     author="Sebastian Raschka",
     author_email="mail@sebastianraschka.com",
     url="https://github.com/rasbt/mlxtend",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     package_data={
         "": ["LICENSE-BSD3.txt", "LICENSE-CC-BY.txt", "README.md", "requirements.txt"]
     },